@@ -0,0 +1,227 @@
+import hashlib
+import json
+import os
+import sys
+
+ASSET_DIRECTORY = "../assets"  # Raíz de todos los recursos del juego
+MANIFEST_FILE = "manifest.json"  # Generado por build_manifest() dentro de ASSET_DIRECTORY
+# Recursos generados (atlas, variantes, hojas de iconos): se pueden volver a generar y, si faltan,
+# el juego usa las imágenes originales, así que no son imprescindibles para arrancar.
+GENERATED_DIRECTORIES = ("atlas/", "sprites/", "icons/")
+
+
+def hash_file(path, chunk_size=1024 * 1024):
+    """Calcula el hash SHA-256 del contenido de un archivo."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan_assets(asset_directory=ASSET_DIRECTORY, with_hashes=True):
+    """
+    Recorre todos los archivos de recursos.
+
+    :param asset_directory: Directorio raíz de los recursos.
+    :param with_hashes: Si se calcula el hash del contenido de cada archivo.
+    :return: Diccionario ruta relativa (con '/') -> [tamaño en bytes, hash o None].
+    """
+    files = {}
+    for root, _, filenames in os.walk(asset_directory):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            relative_path = os.path.relpath(path, asset_directory).replace(os.sep, '/')
+            if relative_path == MANIFEST_FILE:
+                continue
+            files[relative_path] = [os.path.getsize(path), hash_file(path) if with_hashes else None]
+    return files
+
+
+def build_manifest(asset_directory=ASSET_DIRECTORY):
+    """
+    Genera el manifiesto de recursos: cada archivo bajo assets/ con su tamaño y su hash.
+
+    Debe ejecutarse después de generar el resto de recursos (atlas, variantes...), ya que también se incluyen.
+
+    :param asset_directory: Directorio raíz de los recursos.
+    :return: El manifiesto generado.
+    """
+    manifest = {"files": scan_assets(asset_directory)}
+    with open(os.path.join(asset_directory, MANIFEST_FILE), 'w') as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+
+    print(f"Manifiesto generado: {len(manifest['files'])} archivos.")
+    return manifest
+
+
+class AssetManifest:
+    def __init__(self, asset_directory=ASSET_DIRECTORY):
+        """
+        Índice en memoria de todos los archivos de recursos.
+
+        Se carga una sola vez al arrancar, de modo que comprobar si un recurso existe es una
+        búsqueda en un diccionario en lugar de una llamada al sistema de archivos en cada fotograma.
+        Si no se ha generado el manifiesto, se recorre el directorio una vez (sin hashes).
+
+        :param asset_directory: Directorio raíz de los recursos.
+        """
+        self.asset_directory = asset_directory
+        self.root = os.path.abspath(asset_directory)
+        self.files = None  # ruta relativa -> [tamaño, hash]; se carga la primera vez que se consulta
+        self.generated = False  # Si los datos vienen de un manifiesto generado (con hashes)
+        self.relative_paths = {}  # ruta pedida -> ruta relativa (o None si está fuera de assets/)
+
+    def load(self):
+        """Carga el manifiesto generado o, si no existe, recorre el directorio de recursos."""
+        manifest_path = os.path.join(self.asset_directory, MANIFEST_FILE)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r') as file:
+                self.files = json.load(file)["files"]
+            self.generated = True
+        else:
+            self.files = scan_assets(self.asset_directory, with_hashes=False)
+            self.generated = False
+
+    def relative_path(self, path):
+        """Convierte una ruta (relativa al directorio de trabajo) en la clave del manifiesto."""
+        if path not in self.relative_paths:
+            relative_path = os.path.relpath(os.path.abspath(path), self.root).replace(os.sep, '/')
+            self.relative_paths[path] = None if relative_path.startswith('..') else relative_path
+        return self.relative_paths[path]
+
+    def exists(self, path):
+        """
+        Indica si existe un recurso sin tocar el disco.
+
+        :param path: Ruta del recurso, como la usa el juego (por ejemplo "../assets/img/...").
+        """
+        if self.files is None:
+            self.load()
+        relative_path = self.relative_path(path)
+        if relative_path is None:
+            return os.path.exists(path)  # Fuera de assets/: no está en el manifiesto
+        return relative_path in self.files
+
+    def list_files(self, directory, extension=None):
+        """
+        Devuelve las rutas (tal como las usa el juego) de los recursos que hay bajo un directorio.
+
+        :param directory: Directorio dentro de assets/, por ejemplo "../assets/img".
+        :param extension: Extensión por la que filtrar (por ejemplo ".png") o None para todas.
+        """
+        if self.files is None:
+            self.load()
+        prefix = self.relative_path(directory).rstrip('/') + '/'
+        return [os.path.join(self.asset_directory, relative_path) for relative_path in sorted(self.files)
+                if relative_path.startswith(prefix) and (extension is None or relative_path.endswith(extension))]
+
+    def verify(self, full=False, check_sizes=True):
+        """
+        Comprueba que la instalación coincide con el manifiesto.
+
+        :param full: Si también se compara el hash del contenido de cada archivo.
+        :param check_sizes: Si es False (al arrancar) solo se comprueba que cada archivo existe; si es
+                            True también su tamaño y que no haya archivos sin registrar.
+        :return: Tupla (archivos que faltan, otros problemas). Faltar un recurso original del manifiesto
+                 es una instalación dañada; los otros problemas (recursos generados que faltan, tamaño
+                 o contenido distintos, archivos sin registrar) indican que hay que volver a generar los
+                 recursos o el manifiesto. Ambas listas están vacías si la instalación está bien.
+        """
+        if self.files is None:
+            self.load()
+        if not self.generated:
+            return [], []  # Sin manifiesto generado no hay nada con lo que comparar
+
+        check_sizes = check_sizes or full
+        missing = []
+        problems = []
+        for relative_path, (size, file_hash) in list(self.files.items()):
+            path = os.path.join(self.asset_directory, relative_path)
+            if not check_sizes:
+                if not os.path.exists(path):
+                    self.add_missing(relative_path, missing, problems)
+                continue
+            try:
+                actual_size = os.path.getsize(path)
+            except OSError:
+                self.add_missing(relative_path, missing, problems)
+                continue
+            if actual_size != size:
+                problems.append(f"Tamaño incorrecto en {relative_path}: {actual_size} bytes (esperados {size})")
+            elif full and hash_file(path) != file_hash:
+                problems.append(f"Contenido alterado en {relative_path}")
+
+        if check_sizes:
+            for relative_path in sorted(set(scan_assets(self.asset_directory, with_hashes=False)) - set(self.files)):
+                problems.append(f"Archivo sin registrar en el manifiesto: {relative_path}")
+        return missing, problems
+
+    def add_missing(self, relative_path, missing, problems):
+        """
+        Anota un archivo que falta: los recursos originales son un error y los generados un aviso.
+
+        Los generados se quitan del manifiesto en memoria, para que exists() no los dé por buenos
+        y el juego use las imágenes originales en su lugar.
+        """
+        if relative_path.startswith(GENERATED_DIRECTORIES):
+            problems.append(f"Falta el recurso generado {relative_path} (se usará la imagen original)")
+            del self.files[relative_path]
+        else:
+            missing.append(relative_path)
+
+
+# Manifiesto compartido por todo el juego
+manifest = AssetManifest()
+
+
+def exists(path):
+    """Indica si existe un recurso consultando el manifiesto compartido."""
+    return manifest.exists(path)
+
+
+def rebuild_manifest():
+    """
+    Vuelve a generar el manifiesto tras modificar los recursos y recarga el manifiesto compartido.
+
+    Lo llaman al terminar los scripts que generan o reescriben recursos (atlas, variantes,
+    recompresión), para que el manifiesto nunca quede desactualizado.
+    """
+    build_manifest(manifest.asset_directory)
+    manifest.files = None  # Se vuelve a cargar en la siguiente consulta
+    manifest.relative_paths.clear()
+
+
+def verify_installation(full=False, strict=False, check_sizes=True):
+    """
+    Verifica los recursos contra el manifiesto.
+
+    Si falta algún recurso original del manifiesto la instalación está dañada y se lanza RuntimeError,
+    de modo que el juego no llega a arrancar. Las demás diferencias (recursos generados que faltan,
+    tamaños distintos, archivos nuevos) tienen arreglo volviendo a generarlos: al arrancar se avisa y
+    con strict, como en "python asset_manifest.py verify", también son un error.
+
+    :param full: Si también se comprueba el hash de cada archivo (más lento).
+    :param strict: Si también se lanza RuntimeError por las diferencias que no son archivos que faltan.
+    :param check_sizes: Si también se comprueban los tamaños y los archivos sin registrar; al arrancar
+                        basta con comprobar que existen.
+    """
+    missing, problems = manifest.verify(full, check_sizes)
+    for problem in ([f"Falta el archivo {relative_path}" for relative_path in missing] + problems)[:20]:
+        print(problem)
+    if missing:
+        raise RuntimeError(f"Instalación dañada: faltan {len(missing)} recurso(s) del manifiesto.")
+    if problems:
+        message = f"{len(problems)} recurso(s) no coinciden con el manifiesto."
+        if strict:
+            raise RuntimeError(f"Instalación dañada: {message}")
+        print(f"Aviso: {message} Vuelve a generar los recursos o ejecuta 'python asset_manifest.py'.")
+
+
+if __name__ == '__main__':
+    # "python asset_manifest.py verify" comprueba la instalación completa (hashes incluidos)
+    if len(sys.argv) > 1 and sys.argv[1] == 'verify':
+        verify_installation(full=True, strict=True)
+        print("Todos los recursos coinciden con el manifiesto.")
+    else:
+        build_manifest()
@@ -0,0 +1,222 @@
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from PIL import Image
+
+import game.icons as icons
+import game.image_cache as image_cache
+import game.sounds as sounds
+import game.sprite_atlas as sprite_atlas
+
+WARMUP_WORKERS = 4  # Hilos de decodificación
+FRAME_BUDGET_MS = 6  # Tiempo máximo por fotograma dedicado a crear superficies en el hilo principal
+
+# Imágenes que las pantallas piden directamente a la caché, con la misma clave (ruta, tamaño, conversión, RLE).
+# Los iconos salen de sus hojas y los sprites del atlas, así que no se repiten aquí.
+WARMUP_IMAGES = (
+    ("../assets/img/title/fondo.png", (800, 600), "opaque", True),
+    ("../assets/img/title/logo_pokemon.png", (600, 250), "alpha", True),
+    ("../assets/pokemon_images/pikachu.png", (350, 350), "alpha", True),
+    ("../assets/img/main_menu/fondo.png", (800, 600), "opaque", True),
+    ("../assets/img/main_menu/load_menu.png", (800, 600), "opaque", True),
+    ("../assets/img/main_menu/ficha_entrenador.png", None, "alpha", True),
+    ("../assets/img/oak_intro/profesor_oak.png", (350, 350), "alpha", True),
+    ("../assets/img/battle/campo_batalla.png", None, "opaque", True),
+    # La transición al combate escala y gira la Pokéball en cada fotograma, por eso la usa sin RLE
+    ("../assets/img/main_menu/icons/pokeball.png", None, "alpha", False),
+)
+
+# Tamaños del atlas que piden las pantallas: slots del equipo (42) y lista del Pokédex (48).
+# Las hojas quedan fuera del presupuesto de la caché de imágenes, así que no se precarga ningún otro.
+WARMUP_ATLAS_SIZES = (42, 48)
+
+SOUND_EFFECTS = (
+    "../assets/sound/sound_effect/level_up.mp3",
+    "../assets/sound/sound_effect/click_button.mp3",
+    "../assets/sound/sound_effect/button-8.mp3",
+)
+
+
+def decode_image(path, convert):
+    """Decodifica un PNG con PIL (libera el GIL, se ejecuta en un hilo). Devuelve (modo, tamaño, bytes)."""
+    mode = "RGB" if convert == "opaque" else "RGBA"
+    with Image.open(path) as image:
+        image = image.convert(mode)
+        return mode, image.size, image.tobytes()
+
+
+def read_file(path):
+    """Lee un archivo entero (solo E/S, se ejecuta en un hilo)."""
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def create_surface(decoded, convert):
+    """Crea la superficie de pygame a partir de los bytes decodificados (solo en el hilo principal)."""
+    mode, size, data = decoded
+    surface = pygame.image.frombuffer(data, size, mode)
+    return surface.convert() if convert == "opaque" else surface.convert_alpha()
+
+
+def scale_surface(surface, size):
+    """Escala una superficie igual que la caché de imágenes (sin suavizado), o la deja igual si size es None."""
+    return surface if size is None else pygame.transform.scale(surface, size)
+
+
+class AssetWarmup:
+    def __init__(self, workers=WARMUP_WORKERS):
+        """
+        Precarga de recursos en segundo plano.
+
+        La lectura y decodificación de imágenes y la lectura de los sonidos se hace en un conjunto de
+        hilos; en el hilo principal se crean las superficies y los sonidos finales (el mezclador solo se
+        usa desde ahí), repartidos entre fotogramas con poll(), y se guardan en las mismas cachés que
+        usan las pantallas.
+
+        :param workers: Número de hilos de decodificación.
+        """
+        self.workers = workers
+        self.jobs = []  # (función en un hilo, función en el hilo principal con su resultado)
+        self.pending = []  # Futuros aún sin procesar, en el orden en el que se añadieron
+        self.executor = None
+        self.total = 0
+        self.completed = 0
+
+    def add_image(self, path, size=None, convert="alpha", rle=True):
+        """
+        Añade una imagen para la caché de imágenes, con la misma clave con la que la pide su pantalla.
+
+        :param path: Ruta de la imagen.
+        :param size: Tamaño final (ancho, alto) o None para el tamaño original.
+        :param convert: "alpha" u "opaque", como en ImageCache.get().
+        :param rle: Si se aplica aceleración RLE, como en ImageCache.get().
+        """
+        key = image_cache.cache.make_key(path, size, convert, rle)
+        if key in image_cache.cache.entries:
+            return
+
+        def store(decoded):
+            if key not in image_cache.cache.entries:  # Una pantalla pudo cargarla mientras tanto
+                surface = scale_surface(create_surface(decoded, convert), key[1])
+                image_cache.cache.put(key, image_cache.accelerate(surface, key[3]))
+
+        self.jobs.append((lambda: decode_image(path, convert), store))
+
+    def add_atlas_sheets(self, sizes=WARMUP_ATLAS_SIZES, atlas=sprite_atlas.atlas):
+        """
+        Añade las hojas del atlas de sprites de los tamaños indicados (si se ha generado).
+
+        :param sizes: Tamaños del atlas cuyas hojas se precargan.
+        :param atlas: Atlas en el que se guardan las hojas.
+        """
+        for size in sizes:
+            if not atlas.has_size(size):
+                continue
+            for sheet_filename in atlas.index[str(size)]["sheets"]:
+                if sheet_filename in atlas.sheets:
+                    continue
+                path = os.path.join(atlas.directory, sheet_filename)
+
+                def store(decoded, sheet_filename=sheet_filename):
+                    if sheet_filename not in atlas.sheets:
+                        atlas.sheets[sheet_filename] = create_surface(decoded, "alpha")
+
+                self.jobs.append((lambda path=path: decode_image(path, "alpha"), store))
+
+    def add_icon_sheets(self, registry=icons.registry):
+        """Añade las hojas de iconos (si se han generado)."""
+        for sheet_filename in registry.sheet_filenames():
+            if sheet_filename in registry.sheets:
+                continue
+            path = os.path.join(registry.directory, sheet_filename)
+
+            def store(decoded, sheet_filename=sheet_filename):
+                if sheet_filename not in registry.sheets:
+                    registry.sheets[sheet_filename] = create_surface(decoded, "alpha")
+
+            self.jobs.append((lambda path=path: decode_image(path, "alpha"), store))
+
+    def add_silhouettes(self, atlas=sprite_atlas.atlas):
+        """Añade la generación en bloque de las siluetas del atlas (tras cargar sus hojas)."""
+        for size in sprite_atlas.SILHOUETTE_SIZES:
+            if atlas.has_size(size):
+                self.jobs.append((lambda: None, lambda _, size=size: atlas.prepare_silhouettes(size)))
+
+    def add_sound(self, path):
+        """Añade un sonido para la caché de sonidos (en el hilo solo se lee el archivo, sin usar el mezclador)."""
+        if path in sounds.sound_cache:
+            return
+
+        def store(data):
+            if path not in sounds.sound_cache:
+                sounds.sound_cache[path] = pygame.mixer.Sound(file=io.BytesIO(data))
+
+        self.jobs.append((lambda: read_file(path), store))
+
+    def start(self):
+        """Lanza la decodificación de todos los recursos añadidos."""
+        self.total = len(self.jobs)
+        self.executor = ThreadPoolExecutor(max_workers=self.workers)
+        self.pending = [(self.executor.submit(load), store) for load, store in self.jobs]
+        self.jobs = []
+
+    def poll(self, budget_ms=FRAME_BUDGET_MS):
+        """
+        Procesa en el hilo principal los recursos ya decodificados, sin pasar del tiempo indicado.
+
+        :param budget_ms: Milisegundos disponibles en este fotograma.
+        """
+        start = time.perf_counter()
+        while self.pending and self.pending[0][0].done():
+            future, store = self.pending.pop(0)
+            self.finish_job(future, store)
+            if (time.perf_counter() - start) * 1000 >= budget_ms:
+                break
+        if not self.pending:
+            self.shutdown()
+
+    def finish(self):
+        """Termina de golpe la precarga pendiente (cuando el jugador no quiere esperar a la barra de carga)."""
+        while self.pending:
+            future, store = self.pending.pop(0)
+            self.finish_job(future, store)
+        self.shutdown()
+
+    def finish_job(self, future, store):
+        """Guarda el resultado de un recurso; si falla, la pantalla lo cargará normalmente al usarlo."""
+        try:
+            store(future.result())
+        except Exception as error:  # Cualquier fallo solo deja el recurso para la carga bajo demanda
+            print(f"No se pudo precargar un recurso: {error}")
+        self.completed += 1
+
+    def shutdown(self):
+        """Libera los hilos de decodificación."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    @property
+    def progress(self):
+        """Fracción de recursos ya disponibles, entre 0.0 y 1.0."""
+        return self.completed / self.total if self.total else 1.0
+
+    def is_done(self):
+        """Indica si ya no queda nada por precargar."""
+        return not self.pending and not self.jobs
+
+
+def create_default_warmup():
+    """Prepara la precarga de la interfaz: imágenes de las pantallas, hojas de iconos, atlas y efectos de sonido."""
+    warmup = AssetWarmup()
+    for path, size, convert, rle in WARMUP_IMAGES:
+        warmup.add_image(path, size, convert, rle)
+    warmup.add_icon_sheets()
+    warmup.add_atlas_sheets()
+    warmup.add_silhouettes()
+    for path in SOUND_EFFECTS:
+        warmup.add_sound(path)
+    return warmup
@@ -0,0 +1,62 @@
+import pygame
+
+
+class LayerCache:
+    def __init__(self):
+        """
+        Capas estáticas de las pantallas (fondos, franjas, decoraciones giradas, barras de cabecera),
+        compartidas por todo el proceso.
+
+        Cada capa se dibuja una sola vez en una superficie opaca del tamaño de la pantalla y después
+        se compone con un único blit por fotograma; encima solo se dibujan las capas dinámicas.
+        Se guardan por (clave de la capa, tamaño), así que un cambio de tamaño genera una capa nueva;
+        si cambia el tema (colores, imágenes) hay que invalidarlas.
+        """
+        self.layers = {}  # (clave, tamaño) -> superficie
+
+    def get(self, key, size, render):
+        """
+        Devuelve una capa, dibujándola solo la primera vez.
+
+        :param key: Clave de la capa, por ejemplo "pokedex".
+        :param size: Tamaño (ancho, alto) de la capa.
+        :param render: Función que dibuja la capa sobre la superficie que recibe.
+        :return: La superficie de la capa (compartida, no debe modificarse).
+        """
+        layer_key = (key, tuple(size))
+        layer = self.layers.get(layer_key)
+        if layer is None:
+            layer = pygame.Surface(layer_key[1])
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert()
+            render(layer)
+            self.layers[layer_key] = layer
+        return layer
+
+    def invalidate(self, key=None):
+        """Descarta una capa (en todos sus tamaños) o, sin clave, todas, por ejemplo al cambiar de tema."""
+        if key is None:
+            self.layers.clear()
+        else:
+            for layer_key in [layer_key for layer_key in self.layers if layer_key[0] == key]:
+                del self.layers[layer_key]
+
+
+# Capas compartidas por todas las pantallas
+cache = LayerCache()
+
+
+def draw_static_layer(screen, key, render):
+    """
+    Dibuja la capa estática de una pantalla, del tamaño de la pantalla y desde la caché compartida.
+
+    :param screen: Superficie en la que se dibuja.
+    :param key: Clave de la capa.
+    :param render: Función que dibuja la capa sobre la superficie que recibe (solo se llama la primera vez).
+    """
+    screen.blit(cache.get(key, screen.get_size(), render), (0, 0))
+
+
+def invalidate(key=None):
+    """Descarta capas estáticas de la caché compartida."""
+    cache.invalidate(key)
@@ -1,6 +1,55 @@
 import json
+import os
+import re
+
 import pygame
-import ui
+import game.glyph_text as glyph_text
+import game.image_cache as image_cache
+import game.line_breaking as line_breaking
+
+DIALOGUES_FILE = os.path.abspath(os.path.join(os.path.dirname(__file__), 'data', 'dialogues.json'))
+
+# Placeholders que cada pantalla proporciona para cada diálogo: (contexto, clave) -> campos.
+# Al cargar el catálogo se avisa de cualquier placeholder de los textos que no esté aquí.
+DIALOGUE_PLACEHOLDERS = {
+    ("combat", "encounter"): {"enemy_pokemon", "player_pokemon"},
+    ("combat", "actions"): {"player_pokemon"},
+    ("combat", "player_attack"): {"player_pokemon", "movement"},
+    ("combat", "enemy_attack"): {"enemy_pokemon", "movement"},
+    ("professor", "name_prompt"): {"player_name"},
+    ("professor", "select_starter"): {"pokemon_name", "pokemon_type"},
+}
+
+# Un placeholder es un nombre entre llaves; el resto del texto (incluidas otras llaves) es literal
+PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+
+
+class DialogueTemplate:
+    def __init__(self, text):
+        """
+        Línea de diálogo compilada: el texto se divide una sola vez en tramos literales y campos,
+        de modo que sustituir todos los placeholders es una única pasada.
+
+        Solo {nombre} es un placeholder, como en la sustitución original por texto: cualquier otra
+        llave ("{{", "{campo:>5}", una llave suelta) se conserva tal cual en el resultado.
+
+        :param text: Texto con placeholders del tipo {nombre}.
+        """
+        self.text = text
+        self.parts = PLACEHOLDER_PATTERN.split(text)  # Tramos alternos: literal, campo, literal, campo...
+        self.fields = set(self.parts[1::2])
+        self.has_literal_braces = any('{' in literal or '}' in literal for literal in self.parts[::2])
+
+    def render(self, placeholders):
+        """
+        Devuelve el texto con los placeholders sustituidos.
+
+        :param placeholders: Diccionario campo -> valor. Los campos sin valor se dejan como {campo}.
+        """
+        if not self.fields:
+            return self.text
+        return "".join(part if i % 2 == 0 else str(placeholders.get(part, f"{{{part}}}"))
+                       for i, part in enumerate(self.parts))
 
 
 def replace_placeholders(text, placeholders):
@@ -11,44 +60,101 @@ def replace_placeholders(text, placeholders):
     :param placeholders: Un diccionario con los valores a sustituir.
     :return: El texto con los placeholders reemplazados.
     """
-    for key, value in placeholders.items():
-        text = text.replace(f"{{{key}}}", value)
-    return text
+    return DialogueTemplate(text).render(placeholders)
 
 
-class DialogueManager:
-    def __init__(self, json_path):
-        self.dialogues = self.load_dialogues(json_path)
-        self.current_context = None
-        self.current_dialogue = None
+class DialogueCatalog:
+    def __init__(self, json_path=DIALOGUES_FILE):
+        """
+        Catálogo de diálogos del juego, cargado una sola vez por proceso.
+
+        Cada línea se compila en una plantilla al cargar, y los placeholders se validan contra
+        DIALOGUE_PLACEHOLDERS para detectar los textos que ninguna pantalla puede completar.
 
-    @staticmethod
-    def load_dialogues(json_path):
+        :param json_path: Ruta del archivo de diálogos.
+        """
         with open(json_path, 'r', encoding='utf-8') as file:
-            return json.load(file)
+            dialogues = json.load(file)
+
+        self.lines = {}  # (contexto, clave) -> lista de textos
+        self.templates = {}  # (contexto, clave) -> lista de plantillas
+        self.contexts = set(dialogues)
+        self.problems = []
+        for context, context_dialogues in dialogues.items():
+            for key, lines in context_dialogues.items():
+                self.lines[(context, key)] = lines
+                self.templates[(context, key)] = [DialogueTemplate(line) for line in lines]
+        self.validate()
+
+    def validate(self):
+        """
+        Avisa de los placeholders de los textos que no proporciona ninguna pantalla y de las llaves
+        que no forman un placeholder (se muestran tal cual).
+        """
+        for (context, key), templates in self.templates.items():
+            available = DIALOGUE_PLACEHOLDERS.get((context, key), set())
+            for template in templates:
+                for field in sorted(template.fields - available):
+                    self.problems.append(f"Placeholder '{{{field}}}' sin valor en el diálogo '{context}.{key}'.")
+                if template.has_literal_braces:
+                    self.problems.append(f"Llaves que no son un placeholder en el diálogo '{context}.{key}': "
+                                         f"{template.text!r}")
+        for problem in self.problems:
+            print(problem)
+        return self.problems
+
+
+# Catálogos ya cargados: ruta absoluta -> DialogueCatalog
+_catalogs = {}
+
+
+def get_catalog(json_path=DIALOGUES_FILE):
+    """Devuelve el catálogo de un archivo de diálogos, cargándolo la primera vez."""
+    path = os.path.abspath(json_path)
+    if path not in _catalogs:
+        _catalogs[path] = DialogueCatalog(path)
+    return _catalogs[path]
+
+
+class DialogueManager:
+    def __init__(self, json_path=DIALOGUES_FILE):
+        self.catalog = get_catalog(json_path)
+        self.current_context = None
 
     def set_context(self, context):
         """Configura el contexto del diálogo actual."""
-        if context in self.dialogues:
+        if context in self.catalog.contexts:
             self.current_context = context
-            self.current_dialogue = self.dialogues[context]
         else:
             raise ValueError(f"Contexto de diálogo '{context}' no encontrado.")
 
     def get_dialogue(self, key):
-        """Obtiene el diálogo según la clave. Devuelve una lista de cadenas de texto."""
-        if self.current_context and key in self.current_dialogue:
-            return self.current_dialogue[key]
-        else:
+        """Obtiene el diálogo según la clave. Devuelve una lista de cadenas de texto (compartida, no modificar)."""
+        lines = self.catalog.lines.get((self.current_context, key))
+        if lines is None:
             raise ValueError(f"Diálogo con clave '{key}' no encontrado en el contexto '{self.current_context}'.")
+        return lines
 
     def get_dialogue_with_placeholders(self, key, placeholders):
         """Obtiene el diálogo con los placeholders reemplazados."""
-        return [replace_placeholders(line, placeholders) for line in self.get_dialogue(key)]
+        templates = self.catalog.templates.get((self.current_context, key))
+        if templates is None:
+            raise ValueError(f"Diálogo con clave '{key}' no encontrado en el contexto '{self.current_context}'.")
+        return [template.render(placeholders) for template in templates]
 
 
 class TextDisplayManager:
-    def __init__(self, font, dialogue_speed=1):
+    def __init__(self, font, dialogue_speed=17):
+        """
+        Muestra un texto con efecto de máquina de escribir.
+
+        El texto completo se parte en líneas una sola vez y cada carácter se dibuja, al aparecer, en
+        la superficie persistente de su línea a partir del atlas de glifos. Las líneas terminadas ya no
+        cambian y se aceleran con RLE, así que cada fotograma solo cuesta el blit de la línea en curso.
+
+        :param font: Fuente del texto.
+        :param dialogue_speed: Milisegundos por carácter (17 equivale a un carácter por fotograma a 60 FPS).
+        """
         self.font = font
         self.dialogue_speed = dialogue_speed
         self.current_text = ""
@@ -57,32 +163,86 @@ class TextDisplayManager:
         self.current_index = 0
         self.dialogue_complete = False
 
+        # Composición del texto para la caja actual
+        self.layout_key = None
+        self.glyph_atlas = None
+        # Por línea: [superficie, posición en la caja, glifos (área, x), caracteres ya dibujados, inicio en el texto]
+        self.lines = []
+
     def set_text(self, text):
         self.current_text = text
         self.displayed_text = ""
         self.current_index = 0
         self.dialogue_complete = False
         self.last_update_time = pygame.time.get_ticks()
+        self.layout_key = None
 
     def update(self):
-        """Actualiza el texto mostrado, carácter por carácter."""
+        """Actualiza el texto mostrado según el tiempo transcurrido, igual a cualquier tasa de fotogramas."""
         if not self.dialogue_complete:
+            speed = max(1, self.dialogue_speed)
             current_time = pygame.time.get_ticks()
-            if current_time - self.last_update_time > self.dialogue_speed:
-                self.last_update_time = current_time
-                self.current_index += 1
+            new_chars = (current_time - self.last_update_time) // speed
+            if new_chars > 0:
+                self.last_update_time += new_chars * speed
+                self.current_index = min(self.current_index + new_chars, len(self.current_text))
                 self.displayed_text = self.current_text[:self.current_index]
 
                 # Verifica si todo el texto ya ha sido mostrado
                 if self.current_index >= len(self.current_text):
                     self.dialogue_complete = True
 
+    def prepare_layout(self, box_width, box_height, padding, line_spacing, text_color, vertical_offset):
+        """Parte el texto completo en líneas y prepara la superficie de cada una (solo si cambia la caja)."""
+        key = (box_width, box_height, padding, line_spacing, tuple(text_color), vertical_offset)
+        if key == self.layout_key:
+            return
+        self.layout_key = key
+
+        lines = line_breaking.wrap(self.current_text, self.font, box_width - 2 * padding)
+        line_height = self.font.get_height() + line_spacing
+        total_text_height = len(lines) * line_height - line_spacing
+        y_start = padding + (box_height - total_text_height) / 2 + vertical_offset
+
+        self.glyph_atlas = glyph_text.get_atlas(self.font, text_color)
+        self.lines = []
+        text_position = 0
+        for i, line in enumerate(lines):
+            # Las líneas no conservan los espacios en los que se parten: se busca dónde empieza cada una
+            line_start = self.current_text.find(line, text_position) if line else text_position
+            text_position = line_start + len(line)
+            areas, offsets, width = self.glyph_atlas.layout(line)
+            surface = pygame.Surface((max(1, width), self.glyph_atlas.height), pygame.SRCALPHA).convert_alpha()
+            self.lines.append([surface, (padding, y_start + i * line_height), list(zip(areas, offsets)), 0, line_start])
+
+    def reveal(self):
+        """Dibuja en las superficies de las líneas solo los caracteres que han aparecido desde el último fotograma."""
+        for line in self.lines:
+            surface, _, glyphs, rendered_chars, line_start = line
+            visible_chars = min(max(len(self.displayed_text) - line_start, 0), len(glyphs))
+            if visible_chars > rendered_chars:
+                # Con BLEND_RGBA_MAX los glifos se copian sobre el fondo transparente sin oscurecer sus bordes
+                surface.blits([(self.glyph_atlas.surface, (x, 0), area, pygame.BLEND_RGBA_MAX)
+                               for area, x in glyphs[rendered_chars:visible_chars]], doreturn=False)
+                line[3] = visible_chars
+                if visible_chars == len(glyphs):
+                    image_cache.accelerate(surface)  # Línea terminada: ya no cambia
+
     def draw(self, screen, box_position=(12, 449), box_width=780, box_height=150, padding=20, line_spacing=10,
              text_color=(0, 0, 0), vertical_offset=-15):
         """Dibuja el texto mostrado dentro del cuadro de diálogo, respetando el tamaño y alineación."""
-        ui.draw_text_in_dialog_box(screen, self.displayed_text, self.font, box_position,
-                                   box_width=box_width, box_height=box_height, text_color=text_color,
-                                   padding=padding, line_spacing=line_spacing, vertical_offset=vertical_offset)
+        self.prepare_layout(box_width, box_height, padding, line_spacing, text_color, vertical_offset)
+        self.reveal()
+        for surface, (x, y), glyphs, rendered_chars, _ in self.lines:
+            if rendered_chars == 0:
+                continue  # Línea vacía o que aún no ha empezado a escribirse
+            position = (box_position[0] + x, box_position[1] + y)
+            if rendered_chars == len(glyphs):
+                screen.blit(surface, position)
+            else:
+                # Línea en curso: solo la parte ya escrita
+                last_area, last_x = glyphs[rendered_chars - 1]
+                screen.blit(surface, position, (0, 0, last_x + last_area.width, surface.get_height()))
 
     def is_dialogue_complete(self):
         """Retorna True si el texto ya ha sido completamente mostrado."""
@@ -90,5 +250,6 @@ class TextDisplayManager:
 
     def complete_text(self):
         """Marca el diálogo como completo e inmediatamente muestra todo el texto."""
+        self.current_index = len(self.current_text)
         self.displayed_text = self.current_text
         self.dialogue_complete = True
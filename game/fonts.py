@@ -0,0 +1,87 @@
+import os
+
+import pygame
+
+import game.asset_manifest as asset_manifest
+
+DEFAULT_FONT = "../assets/fonts/pokemon.ttf"  # Fuente de toda la interfaz
+
+
+class FontRegistry:
+    def __init__(self):
+        """
+        Registro de fuentes compartido por todo el proceso.
+
+        Cada combinación (archivo, tamaño, estilo) se crea una sola vez: construir un pygame.font.Font
+        implica leer y analizar el TTF, así que no debe hacerse en cada fotograma. Las fuentes
+        devueltas se comparten y no deben modificarse (set_bold, set_italic...); el estilo se pide aquí.
+        """
+        self.fonts = {}  # (ruta absoluta, tamaño, negrita, cursiva, subrayado) -> pygame.font.Font
+        self.paths = {}  # ruta pedida -> ruta absoluta ya comprobada
+        self.requests = 0
+        self.created = 0
+
+    def resolve_path(self, font_path):
+        """Comprueba una sola vez que existe el archivo de la fuente y devuelve su ruta absoluta."""
+        path = self.paths.get(font_path)
+        if path is None:
+            path = os.path.abspath(font_path)
+            if not asset_manifest.exists(font_path):
+                raise FileNotFoundError(f"No se encontró la fuente en la ruta: {path}")
+            self.paths[font_path] = path
+        return path
+
+    def get(self, size, font_path=DEFAULT_FONT, bold=False, italic=False, underline=False):
+        """
+        Devuelve la fuente pedida, creándola solo la primera vez.
+
+        :param size: Tamaño de la fuente.
+        :param font_path: Ruta del archivo TTF.
+        :param bold: Negrita.
+        :param italic: Cursiva.
+        :param underline: Subrayado.
+        :return: La instancia compartida de pygame.font.Font.
+        """
+        self.requests += 1
+        key = (self.resolve_path(font_path), int(size), bold, italic, underline)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(key[0], key[1])
+            font.set_bold(bold)
+            font.set_italic(italic)
+            font.set_underline(underline)
+            self.fonts[key] = font
+            self.created += 1
+        return font
+
+    def preload(self, sizes, font_path=DEFAULT_FONT):
+        """Crea por adelantado las fuentes de una pantalla (tamaños de la fuente indicada)."""
+        for size in sizes:
+            self.get(size, font_path)
+
+    def get_stats(self):
+        """Devuelve cuántas fuentes existen, cuántas se han creado y cuántas veces se han pedido."""
+        return {
+            "fonts": len(self.fonts),
+            "created": self.created,
+            "requests": self.requests,
+        }
+
+
+# Registro único para todo el juego
+registry = FontRegistry()
+
+
+def get_font(size, font_path=DEFAULT_FONT, bold=False, italic=False, underline=False):
+    """Devuelve una fuente compartida del registro."""
+    return registry.get(size, font_path, bold, italic, underline)
+
+
+def preload(sizes, font_path=DEFAULT_FONT):
+    """Crea por adelantado las fuentes indicadas en el registro compartido."""
+    registry.preload(sizes, font_path)
+
+
+def get_stats():
+    """Devuelve los contadores del registro de fuentes compartido."""
+    return registry.get_stats()
@@ -0,0 +1,115 @@
+import pygame
+
+# Caracteres que se rasterizan al crear cada atlas (cifras y signos de PS, niveles, tiempos y contadores)
+DEFAULT_CHARS = "0123456789/:.,-+%º Nv"
+
+
+class GlyphAtlas:
+    def __init__(self, font, color, chars=DEFAULT_CHARS):
+        """
+        Atlas de glifos de una fuente y un color.
+
+        Cada carácter se rasteriza una sola vez en una única superficie; un texto se compone
+        dibujando sus glifos con un solo Surface.blits(). Está pensado para los valores que cambian
+        a menudo (PS, niveles, tiempo de juego, contadores), en los que una caché de textos
+        completos se renovaría constantemente.
+
+        :param font: Fuente compartida (de game.fonts) con la que se rasterizan los glifos.
+        :param color: Color de los glifos.
+        :param chars: Caracteres que se rasterizan desde el principio; el resto se añade al usarlos.
+        """
+        self.font = font
+        self.color = tuple(color)
+        self.surface = None
+        self.glyphs = {}  # carácter -> rectángulo del glifo dentro del atlas
+        self.height = font.get_height()
+        self.build(chars)
+
+    def build(self, chars):
+        """Rasteriza los caracteres indicados (junto con los que ya tenía) en una nueva superficie."""
+        chars = "".join(dict.fromkeys("".join(self.glyphs) + chars))
+        rendered = [(char, self.font.render(char, True, self.color)) for char in chars]
+
+        self.surface = pygame.Surface((max(1, sum(glyph.get_width() for _, glyph in rendered)), self.height),
+                                      pygame.SRCALPHA)
+        self.glyphs = {}
+        x = 0
+        for char, glyph in rendered:
+            # Con BLEND_RGBA_MAX sobre el fondo transparente se copian los píxeles tal cual, sin mezclar
+            self.surface.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.glyphs[char] = pygame.Rect(x, 0, glyph.get_width(), self.height)
+            x += glyph.get_width()
+
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+
+    def ensure_chars(self, text):
+        """Añade al atlas los caracteres del texto que aún no tiene."""
+        missing = [char for char in text if char not in self.glyphs]
+        if missing:
+            self.build("".join(missing))
+
+    def layout(self, text):
+        """
+        Calcula la composición del texto.
+
+        :return: Tupla (áreas de los glifos dentro del atlas, desplazamiento horizontal de cada uno, ancho total).
+        """
+        self.ensure_chars(text)
+        areas = [self.glyphs[char] for char in text]
+        offsets = []
+        width = 0
+        for area in areas:
+            offsets.append(width)
+            width += area.width
+        return areas, offsets, width
+
+    def size(self, text):
+        """Devuelve el tamaño (ancho, alto) que ocupa el texto."""
+        return self.layout(text)[2], self.height
+
+    def draw(self, screen, text, **position):
+        """
+        Dibuja el texto con un único blits().
+
+        :param screen: Superficie en la que dibujar.
+        :param text: Texto a dibujar.
+        :param position: Colocación como en Surface.get_rect, por ejemplo topleft=(x, y) o center=(x, y).
+        :return: El rectángulo ocupado por el texto.
+        """
+        areas, offsets, width = self.layout(text)
+        rect = pygame.Rect(0, 0, width, self.height)
+        for attribute, value in position.items():
+            setattr(rect, attribute, value)
+        x, y = rect.topleft
+        surface = self.surface
+        screen.blits([(surface, (x + offset, y), area) for area, offset in zip(areas, offsets)], doreturn=False)
+        return rect
+
+
+# Atlas ya creados: (fuente, color) -> GlyphAtlas
+_atlases = {}
+
+
+def get_atlas(font, color):
+    """Devuelve el atlas de glifos de una fuente y un color, creándolo la primera vez."""
+    key = (font, tuple(color))
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(font, color)
+        _atlases[key] = atlas
+    return atlas
+
+
+def draw_text(screen, font, text, color, **position):
+    """
+    Dibuja un texto que cambia a menudo componiéndolo desde el atlas de glifos.
+
+    :param screen: Superficie en la que dibujar.
+    :param font: Fuente compartida.
+    :param text: Texto a dibujar.
+    :param color: Color del texto.
+    :param position: Colocación como en Surface.get_rect, por ejemplo topleft=(x, y) o center=(x, y).
+    :return: El rectángulo ocupado por el texto.
+    """
+    return get_atlas(font, color).draw(screen, str(text), **position)
@@ -1,6 +1,166 @@
-import pygame
+import json
 import os
 
+import pygame
+from PIL import Image
+
+import game.asset_manifest as asset_manifest
+import game.image_cache as image_cache
+
+ICON_SHEET_DIRECTORY = "../assets/icons"  # Hojas generadas por build_icon_sheets()
+ICON_INDEX_FILE = "index.json"
+MAX_ICON_SIDE = 128  # Lado máximo con el que se guarda cada icono en su hoja
+MAX_SHEET_WIDTH = 1024
+
+# Iconos que se empaquetan, agrupados en una hoja por grupo: grupo -> (directorio, archivos o None para todos)
+ICON_GROUPS = {
+    "types": ("../assets/img/types", None),
+    "gender": ("../assets/img/gender", None),
+    "keyboard": ("../assets/img/keyboard", None),
+    "badges": ("../assets/img/badges", None),
+    "menu": ("../assets/img/main_menu/icons", None),
+    "pokemon_menu": ("../assets/img/pokemon_menu", ("pokeball_black.png", "pokeball_white.png", "pokemon_cry.png")),
+}
+
+
+def build_icon_sheets(groups=ICON_GROUPS, output_directory=ICON_SHEET_DIRECTORY, max_icon_side=MAX_ICON_SIDE,
+                      max_sheet_width=MAX_SHEET_WIDTH):
+    """
+    Empaqueta los iconos de la interfaz en una hoja por grupo.
+
+    Cada icono se reduce (manteniendo la proporción) para que su lado mayor no pase de `max_icon_side`
+    y se coloca en filas. El índice relaciona la ruta original de cada icono con su hoja y su rectángulo.
+
+    :param groups: Grupos de iconos a empaquetar.
+    :param output_directory: Directorio donde se guardan las hojas y el índice.
+    :param max_icon_side: Lado máximo de cada icono dentro de la hoja.
+    :param max_sheet_width: Ancho máximo de cada hoja.
+    :return: El índice generado.
+    """
+    os.makedirs(output_directory, exist_ok=True)
+
+    index = {}
+    for group, (directory, filenames) in groups.items():
+        if filenames is None:
+            filenames = sorted(filename for filename in os.listdir(directory) if filename.lower().endswith('.png'))
+
+        # Reducir los iconos y calcular su posición en la hoja
+        icons = []
+        x = y = row_height = 0
+        for filename in filenames:
+            with Image.open(os.path.join(directory, filename)) as image:
+                image = image.convert("RGBA")
+                image.thumbnail((max_icon_side, max_icon_side), Image.Resampling.LANCZOS)
+            if x + image.width > max_sheet_width:
+                x, y, row_height = 0, y + row_height, 0
+            icons.append((filename, image, x, y))
+            x += image.width
+            row_height = max(row_height, image.height)
+
+        sheet_width = max((icon_x + image.width for _, image, icon_x, _ in icons), default=1)
+        sheet = Image.new("RGBA", (sheet_width, y + row_height), (0, 0, 0, 0))
+        group_index = {}
+        for filename, image, icon_x, icon_y in icons:
+            sheet.paste(image, (icon_x, icon_y))
+            relative_path = asset_manifest.manifest.relative_path(os.path.join(directory, filename))
+            group_index[relative_path] = [icon_x, icon_y, image.width, image.height]
+
+        sheet_filename = f"{group}.png"
+        sheet.save(os.path.join(output_directory, sheet_filename), optimize=True)
+        index[group] = {"sheet": sheet_filename, "icons": group_index}
+        print(f"Hoja de iconos '{group}' generada: {len(icons)} iconos.")
+
+    with open(os.path.join(output_directory, ICON_INDEX_FILE), 'w') as file:
+        json.dump(index, file)
+
+    asset_manifest.rebuild_manifest()
+    return index
+
+
+class IconRegistry:
+    def __init__(self, directory=ICON_SHEET_DIRECTORY):
+        """
+        Registro único de iconos para todo el proceso.
+
+        Los iconos se sacan de las hojas empaquetadas (o, si no se han generado, de sus archivos a
+        través de la caché de imágenes) y cada tamaño pedido se genera una sola vez y se memoriza.
+
+        :param directory: Directorio donde están las hojas de iconos y su índice.
+        """
+        self.directory = directory
+        self.icons = None  # ruta relativa del icono -> (hoja, rectángulo); se lee la primera vez
+        self.sheets = {}  # nombre de la hoja -> superficie
+        self.variants = {}  # (ruta, tamaño) -> superficie al tamaño pedido
+
+    def load_index(self):
+        """
+        Lee el índice de las hojas de iconos. Si no se han generado, el registro queda vacío.
+
+        Los iconos de las hojas que falten se cargan de sus archivos, como si no estuvieran empaquetados.
+        """
+        self.icons = {}
+        index_path = os.path.join(self.directory, ICON_INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path, 'r') as file:
+                index = json.load(file)
+            for group_index in index.values():
+                if not asset_manifest.exists(os.path.join(self.directory, group_index["sheet"])):
+                    continue
+                for relative_path, rect in group_index["icons"].items():
+                    self.icons[relative_path] = (group_index["sheet"], rect)
+
+    def sheet_filenames(self):
+        """Devuelve los nombres de todas las hojas de iconos."""
+        if self.icons is None:
+            self.load_index()
+        return sorted({sheet_filename for sheet_filename, _ in self.icons.values()})
+
+    def get_sheet(self, sheet_filename):
+        """Devuelve una hoja de iconos, cargándola una sola vez."""
+        sheet = self.sheets.get(sheet_filename)
+        if sheet is None:
+            sheet = image_cache.ImageCache.load(os.path.join(self.directory, sheet_filename), "alpha")
+            self.sheets[sheet_filename] = sheet
+        return sheet
+
+    def get(self, path, size):
+        """
+        Devuelve un icono al tamaño pedido.
+
+        :param path: Ruta del icono original, por ejemplo "../assets/img/types/fire.png".
+        :param size: Tamaño final (ancho, alto).
+        :return: La superficie del icono (compartida, no debe modificarse) o None si no existe.
+        """
+        key = (path, (int(size[0]), int(size[1])))
+        icon = self.variants.get(key)
+        if icon is not None:
+            return icon
+
+        if self.icons is None:
+            self.load_index()
+        packed = self.icons.get(asset_manifest.manifest.relative_path(path))
+        if packed is not None:
+            sheet_filename, rect = packed
+            source = self.get_sheet(sheet_filename).subsurface(pygame.Rect(rect))
+            icon = image_cache.accelerate(pygame.transform.smoothscale(source, key[1]))
+        elif asset_manifest.exists(path):
+            # Sin hoja para este icono: la caché de imágenes lo escala desde el archivo
+            icon = image_cache.load_image(path, key[1])
+        else:
+            return None
+
+        self.variants[key] = icon
+        return icon
+
+
+# Registro compartido por todas las pantallas
+registry = IconRegistry()
+
+
+def get_icon(path, size):
+    """Devuelve un icono al tamaño pedido desde el registro compartido."""
+    return registry.get(path, size)
+
 
 class IconLoader:
     def __init__(self, icon_directory, icon_size=(32, 32)):
@@ -14,14 +174,11 @@ class IconLoader:
         self.icons = {}
 
     def load_icons(self, icon_map):
-        """Carga todas las imágenes y las redimensiona al tamaño especificado."""
+        """Obtiene del registro compartido todas las imágenes al tamaño especificado."""
         for key, filename in icon_map.items():
             path = os.path.join(self.icon_directory, filename)
-            if os.path.exists(path):
-                # Cargar la imagen
-                icon = pygame.image.load(path)
-                # Redimensionar la imagen
-                icon = pygame.transform.scale(icon, self.icon_size)
+            icon = registry.get(path, self.icon_size)
+            if icon is not None:
                 self.icons[key] = icon
             else:
                 print(f"Imagen para '{key}' no encontrada en {path}.")
@@ -78,3 +235,28 @@ class GenderIcons(IconLoader):
         }
         # Cargar las imágenes de los géneros al inicializar
         self.load_icons(self.gender_to_icon)
+
+
+# Conjuntos de iconos ya creados, compartidos por tamaño: (clase, tamaño) -> instancia
+_icon_sets = {}
+
+
+def get_type_icons(icon_size=(32, 32)):
+    """Devuelve el conjunto compartido de iconos de tipo para un tamaño."""
+    return _get_icon_set(TypeIcons, icon_size)
+
+
+def get_gender_icons(icon_size=(26, 26)):
+    """Devuelve el conjunto compartido de iconos de género para un tamaño."""
+    return _get_icon_set(GenderIcons, icon_size)
+
+
+def _get_icon_set(icon_class, icon_size):
+    key = (icon_class, tuple(icon_size))
+    if key not in _icon_sets:
+        _icon_sets[key] = icon_class(icon_size=icon_size)
+    return _icon_sets[key]
+
+
+if __name__ == '__main__':
+    build_icon_sheets()
@@ -0,0 +1,200 @@
+import os
+from collections import OrderedDict
+
+import pygame
+
+DEFAULT_BUDGET_BYTES = 256 * 1024 * 1024  # Presupuesto por defecto: 256 MB de superficies
+
+# Con POKEMON_DEBUG_BLITS=1 se avisa de las superficies sin convertir que llegan a un blit frecuente
+DEBUG_BLITS = os.getenv("POKEMON_DEBUG_BLITS") == "1"
+
+
+def surface_bytes(surface):
+    """Calcula los bytes que ocupa una superficie en memoria."""
+    return surface.get_pitch() * surface.get_height()
+
+
+class ImageCache:
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES):
+        """
+        Caché de imágenes compartida por todo el proceso.
+
+        Las entradas se indexan por (ruta, tamaño, modo de conversión, RLE) y se expulsan por orden
+        de uso (LRU) cuando la memoria ocupada por las superficies supera el presupuesto.
+
+        :param budget_bytes: Memoria máxima (en bytes) que pueden ocupar las superficies cacheadas.
+        """
+        self.budget_bytes = budget_bytes
+        self.entries = OrderedDict()  # clave -> (superficie, bytes)
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(path, size=None, convert="alpha", rle=True):
+        """Normaliza la clave de una imagen: ruta absoluta, tamaño entero, modo de conversión y RLE."""
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        return os.path.abspath(path), size, convert, rle and convert == "alpha"
+
+    def get(self, path, size=None, convert="alpha", rle=True):
+        """
+        Devuelve la imagen pedida, cargándola (y escalándola) solo si no está en caché.
+
+        :param path: Ruta de la imagen.
+        :param size: Tamaño final (ancho, alto) o None para el tamaño original.
+        :param convert: "alpha" para convert_alpha(), "opaque" para convert() (fondos sin transparencia)
+                        o None para no convertir.
+        :param rle: Si se aplica aceleración RLE a las imágenes con transparencia. Debe desactivarse
+                    para las superficies que se van a transformar o leer píxel a píxel con frecuencia.
+        :return: La superficie cacheada. No debe modificarse, se comparte entre llamadas.
+        """
+        key = self.make_key(path, size, convert, rle)
+        if key[1] is None:
+            return self.get_or_create(key, lambda: accelerate(self.load(key[0], convert), key[3]))
+        # Escalamos a partir de la imagen original, que también queda cacheada
+        return self.get_or_create(
+            key, lambda: accelerate(pygame.transform.scale(self.get(path, None, convert), key[1]), key[3]))
+
+    def get_or_create(self, key, factory):
+        """
+        Devuelve la superficie asociada a una clave o la crea con `factory` si no está en caché.
+
+        Permite cachear superficies derivadas (escaladas, recortadas...) bajo el mismo presupuesto.
+
+        :param key: Clave hashable que identifica la superficie.
+        :param factory: Función sin argumentos que genera la superficie en caso de fallo.
+        """
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        surface = factory()
+        self.put(key, surface)
+        return surface
+
+    @staticmethod
+    def load(path, convert):
+        """Carga la imagen desde disco y la convierte al formato indicado."""
+        surface = pygame.image.load(path)
+        if convert == "alpha":
+            surface = surface.convert_alpha()
+        elif convert == "opaque":
+            surface = surface.convert()
+        return surface
+
+    def put(self, key, surface):
+        """Guarda una superficie en la caché y expulsa las menos usadas si se supera el presupuesto."""
+        old_entry = self.entries.pop(key, None)
+        if old_entry is not None:
+            self.bytes_used -= old_entry[1]
+
+        size_bytes = surface_bytes(surface)
+        self.entries[key] = (surface, size_bytes)
+        self.bytes_used += size_bytes
+        self.evict()
+
+    def evict(self):
+        """Expulsa las entradas menos usadas hasta respetar el presupuesto (nunca la más reciente)."""
+        while self.bytes_used > self.budget_bytes and len(self.entries) > 1:
+            _, (_, size_bytes) = self.entries.popitem(last=False)
+            self.bytes_used -= size_bytes
+            self.evictions += 1
+
+    def set_budget(self, budget_bytes):
+        """Cambia el presupuesto de memoria y expulsa lo necesario."""
+        self.budget_bytes = budget_bytes
+        self.evict()
+
+    def clear(self):
+        """Vacía la caché (los contadores se mantienen)."""
+        self.entries.clear()
+        self.bytes_used = 0
+
+    def get_stats(self):
+        """Devuelve los contadores de aciertos, fallos y memoria de la caché."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.bytes_used,
+            "budget_bytes": self.budget_bytes,
+        }
+
+
+def accelerate(surface, rle=True):
+    """
+    Activa la aceleración RLE en una superficie con transparencia ya convertida.
+
+    Las zonas transparentes se codifican por tramos y el blit las salta, lo que hace varias veces
+    más rápido dibujar iconos y sprites. Las superficies opacas no ganan nada y se dejan igual.
+    """
+    if rle and surface.get_flags() & pygame.SRCALPHA:
+        surface.set_alpha(255, pygame.RLEACCEL)
+    return surface
+
+
+def unaccelerated(surface):
+    """
+    Devuelve una copia con transparencia por píxel de una superficie, sin la aceleración RLE.
+
+    Sirve para componer superficies aceleradas sobre otra con transparencia: el blit acelerado no
+    tiene en cuenta el alfa del destino y oscurecería los bordes suavizados.
+    """
+    copy = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+    # Con BLEND_RGBA_MAX sobre el fondo transparente se copian los píxeles tal cual, sin mezclar
+    copy.blit(surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+    return copy
+
+
+def is_display_format(surface):
+    """Indica si una superficie está en el formato de píxel de la pantalla (convert o convert_alpha)."""
+    display = pygame.display.get_surface()
+    if display is None:
+        return True  # Sin ventana no hay formato con el que comparar
+    if surface.get_flags() & pygame.SRCALPHA:
+        global _alpha_reference
+        if _alpha_reference is None:
+            _alpha_reference = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+        reference = _alpha_reference
+    else:
+        reference = display
+    return surface.get_bitsize() == reference.get_bitsize() and surface.get_masks() == reference.get_masks()
+
+
+_alpha_reference = None  # Superficie de referencia con el formato de convert_alpha()
+_reported_blits = set()  # Avisos ya mostrados, para no repetirlos cada fotograma
+
+
+def check_blit(surface, context):
+    """
+    Comprobación de depuración para los blits frecuentes: avisa (una vez por contexto) si la
+    superficie no se ha convertido al formato de la pantalla. Solo actúa con POKEMON_DEBUG_BLITS=1.
+
+    :param surface: Superficie que se va a dibujar.
+    :param context: Descripción del punto de dibujo, para el aviso.
+    """
+    if DEBUG_BLITS and surface is not None and context not in _reported_blits and not is_display_format(surface):
+        _reported_blits.add(context)
+        print(f"[blit] Superficie sin convertir en {context}: {surface.get_size()} {surface.get_bitsize()} bits.")
+
+
+# Caché única para todo el juego
+cache = ImageCache()
+
+
+def load_image(path, size=None, convert="alpha", rle=True):
+    """Carga una imagen a través de la caché compartida del juego."""
+    return cache.get(path, size, convert, rle)
+
+
+def get_stats():
+    """Devuelve las estadísticas de la caché compartida."""
+    return cache.get_stats()
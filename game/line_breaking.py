@@ -0,0 +1,81 @@
+from collections import OrderedDict
+
+MAX_LAYOUTS = 512  # Textos ya partidos en líneas que se guardan como máximo
+
+
+class LineBreaker:
+    def __init__(self, max_layouts=MAX_LAYOUTS):
+        """
+        Motor de partición de texto en líneas, compartido por toda la interfaz.
+
+        Cada palabra se mide una sola vez por fuente (con el espacio que la sigue, cuyo ancho es su
+        avance, así que la suma coincide con font.size de la línea entera), de modo que partir un
+        párrafo es una suma de anchos en lugar de medir con font.size la línea entera por cada
+        palabra. Además, el resultado de cada (texto, fuente, ancho) se memoriza.
+
+        :param max_layouts: Número máximo de textos partidos que se guardan.
+        """
+        self.max_layouts = max_layouts
+        self.word_widths = {}  # fuente -> {palabra: ancho de la palabra seguida de un espacio}
+        self.layouts = OrderedDict()  # (texto, fuente, ancho máximo) -> tupla de líneas
+
+    def measure(self, font, word):
+        """Devuelve el ancho de una palabra seguida de un espacio, midiéndola solo la primera vez para cada fuente."""
+        widths = self.word_widths.get(font)
+        if widths is None:
+            widths = self.word_widths[font] = {}
+        width = widths.get(word)
+        if width is None:
+            width = widths[word] = font.size(word + " ")[0]
+        return width
+
+    def wrap(self, text, font, max_width):
+        """
+        Parte el texto en líneas que quepan en el ancho indicado.
+
+        Una línea admite otra palabra si la línea resultante, con un espacio al final, no pasa del
+        ancho máximo. Una palabra más ancha que el máximo ocupa su propia línea (si es la primera,
+        precedida de una línea vacía, como hacía ui.wrap_text).
+
+        :param text: Texto a partir.
+        :param font: Fuente con la que se dibujará el texto.
+        :param max_width: Ancho máximo de cada línea.
+        :return: Tupla con las líneas (sin espacios al principio ni al final).
+        """
+        key = (text, font, max_width)
+        lines = self.layouts.get(key)
+        if lines is not None:
+            self.layouts.move_to_end(key)
+            return lines
+
+        lines = self.break_lines(text, font, max_width)
+        self.layouts[key] = lines
+        while len(self.layouts) > self.max_layouts:
+            self.layouts.popitem(last=False)
+        return lines
+
+    def break_lines(self, text, font, max_width):
+        """Parte el texto en líneas sin memorizar el resultado (para partir muchos textos de una vez)."""
+        measure = self.measure
+        lines = []
+        current_words = []
+        current_width = 0
+        for word in text.split(' '):
+            word_width = measure(font, word)
+            if current_width + word_width > max_width:
+                lines.append(" ".join(current_words).strip())
+                current_words = []
+                current_width = 0
+            current_words.append(word)
+            current_width += word_width
+        lines.append(" ".join(current_words).strip())
+        return tuple(lines)
+
+
+# Motor único para todo el juego
+breaker = LineBreaker()
+
+
+def wrap(text, font, max_width):
+    """Parte un texto en líneas con el motor compartido."""
+    return breaker.wrap(text, font, max_width)
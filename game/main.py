@@ -7,11 +7,18 @@ from game.screen.main_menu_screen import MainMenuScreen
 from game.screen.pokedex_screen import PokedexDataScreen, PokedexScreen
 from game.screen.title_screen import TitleScreen
 import game.pokemon as pok
+import game.asset_manifest as asset_manifest
+import game.text_cache as text_cache
 
 WINDOW_WIDTH, WINDOW_HEIGHT = 800, 600  # Medidas de la pantalla
+# Eventos tras los que la ventana debe volver a presentarse completa (su contenido se ha perdido)
+REPAINT_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED)
 
 
 def main():
+    # Comprobación rápida (solo existencia): si falta un recurso original el juego no arranca
+    asset_manifest.verify_installation(check_sizes=False)
+
     pygame.init()
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     pygame.display.set_caption("Pokémon Game")  # Título del juego
@@ -28,11 +35,15 @@ def main():
 
     #current_screen = TitleScreen()
 
+    clock = pygame.time.Clock()
+    full_present = True  # El primer fotograma de cada pantalla se presenta completo
     running = True
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in REPAINT_EVENTS:
+                full_present = True
 
             # Manejar eventos de la pantalla actual
             new_screen = current_screen.handle_events(event)
@@ -40,13 +51,25 @@ def main():
                 running = False
             elif new_screen is not current_screen:
                 current_screen = new_screen
+                full_present = True
 
         if running:
             current_screen.update()
             screen.fill((0, 0, 0))  # Limpiar pantalla
             current_screen.draw(screen)
-            pygame.display.flip()
-            pygame.time.Clock().tick(60)
+
+            # Una sola presentación por fotograma: completa o solo de las zonas que han cambiado
+            dirty_rects = current_screen.get_dirty_rects()
+            if full_present or dirty_rects is None:
+                pygame.display.flip()
+                full_present = False
+            elif dirty_rects:
+                pygame.display.update(dirty_rects)
+            clock.tick(60)
+
+    if text_cache.DEBUG_TEXT_STATS:
+        text_stats = text_cache.get_stats()
+        print(f"Caché de textos: {text_stats['entries']} textos, {text_stats['hit_rate']:.1%} de aciertos.")
 
     pygame.quit()
     sys.exit()
@@ -0,0 +1,133 @@
+import io
+import os
+import sys
+import time
+
+import pygame
+from PIL import Image
+
+import game.asset_manifest as asset_manifest
+
+ASSET_DIRECTORY = "../assets"  # Raíz de todos los recursos del juego
+UI_DIRECTORY = "../assets/img"  # Arte de la interfaz, el único que se puede cuantizar a paleta
+QUANTIZE_COLORS = 256  # Colores de la paleta al cuantizar
+DECODE_REPEATS = 3  # Repeticiones al medir la decodificación (se queda el mejor tiempo)
+
+
+def list_pngs(directory=ASSET_DIRECTORY):
+    """Devuelve todas las imágenes PNG bajo un directorio, ordenadas para que el proceso sea reproducible."""
+    paths = []
+    for root, _, filenames in os.walk(directory):
+        paths.extend(os.path.join(root, filename) for filename in filenames if filename.lower().endswith('.png'))
+    return sorted(paths)
+
+
+def measure_decode(path, repeats=DECODE_REPEATS):
+    """Mide (en segundos) lo que tarda pygame en decodificar una imagen, como hace el juego al cargarla."""
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        pygame.image.load(path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark(paths):
+    """
+    Mide cada imagen: bytes en disco y tiempo de decodificación.
+
+    :return: Diccionario ruta -> (bytes, segundos).
+    """
+    return {path: (os.path.getsize(path), measure_decode(path)) for path in paths}
+
+
+def recompress(path, quantize=False, colors=QUANTIZE_COLORS):
+    """
+    Vuelve a comprimir un PNG con la máxima compresión y lo reemplaza solo si ocupa menos.
+
+    Sin cuantizar, la recompresión es sin pérdida: se comprueba que los píxeles decodificados
+    son idénticos antes de reemplazar el archivo.
+
+    :param path: Ruta de la imagen.
+    :param quantize: Si se reduce la imagen a una paleta de `colors` colores (con pérdida).
+    :param colors: Número de colores de la paleta.
+    :return: True si el archivo se ha reemplazado.
+    """
+    with Image.open(path) as image:
+        image.load()
+        original_pixels = image.convert("RGBA").tobytes()
+        icc_profile = image.info.get("icc_profile")
+
+        if quantize and image.mode != "P":
+            optimized = image.convert("RGBA").quantize(colors, method=Image.Quantize.FASTOCTREE)
+        else:
+            optimized = image
+
+        buffer = io.BytesIO()
+        optimized.save(buffer, "PNG", optimize=True, icc_profile=icc_profile)
+
+    if not quantize:
+        buffer.seek(0)
+        with Image.open(buffer) as result:
+            if result.convert("RGBA").tobytes() != original_pixels:
+                print(f"La recompresión de {path} cambiaba los píxeles, se mantiene el original.")
+                return False
+
+    if len(buffer.getvalue()) >= os.path.getsize(path):
+        return False
+    with open(path, 'wb') as file:
+        file.write(buffer.getvalue())
+    return True
+
+
+def print_report(before, after):
+    """Muestra, por imagen y en total, los bytes en disco y el tiempo de decodificación antes y después."""
+    print(f"{'Recurso':<60} {'KB antes':>9} {'KB después':>10} {'ms antes':>9} {'ms después':>10}")
+    for path in sorted(before):
+        size_before, time_before = before[path]
+        size_after, time_after = after[path]
+        relative_path = os.path.relpath(path, ASSET_DIRECTORY)
+        print(f"{relative_path:<60} {size_before / 1024:>9.1f} {size_after / 1024:>10.1f} "
+              f"{time_before * 1000:>9.2f} {time_after * 1000:>10.2f}")
+
+    total_bytes_before = sum(size for size, _ in before.values())
+    total_bytes_after = sum(size for size, _ in after.values())
+    total_time_before = sum(seconds for _, seconds in before.values())
+    total_time_after = sum(seconds for _, seconds in after.values())
+    print(f"Total: {total_bytes_before / 1024 / 1024:.1f} MB -> {total_bytes_after / 1024 / 1024:.1f} MB en disco, "
+          f"{total_time_before:.2f} s -> {total_time_after:.2f} s de decodificación ({len(before)} imágenes).")
+
+
+def optimize_assets(asset_directory=ASSET_DIRECTORY, quantize_ui=False):
+    """
+    Recomprime todas las imágenes de los recursos y muestra la comparativa antes/después.
+
+    Al terminar se vuelve a generar el manifiesto de recursos, ya que cambian los tamaños.
+
+    :param asset_directory: Directorio raíz de los recursos.
+    :param quantize_ui: Si también se cuantiza a paleta el arte de la interfaz (assets/img).
+    """
+    paths = list_pngs(asset_directory)
+    ui_directory = os.path.abspath(UI_DIRECTORY) + os.sep
+    before = benchmark(paths)
+
+    replaced = 0
+    for path in paths:
+        quantize = quantize_ui and os.path.abspath(path).startswith(ui_directory)
+        if recompress(path, quantize):
+            replaced += 1
+
+    after = benchmark(paths)
+    print_report(before, after)
+    print(f"{replaced} de {len(paths)} imágenes reemplazadas.")
+    asset_manifest.rebuild_manifest()
+
+
+if __name__ == '__main__':
+    # "--quantize" cuantiza también el arte de la interfaz; "--benchmark" solo mide, sin modificar nada
+    if '--benchmark' in sys.argv:
+        results = benchmark(list_pngs())
+        print_report(results, results)
+    else:
+        optimize_assets(quantize_ui='--quantize' in sys.argv)
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+
+import pygame
+
+import game.image_cache as image_cache
+
+DEFAULT_BUDGET_BYTES = 48 * 1024 * 1024  # Presupuesto por defecto: 48 MB de paneles
+
+
+class PanelCache:
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES):
+        """
+        Caché de paneles ya compuestos (fichas de la Pokédex, pestañas de datos de un Pokémon...).
+
+        Un panel reúne todo lo que se dibuja para un elemento concreto (imágenes, textos, cajas) en
+        una sola superficie, que se compone una vez y después se dibuja con un único blit. Se guardan
+        por (clave, tamaño); la clave debe incluir todo el estado del que depende el panel, de modo que
+        un cambio de estado da lugar a un panel nuevo. Cuando la memoria ocupada supera el presupuesto
+        se descartan los menos usados recientemente.
+
+        :param budget_bytes: Memoria máxima (en bytes) que pueden ocupar los paneles.
+        """
+        self.budget_bytes = budget_bytes
+        self.panels = OrderedDict()  # (clave, tamaño) -> superficie
+        self.bytes_used = 0
+
+    def has(self, key, size):
+        """Indica si un panel ya está compuesto."""
+        return (key, tuple(size)) in self.panels
+
+    def get(self, key, size, render, alpha=False):
+        """
+        Devuelve un panel, componiéndolo solo la primera vez.
+
+        :param key: Clave del panel (con el estado del que depende).
+        :param size: Tamaño (ancho, alto) del panel.
+        :param render: Función que dibuja el panel sobre la superficie que recibe.
+        :param alpha: Si el panel tiene transparencia; si no, es una superficie opaca que render debe cubrir entera.
+        :return: La superficie del panel (compartida, no debe modificarse).
+        """
+        panel_key = (key, tuple(size))
+        panel = self.panels.get(panel_key)
+        if panel is not None:
+            self.panels.move_to_end(panel_key)
+            return panel
+
+        panel = pygame.Surface(panel_key[1], pygame.SRCALPHA if alpha else 0)
+        render(panel)
+        if pygame.display.get_surface() is not None:
+            panel = panel.convert_alpha() if alpha else panel.convert()
+        self.panels[panel_key] = panel
+        self.bytes_used += image_cache.surface_bytes(panel)
+        while self.bytes_used > self.budget_bytes and len(self.panels) > 1:
+            self.bytes_used -= image_cache.surface_bytes(self.panels.popitem(last=False)[1])
+        return panel
+
+    def invalidate(self, key=None):
+        """Descarta un panel (en todos sus tamaños) o, sin clave, todos."""
+        if key is None:
+            self.panels.clear()
+            self.bytes_used = 0
+        else:
+            for panel_key in [panel_key for panel_key in self.panels if panel_key[0] == key]:
+                self.bytes_used -= image_cache.surface_bytes(self.panels.pop(panel_key))
+
+
+# Paneles compartidos por todas las pantallas
+cache = PanelCache()
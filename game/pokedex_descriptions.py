@@ -0,0 +1,89 @@
+import json
+import os
+
+import game.fonts as fonts
+import game.line_breaking as line_breaking
+import game.pokemon as pok
+
+POKEMON_DATA_FILE = 'data/poke_data.json'
+DESCRIPTION_LINES_FILE = 'data/description_lines.json'  # Generado la primera vez que se muestra una descripción
+
+
+class DescriptionLines:
+    def __init__(self, data_path=POKEMON_DATA_FILE, lines_path=DESCRIPTION_LINES_FILE):
+        """
+        Descripciones de la Pokédex ya partidas en líneas, guardadas junto a los datos de las especies.
+
+        La primera vez que se pide un tamaño de fuente y un ancho se parten las descripciones de todas
+        las especies de una vez y se guardan en disco; a partir de ahí (también en las siguientes
+        partidas) mostrar una descripción no requiere ninguna maquetación de texto.
+
+        :param data_path: Archivo con los datos de las especies.
+        :param lines_path: Archivo donde se guardan las líneas ya partidas.
+        """
+        self.data_path = data_path
+        self.lines_path = lines_path
+        self.layouts = None  # "tamaño:ancho" -> {nombre de la especie: [líneas]}; se lee la primera vez
+
+    def source_stamp(self):
+        """Identifica la versión de los datos de las especies (tamaño y fecha), para descartar líneas antiguas."""
+        stat = os.stat(self.data_path)
+        return [stat.st_size, int(stat.st_mtime)]
+
+    def load(self):
+        """Lee las líneas guardadas, si corresponden a los datos de las especies actuales."""
+        self.layouts = {}
+        if os.path.exists(self.lines_path):
+            with open(self.lines_path, 'r', encoding='utf-8') as file:
+                saved = json.load(file)
+            if saved.get("source") == self.source_stamp():
+                self.layouts = saved["layouts"]
+
+    def save(self):
+        """Guarda todas las líneas partidas junto a los datos de las especies."""
+        with open(self.lines_path, 'w', encoding='utf-8') as file:
+            json.dump({"source": self.source_stamp(), "layouts": self.layouts}, file)
+
+    def prepare(self, font_size, max_width):
+        """
+        Parte las descripciones de todas las especies para un tamaño de fuente y un ancho.
+
+        :return: Diccionario nombre de la especie -> líneas.
+        """
+        if self.layouts is None:
+            self.load()
+        key = f"{font_size}:{max_width}"
+        if key not in self.layouts:
+            font = fonts.get_font(font_size)
+            self.layouts[key] = {
+                pokemon_data['name']: list(line_breaking.breaker.break_lines(
+                    pokemon_data['species']['description'], font, max_width))
+                for pokemon_data in pok.load_pokemon_data(self.data_path) if pokemon_data.get('species')
+            }
+            self.save()
+        return self.layouts[key]
+
+    def get(self, pokemon_data, font_size, max_width):
+        """
+        Devuelve la descripción de una especie ya partida en líneas.
+
+        :param pokemon_data: Datos de la especie (como los devuelve load_pokemon_data).
+        :param font_size: Tamaño de la fuente con la que se dibuja.
+        :param max_width: Ancho disponible para cada línea.
+        :return: Lista de líneas.
+        """
+        lines = self.prepare(font_size, max_width).get(pokemon_data['name'])
+        if lines is None:
+            # Especie que no está en el archivo de datos: se parte al vuelo
+            description = pok.normalize_description(pokemon_data['species']['description'])
+            lines = list(line_breaking.wrap(description, fonts.get_font(font_size), max_width))
+        return lines
+
+
+# Líneas compartidas por todas las pantallas de la Pokédex
+description_lines = DescriptionLines()
+
+
+def get_description_lines(pokemon_data, font_size, max_width):
+    """Devuelve la descripción de una especie partida en líneas para el tamaño de fuente y el ancho indicados."""
+    return description_lines.get(pokemon_data, font_size, max_width)
@@ -3,6 +3,8 @@ import requests
 import json
 import time
 
+from game.pokemon import normalize_description
+
 # URLs base de la PokeAPI
 POKEAPI_BASE_URL = "https://pokeapi.co/api/v2/pokemon/"
 POKEAPI_MOVE_URL = "https://pokeapi.co/api/v2/move/"
@@ -125,8 +127,9 @@ def get_pokemon_species_data(pokemon_id, retries=3, delay=5):
                 'is_mythical': species_data.get('is_mythical', False),
                 'capture_rate': species_data.get('capture_rate', 0),
                 'gender_rate': species_data.get('gender_rate', -1),  # -1 indica género desconocido
-                'description': next((entry['flavor_text'] for entry in species_data['flavor_text_entries']
-                                     if entry['language']['name'] == 'en'), "Description not available."),
+                'description': normalize_description(
+                    next((entry['flavor_text'] for entry in species_data['flavor_text_entries']
+                          if entry['language']['name'] == 'en'), "Description not available.")),
                 'evolution_chain': get_evolution_chain(species_data['evolution_chain']['url'])
             }
 
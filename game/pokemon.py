@@ -1,8 +1,93 @@
 import json
 import random
 import os
-from PIL import Image
 import pygame
+from PIL import Image
+
+import game.asset_manifest as asset_manifest
+import game.image_cache as image_cache
+import game.sounds as sounds
+import game.sprite_variants as sprite_variants
+
+SPRITE_DIRECTORY = '../assets/pokemon_images'  # Artwork original de cada especie
+
+
+class SpeciesSprites:
+    def __init__(self, directory=SPRITE_DIRECTORY):
+        """
+        Almacén del artwork de cada especie, compartido por todas las instancias de Pokemon.
+
+        Cada imagen se decodifica una sola vez (la primera vez que se pide) y se convierte al
+        formato de la pantalla, de modo que 50 Pokémon de la misma especie comparten una superficie.
+
+        :param directory: Directorio con las imágenes originales.
+        """
+        self.directory = directory
+        self.sprites = {}  # especie -> superficie (o None si no tiene imagen)
+
+    def get(self, name):
+        """
+        Devuelve el artwork de una especie, decodificándolo solo la primera vez.
+
+        :param name: Nombre de la especie.
+        :return: La superficie compartida (no debe modificarse) o None si no existe la imagen.
+        """
+        name = name.lower()
+        if name in self.sprites:
+            return self.sprites[name]
+
+        image_path = os.path.join(self.directory, f'{name}.png')
+        if not asset_manifest.exists(image_path):
+            self.sprites[name] = None
+            return None
+
+        # Sin ventana todavía no se puede convertir al formato de pantalla: se carga sin guardarla
+        if pygame.display.get_surface() is None:
+            return image_cache.load_image(image_path, convert=None)
+
+        sprite = image_cache.load_image(image_path)
+        self.sprites[name] = sprite
+        return sprite
+
+    def get_scaled(self, name, size):
+        """
+        Devuelve el artwork de una especie redimensionado con filtro de calidad (LANCZOS), una sola vez por tamaño.
+
+        Si el tamaño es uno de los preparados en la compilación se usa la variante, que ya se generó
+        con el mismo filtro; si no, se redimensiona la imagen original con PIL y se guarda en la caché.
+
+        :param name: Nombre de la especie.
+        :param size: Tamaño (ancho, alto) deseado.
+        :return: La superficie compartida (no debe modificarse) o None si no existe la imagen.
+        """
+        name = name.lower()
+        size = (int(size[0]), int(size[1]))
+        if size[0] == size[1]:
+            source = sprite_variants.variants.get_source(name, size[0])
+            if source is not None and source[2] == size[0]:
+                return sprite_variants.get_pokemon_sprite(name, size[0])
+
+        image_path = os.path.join(self.directory, f'{name}.png')
+        if not asset_manifest.exists(image_path):
+            return None
+
+        def resize():
+            with Image.open(image_path) as image:
+                resized = image.convert("RGBA").resize(size, Image.Resampling.LANCZOS)
+                surface = pygame.image.frombytes(resized.tobytes(), size, "RGBA")
+            if pygame.display.get_surface() is not None:
+                surface = image_cache.accelerate(surface.convert_alpha())
+            return surface
+
+        return image_cache.cache.get_or_create(("lanczos", os.path.abspath(image_path), size), resize)
+
+    def clear(self):
+        """Olvida las superficies cargadas (se vuelven a decodificar al pedirlas)."""
+        self.sprites.clear()
+
+
+# Almacén único de sprites por especie
+species_sprites = SpeciesSprites()
 
 
 class Pokemon:
@@ -22,7 +107,6 @@ class Pokemon:
         self.experience = experience
         self.experience_to_next_level = self.calculate_exp_to_next_level()
         self.status = status
-        self.image = self.load_image()  # Cargar la imagen al inicializar
         self.sound = self.load_sound()  # Cargar el sonido al inicializar
         self.max_stats = self.calculate_stats()  # Guardar las estadísticas máximas
         self.current_stats = self.max_stats.copy()  # Inicializar los HP actuales al máximo
@@ -59,7 +143,8 @@ class Pokemon:
     def select_moves(self, moves):
         """Seleccionar hasta 4 movimientos disponibles según el nivel del Pokémon."""
         available_moves = [move for move in moves if move['level'] <= self.level]
-        selected_moves = random.sample(available_moves, min(len(available_moves), 4))
+        # Copias: los datos de las especies se comparten entre todas las instancias
+        selected_moves = [dict(move) for move in random.sample(available_moves, min(len(available_moves), 4))]
 
         for move in selected_moves:
             move['current_pp'] = move['pp']  # Inicializa current_pp con los PP máximos
@@ -159,49 +244,55 @@ class Pokemon:
 
         return cls(name, types, abilities, base_stats, evs, moves, height, weight, pokedex_id, gender_rate, level=level)
 
-    def load_image(self, desired_size=None):
-        """Carga la imagen del Pokémon a su tamaño original y la redimensiona si es necesario."""
-        image_path = f'../assets/pokemon_images/{self.name.lower()}.png'
-        if os.path.exists(image_path):
-            pil_image = Image.open(image_path)
-
-            # Si se proporciona un tamaño deseado, redimensionar la imagen
-            if desired_size:
-                pil_image = self.resize_image(pil_image, desired_size)
+    @property
+    def image(self):
+        """Artwork de la especie, decodificado bajo demanda y compartido con el resto de instancias."""
+        return species_sprites.get(self.name)
 
-            return self.pil_to_pygame(pil_image)
-        return None  # Devuelve None si no se encuentra la imagen
+    def load_image(self, desired_size=None):
+        """Devuelve la imagen del Pokémon a su tamaño original o redimensionada con LANCZOS si se pide un tamaño."""
+        if self.image is None:
+            return None  # Devuelve None si no se encuentra la imagen
+        if desired_size:
+            return species_sprites.get_scaled(self.name, desired_size)
+        return self.image
 
     def load_sound(self):
         """Cargar el sonido del Pokémon."""
         sound_path = f'../assets/pokemon_sounds/{self.name.lower()}.mp3'
-        if os.path.exists(sound_path):
-            return pygame.mixer.Sound(sound_path)
+        if asset_manifest.exists(sound_path):
+            return sounds.load_sound(sound_path)
         else:
             print(f"Sonido no encontrado para {self.name}.")
             return None
 
-    @staticmethod
-    def pil_to_pygame(pil_image):
-        """Convierte una imagen PIL a un objeto pygame.Surface."""
-        pil_image = pil_image.convert("RGBA")
-        mode = pil_image.mode
-        size = pil_image.size
-        data = pil_image.tobytes()
 
-        pygame_image = pygame.image.fromstring(data, size, mode)
-        return pygame_image
+def normalize_description(text):
+    """Deja una descripción de la Pokédex en una sola línea, sin saltos, guiones de corte ni espacios repetidos."""
+    text = text.replace('\u00ad\n', '').replace('\u00ad', '')
+    return ' '.join(text.split())
 
-    @staticmethod
-    def resize_image(pil_image, size):
-        """Redimensiona la imagen PIL a un tamaño específico."""
-        return pil_image.resize(size, Image.Resampling.LANCZOS)
+
+# Datos de Pokémon ya cargados: ruta del archivo -> lista de datos
+_pokemon_data = {}
 
 
 def load_pokemon_data(file_path='data/poke_data.json'):
-    """Cargar la lista de datos de Pokémon desde un archivo JSON."""
-    with open(file_path, 'r') as file:
-        return json.load(file)
+    """
+    Cargar la lista de datos de Pokémon desde un archivo JSON.
+
+    El archivo se lee una sola vez; la lista devuelta es compartida y no debe modificarse.
+    """
+    if file_path not in _pokemon_data:
+        with open(file_path, 'r') as file:
+            pokemon_data_list = json.load(file)
+        # Los datos generados antes de normalizar las descripciones se normalizan al cargarlos
+        for pokemon_data in pokemon_data_list:
+            species = pokemon_data.get('species') or {}
+            if 'description' in species:
+                species['description'] = normalize_description(species['description'])
+        _pokemon_data[file_path] = pokemon_data_list
+    return _pokemon_data[file_path]
 
 
 def create_random_pokemon(pokemon_data_list):
@@ -1,12 +1,17 @@
+import game.fonts as fonts
 from game.database_manager import DataBaseManager, MONGO_URI
 from game.sounds import SoundManager
 
 
 class BaseScreen:
+    # Tamaños de la fuente de la interfaz que usa la pantalla; se crean en el registro al abrirla
+    FONT_SIZES = ()
+
     def __init__(self, player):
         self.player = player
         self.sound_manager = SoundManager()
         self.db_manager = DataBaseManager(MONGO_URI)
+        fonts.preload(self.FONT_SIZES)
 
     def handle_events(self, event):
         """Método que las pantallas específicas pueden sobrescribir"""
@@ -19,3 +24,12 @@ class BaseScreen:
     def draw(self, screen):
         """Método que las pantallas específicas pueden sobrescribir"""
         pass
+
+    def get_dirty_rects(self):
+        """
+        Rectángulos de la pantalla que han cambiado en el último draw(), para presentar solo esa zona.
+
+        None (por defecto) indica que hay que presentar la pantalla completa; una lista vacía, que
+        no ha cambiado nada. El bucle principal presenta siempre completo el primer fotograma de una pantalla.
+        """
+        return None
@@ -1,28 +1,29 @@
-import os
 import pygame
+import game.fonts as fonts
 from game import utils
+import game.image_cache as image_cache
 import game.ui as ui
 from game.combat import Combat
 from game.dialogue_manager import TextDisplayManager, DialogueManager
-from game.icons import GenderIcons
+import game.icons as icons
 from game.screen.base_screen import BaseScreen
 
 
 class CombatScreen(BaseScreen):
+    FONT_SIZES = (40, 32, 24, 20, 15)
+
     def __init__(self, player, enemy_pokemon):
         """Inicializa la pantalla de combate."""
         super().__init__(player)
         self.enemy_pokemon = enemy_pokemon
-        self.font = pygame.font.Font(utils.load_font(), 40)
+        self.font = fonts.get_font(40)
         self.background_color = (232, 210, 224)
 
         self.combat = Combat(self.player, enemy_pokemon)  # Iniciamos el combate
         self.player_current_pokemon = self.combat.current_pokemon
 
         # Sistema de diálogos
-        self.dialogue_manager = DialogueManager(
-            os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'dialogues.json'))
-        )
+        self.dialogue_manager = DialogueManager()
         self.text_display_manager = TextDisplayManager(self.font)
         self.dialogue_manager.set_context("combat")
         self.dialogue_stage = "encounter"
@@ -35,11 +36,11 @@ class CombatScreen(BaseScreen):
         self.current_dialogue = self.dialogue_lines[self.current_dialogue_index]
 
         # Cargar la imagen de fondo
-        self.background_image = pygame.image.load("../assets/img/battle/campo_batalla.png").convert_alpha()
+        self.background_image = image_cache.load_image("../assets/img/battle/campo_batalla.png", convert="opaque")
         self.screen_width, self.screen_height = pygame.display.get_surface().get_size()
         self.background_image = utils.resize_image_to_width(self.background_image, self.screen_width)
 
-        self.pokeball_image = utils.load_image("../assets/img/main_menu/icons/pokeball.png", (20, 20))
+        self.pokeball_image = icons.get_icon("../assets/img/main_menu/icons/pokeball.png", (20, 20))
 
         # Configurar movimientos de los Pokémon usando MovementManager
         self.player_pokemon_movement = ui.PokemonCombatMovement(
@@ -166,6 +167,7 @@ class CombatScreen(BaseScreen):
 
     def draw(self, screen):
         """Dibuja la pantalla de combate."""
+        image_cache.check_blit(self.background_image, "fondo del combate")
         screen.blit(self.background_image, (0, 0))
 
         # Dibujar el Pokémon del jugador si ya se ha movido
@@ -195,5 +197,3 @@ class CombatScreen(BaseScreen):
             dialog_box_width = 792
         ui.draw_dialog_box(screen, box_width=dialog_box_width)
         self.text_display_manager.draw(screen)
-
-        pygame.display.flip()
@@ -1,5 +1,6 @@
 import sys
 import pygame
+import game.fonts as fonts
 from game import utils, ui
 from game.dialogue_manager import DialogueManager, TextDisplayManager
 from game.screen.base_screen import BaseScreen
@@ -7,10 +8,12 @@ from game.screen.main_menu_screen import MainMenuScreen
 
 
 class LoadGameScreen(BaseScreen):
+    FONT_SIZES = (35,)
+
     def __init__(self, player):
         super().__init__(player)
 
-        self.background_image = utils.load_image("../assets/img/main_menu/load_menu.png", (800, 600))
+        self.background_image = utils.load_image("../assets/img/main_menu/load_menu.png", (800, 600), convert="opaque")
 
         self.selected_box = 0
         self.boxes = [
@@ -96,21 +99,21 @@ class LoadGameScreen(BaseScreen):
                 ui.draw_save_load_game_box(screen, text="QUIT GAME", box_position=(screen_width // 4, 465),
                                            box_height=55, outer_border_color=border_color)
 
-        pygame.display.flip()
-
 
 class DeleteGameScreen(BaseScreen):
+    FONT_SIZES = (35,)
+
     def __init__(self, player):
         super().__init__(player)
 
         self.background_color = (94, 102, 242)
 
         # Gestión de diálogos
-        self.dialogue_manager = DialogueManager("../game/data/dialogues.json")
+        self.dialogue_manager = DialogueManager()
         self.dialogue_manager.set_context('delete_game')
         self.dialog_stage = 'delete_prompt'
         self.current_line_index = 0
-        self.text_display_manager = TextDisplayManager(pygame.font.Font(utils.load_font(), 35), dialogue_speed=50)
+        self.text_display_manager = TextDisplayManager(fonts.get_font(35), dialogue_speed=50)
 
         # Estado inicial
         self.show_confirmation = False
@@ -191,5 +194,3 @@ class DeleteGameScreen(BaseScreen):
                 box_width=140,
                 box_height=140
             )
-
-        pygame.display.flip()
@@ -1,5 +1,7 @@
 import pygame
+import game.fonts as fonts
 from game import ui, utils
+import game.icons as icons
 from game.screen.base_screen import BaseScreen
 from game.screen.save_game_screen import SaveGameScreen
 from game.screen.pokemon_menu_screen import PokemonMenuScreen
@@ -9,25 +11,26 @@ import game.pokemon as pokemon
 
 
 class MainMenuScreen(BaseScreen):
+    FONT_SIZES = (35,)
+
     def __init__(self, player):
         super().__init__(player)
-        self.font = pygame.font.Font(utils.load_font(), 35)
+        self.font = fonts.get_font(35)
 
         # Cargar imagen de fondo
-        self.background = utils.load_image("../assets/img/main_menu/fondo.png")
-        self.background = pygame.transform.scale(self.background, (
-            pygame.display.get_surface().get_width(), pygame.display.get_surface().get_height()))
+        self.background = utils.load_image("../assets/img/main_menu/fondo.png",
+                                           pygame.display.get_surface().get_size(), convert="opaque")
 
         # Cargar imágenes para los botones
         self.button_images = {
-            "fight": utils.load_image("../assets/img/main_menu/icons/luchar.png"),
-            "pokemon": utils.load_image("../assets/img/main_menu/icons/pokeball.png"),
-            "bag": utils.load_image("../assets/img/main_menu/icons/bolsa.png"),
-            "shop": utils.load_image("../assets/img/main_menu/icons/tienda.png"),
-            "pokedex": utils.load_image("../assets/img/main_menu/icons/pokedex.png"),
-            "player": utils.load_image("../assets/img/main_menu/icons/tarjeta.png"),
-            "options": utils.load_image("../assets/img/main_menu/icons/ajustes.png"),
-            "save": utils.load_image("../assets/img/main_menu/icons/guardar.png"),
+            "fight": icons.get_icon("../assets/img/main_menu/icons/luchar.png", (50, 50)),
+            "pokemon": icons.get_icon("../assets/img/main_menu/icons/pokeball.png", (50, 50)),
+            "bag": icons.get_icon("../assets/img/main_menu/icons/bolsa.png", (50, 50)),
+            "shop": icons.get_icon("../assets/img/main_menu/icons/tienda.png", (50, 50)),
+            "pokedex": icons.get_icon("../assets/img/main_menu/icons/pokedex.png", (50, 50)),
+            "player": icons.get_icon("../assets/img/main_menu/icons/tarjeta.png", (50, 50)),
+            "options": icons.get_icon("../assets/img/main_menu/icons/ajustes.png", (50, 50)),
+            "save": icons.get_icon("../assets/img/main_menu/icons/guardar.png", (50, 50)),
         }
 
         # Crear botones con posiciones ajustadas y dimensiones más pequeñas
@@ -41,6 +44,7 @@ class MainMenuScreen(BaseScreen):
             "options": ui.Button("Settings", (80, 440, 150, 100), self.font, self.button_images["options"]),
             "save": ui.Button("Save", (280, 440, 150, 100), self.font, self.button_images["save"]),
         }
+        self.dirty_rects = []  # Zonas que han cambiado en este fotograma (botones que cambian de estado)
 
         # Música
         self.sound_manager.play_random_menu_music()
@@ -83,8 +87,16 @@ class MainMenuScreen(BaseScreen):
     def update(self):
         """Actualizar el estado hover de los botones"""
         mouse_pos = pygame.mouse.get_pos()
+        self.dirty_rects = []
         for button in self.buttons.values():
+            was_hovered = button.is_hovered
             button.update(mouse_pos)
+            if button.is_hovered != was_hovered:
+                self.dirty_rects.append(button.get_bounds())
+
+    def get_dirty_rects(self):
+        """Solo cambian los botones cuyo estado hover ha cambiado."""
+        return self.dirty_rects
 
     def draw(self, screen):
         """Dibuja el menú principal."""
@@ -95,5 +107,3 @@ class MainMenuScreen(BaseScreen):
         # Dibujar los botones
         for button in self.buttons.values():
             button.draw(screen)
-
-        pygame.display.flip()
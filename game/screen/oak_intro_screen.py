@@ -1,5 +1,7 @@
 import pygame
-import os
+import game.fonts as fonts
+import game.sprite_variants as sprite_variants
+import game.text_cache as text_cache
 from game import utils, ui
 from game.dialogue_manager import DialogueManager, TextDisplayManager
 from game.player import Player
@@ -8,29 +10,29 @@ from game.screen.main_menu_screen import MainMenuScreen
 
 
 class OakIntroScreen(BaseScreen):
+    FONT_SIZES = (40, 60)
+
     def __init__(self):
         super().__init__(None)
         self.background_color = (255, 232, 127)
         self.profesor_oak = utils.load_image("../assets/img/oak_intro/profesor_oak.png", (350, 350))
-        self.font = pygame.font.Font(utils.load_font(), 40)
+        self.font = fonts.get_font(40)
 
-        # Cargar imágenes y rectángulos de los Pokémon
+        # Cargar imágenes (desde los tamaños preparados) y rectángulos de los Pokémon
         self.pokemons = {
             "Bulbasaur": (
-            utils.load_image("../assets/pokemon_images/bulbasaur.png", (120, 120)), pygame.Rect(50, 280, 120, 120)),
+            sprite_variants.get_pokemon_sprite("bulbasaur", 120), pygame.Rect(50, 280, 120, 120)),
             "Charmander": (
-            utils.load_image("../assets/pokemon_images/charmander.png", (120, 120)), pygame.Rect(170, 280, 120, 120)),
+            sprite_variants.get_pokemon_sprite("charmander", 120), pygame.Rect(170, 280, 120, 120)),
             "Squirtle": (
-            utils.load_image("../assets/pokemon_images/squirtle.png", (120, 120)), pygame.Rect(290, 280, 120, 120)),
+            sprite_variants.get_pokemon_sprite("squirtle", 120), pygame.Rect(290, 280, 120, 120)),
         }
 
         self.selected_pokemon_name, self.selected_pokemon_type = "", ""
         self.starter_pokemon = False
 
         # Diálogos
-        self.dialogue_manager = DialogueManager(
-            os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'dialogues.json'))
-        )
+        self.dialogue_manager = DialogueManager()
         self.dialogue_manager.set_context('professor')
         self.dialog_stage = 'greeting'
         self.current_line_index = 0
@@ -190,15 +192,13 @@ class OakIntroScreen(BaseScreen):
             utils.draw_confirmation_box(screen, self.selected_confirmation_option,
                                         position=confirmation_box_position)
 
-        pygame.display.flip()
-
 
 class ChooseNameScreen:
     def __init__(self, oak_intro_screen):
         self.oak_intro_screen = oak_intro_screen
         self.background_color = (255, 232, 127)
-        self.font = pygame.font.Font(utils.load_font(), 40)
-        self.font_large = pygame.font.Font(utils.load_font(), 60)
+        self.font = fonts.get_font(40)
+        self.font_large = fonts.get_font(60)
 
         # Parámetros del nombre
         self.max_name_length = 10
@@ -295,7 +295,7 @@ class ChooseNameScreen:
 
         for i in range(self.max_name_length):
             char = self.current_name[i] if i < len(self.current_name) else '_'
-            char_surface = self.font_large.render(char, True, self.text_color)
+            char_surface = text_cache.render(self.font_large, char, self.text_color)
 
             # Posiciona los caracteres (letras o guiones bajos) de forma centrada
             char_x = start_x + char_spacing * i
@@ -312,12 +312,14 @@ class ChooseNameScreen:
             pygame.draw.rect(screen, (0, 0, 0), rect, 3, border_radius=10)
 
             # Dibuja el texto sobre cada botón
-            text_surf = self.font.render(letter, True, (255, 255, 255))
+            text_surf = text_cache.render(self.font, letter, (255, 255, 255))
             screen.blit(text_surf, (rect.x + (rect.width - text_surf.get_width()) // 2,
                                     rect.y + (rect.height - text_surf.get_height()) // 2))
 
-        pygame.display.flip()
-
     def update(self):
         """Actualiza el estado de la pantalla."""
         pass
+
+    def get_dirty_rects(self):
+        """Se presenta siempre la pantalla completa."""
+        return None
@@ -1,14 +1,21 @@
 import pygame
+import game.fonts as fonts
+import game.text_cache as text_cache
 import game.ui as ui
 import game.utils as utils
+import game.sprite_variants as sprite_variants
+import game.pokedex_descriptions as pokedex_descriptions
+import game.background_layers as background_layers
+import game.panel_cache as panel_cache
 import time
 
-from game.icons import TypeIcons
+import game.icons as icons
 from game.pokemon import Pokemon
 from game.screen.base_screen import BaseScreen
 
 
 class PokedexScreen(BaseScreen):
+    FONT_SIZES = (30, 24, 20)
 
     REGIONS = ["Kanto", "Johto", "Hoenn", "Sinnoh", "Teselia", "National"]
 
@@ -33,7 +40,7 @@ class PokedexScreen(BaseScreen):
     def __init__(self, player, selected_index=0, region_index=0, current_scroll_position=0):
         super().__init__(player)
         self.current_region_index = region_index
-        self.font = pygame.font.Font(utils.load_font(), 30)
+        self.font = fonts.get_font(30)
 
         # Flechas
         self.arrow_left_rect = None
@@ -52,6 +59,10 @@ class PokedexScreen(BaseScreen):
         self.scroll_timer = 0
         self.scroll_delay = 0.12
 
+        # Lista virtualizada de Pokémon, que empieza en la posición de desplazamiento recibida
+        self.pokemon_list = ui.PokedexList(fonts.get_font(24))
+        self.pokemon_list.scroll_to(self.current_scroll_position, animate=False)
+
         self.footer = ui.Footer(buttons=[{"text": "Data", "icon_path": "../assets/img/keyboard/x_blanco.png"}])
 
     def filter_pokemon_by_region(self):
@@ -119,6 +130,7 @@ class PokedexScreen(BaseScreen):
         self.filtered_pokemon_data = self.filter_pokemon_by_region()  # Actualizar lista filtrada al cambiar de región
         self.current_scroll_position = 0  # Reiniciar la posición de desplazamiento al cambiar de región
         self.selected_index = 0  # Reiniciar el índice seleccionado
+        self.pokemon_list.scroll_to(0, animate=False)
 
     def update(self):
         """Actualiza la pantalla para el desplazamiento continuo."""
@@ -145,7 +157,12 @@ class PokedexScreen(BaseScreen):
                     if self.selected_index < self.current_scroll_position:
                         self.current_scroll_position -= 1
 
-    def draw(self, screen):
+        # Deslizar la lista hasta la posición de desplazamiento actual
+        self.pokemon_list.scroll_to(self.current_scroll_position)
+        self.pokemon_list.update()
+
+    def draw_background(self, screen):
+        """Dibuja la capa estática de la pantalla: fondo, barra de la región y título."""
         screen_width, screen_height = screen.get_size()
         stripe_width = 100
 
@@ -167,12 +184,18 @@ class PokedexScreen(BaseScreen):
                                                       (screen_width // 2 + 73, 53), (0, 53)])
 
         # Dibujar texto pokedex
-        text = self.font.render("POKÉDEX", True, (0, 0, 0))
+        text = text_cache.render(self.font, "POKÉDEX", (0, 0, 0))
         screen.blit(text, (30, 18))
 
+    def draw(self, screen):
+        screen_width, screen_height = screen.get_size()
+
+        # Capa estática (fondo, barra y título), dibujada una sola vez
+        background_layers.draw_static_layer(screen, "pokedex", self.draw_background)
+
         # Dibujar el nombre de la región seleccionada
         region_name = self.REGIONS[self.current_region_index]
-        region_text = self.font.render(region_name, True, (255, 255, 255))
+        region_text = text_cache.render(self.font, region_name, (255, 255, 255))
         screen.blit(region_text, (screen_width // 2 + 210, 18))
 
         # Dibujar flechas a ambos lados del nombre
@@ -187,33 +210,32 @@ class PokedexScreen(BaseScreen):
                                                            (screen_width // 2 + 180, 45)],
                                                           (255, 255, 255))
 
-        # Dibujar Pokémon visibles
-        ui.draw_pokedex_pokemon_slots(screen, self.player, self.filtered_pokemon_data,
-                                      self.REGIONS[self.current_region_index], self.REGION_OFFSETS,
-                                      self.current_scroll_position, self.selected_index,
-                                      pygame.font.Font(utils.load_font(), 24))
+        # Dibujar Pokémon visibles y, en grande, el seleccionado
+        self.pokemon_list.draw(screen, self.player, self.filtered_pokemon_data,
+                               self.REGION_OFFSETS.get(region_name, 0), self.selected_index)
+        ui.draw_pokedex_selected_pokemon(screen, self.player, self.filtered_pokemon_data, self.selected_index)
 
         # Dibujar la barra de desplazamiento
         ui.draw_scroll_bar(screen, self.filtered_pokemon_data,
-                           self.current_scroll_position, 8)
+                           self.pokemon_list.get_scroll_position(), self.pokemon_list.num_visible)
 
         region_range = self.REGION_ID_RANGES[region_name]  # Obtenemos el rango de IDs entre regiones
 
         # Dibujar la insignia de Pokémon avistados
-        ui.draw_pokedex_badges(screen, self.player, 180, 20, pygame.font.Font(utils.load_font(), 20),
+        ui.draw_pokedex_badges(screen, self.player, 180, 20, fonts.get_font(20),
                                region_range, img_path="../assets/img/badges/lupa.png", badge_type="seen")
 
         # Dibujar la insignia de Pokémon capturados
-        ui.draw_pokedex_badges(screen, self.player, 270, 20, pygame.font.Font(utils.load_font(), 20),
+        ui.draw_pokedex_badges(screen, self.player, 270, 20, fonts.get_font(20),
                                region_range, badge_type="captured")
 
         # Dibujar el footer
         self.footer.draw(screen)
 
-        pygame.display.flip()
-
 
 class PokedexDataScreen(BaseScreen):
+    FONT_SIZES = (32, 27, 25, 24)
+
     def __init__(self, player, pokemon, selected_index, region_index, current_scroll_position):
         super().__init__(player)
         self.pokemon = pokemon
@@ -234,6 +256,7 @@ class PokedexDataScreen(BaseScreen):
             if id_range[0] <= p['id'] <= id_range[1] and p['name'].capitalize() in self.player.pokedex_seen
         ]
         self.seen_pokemon_ids = [p['id'] - offset - 1 for p in self.seen_pokemon_data]  # region_id basado en offset
+        self.captured_names = {name.lower() for name in self.player.pokedex_captured}
 
         # Calculamos el índice inicial dentro de `seen_pokemon_data` basado en el `selected_index` original
         self.selected_index = next(
@@ -321,7 +344,11 @@ class PokedexDataScreen(BaseScreen):
         if self.sound_cooldown > 0:
             self.sound_cooldown -= 1 / 20
 
-    def draw(self, screen):
+        # Componer de antemano las fichas vecinas
+        self.prepare_neighbour_panels()
+
+    def draw_background(self, screen):
+        """Dibuja la capa estática de la pantalla: fondo y barra del nombre."""
         screen_width, screen_height = screen.get_size()
         stripe_width = 100
 
@@ -338,11 +365,6 @@ class PokedexDataScreen(BaseScreen):
                                                         (screen_width - 120 - stripe_width, screen_height),
                                                         (882.73, 0), (882.73 + stripe_width,0)])
 
-        # Dibujar el Pokémon seleccionado
-        img_path = f"../assets/pokemon_images/{self.pokemon['name'].lower()}.png"
-        pokemon_image = pygame.transform.scale(pygame.image.load(img_path), (350, 350))
-        screen.blit(pokemon_image, (35, 90))
-
         # Barra con el nombre del Pokémon, su pokédex ID, género e icono.
         pygame.draw.polygon(screen, (0, 0, 0), [(screen_width/2-50, 30), (screen_width-25, 30), (screen_width-25, 75),
                                                 (screen_width/2-50, 75)])
@@ -350,66 +372,114 @@ class PokedexDataScreen(BaseScreen):
                             [(screen_width / 2 - 50, 30), (screen_width / 2 + 100, 30), (472, 75),
                              (screen_width / 2 - 50, 75)])
 
+    def is_captured(self, pokemon):
+        """Indica si el jugador ha capturado la especie."""
+        return pokemon['name'].lower() in self.captured_names
+
+    def get_panel(self, pokemon):
+        """
+        Devuelve la ficha completa de una especie (fondo incluido), componiéndola solo la primera vez.
+
+        Se guarda por especie y estado de captura, así que solo se vuelve a componer si cambia alguno.
+        """
+        captured = self.is_captured(pokemon)
+        return panel_cache.cache.get(("pokedex_data", pokemon['name'], captured), pygame.display.get_surface().get_size(),
+                                     lambda panel: self.draw_panel(panel, pokemon, captured))
+
+    def prepare_neighbour_panels(self):
+        """
+        Compone de antemano la ficha del Pokémon anterior o la del siguiente, para que el cambio sea inmediato.
+
+        Se prepara como mucho una por fotograma, para no alargar ninguno.
+        """
+        for index in (self.selected_index + 1, self.selected_index - 1):
+            if 0 <= index < len(self.seen_pokemon_data):
+                pokemon = self.seen_pokemon_data[index]
+                key = ("pokedex_data", pokemon['name'], self.is_captured(pokemon))
+                if not panel_cache.cache.has(key, pygame.display.get_surface().get_size()):
+                    self.get_panel(pokemon)
+                    return
+
+    def draw_panel(self, screen, pokemon, captured):
+        """
+        Dibuja la ficha de una especie: fondo, imágenes, nombre, número, grito, datos y descripción.
+
+        :param screen: Superficie (del tamaño de la pantalla) en la que se dibuja.
+        :param pokemon: Datos de la especie.
+        :param captured: Si el jugador la ha capturado.
+        """
+        screen_width, screen_height = screen.get_size()
+
+        # Capa estática (fondo y barra del nombre)
+        background_layers.draw_static_layer(screen, "pokedex_data", self.draw_background)
+
+        # Dibujar el Pokémon seleccionado
+        pokemon_image = sprite_variants.get_pokemon_sprite(pokemon['name'], 350)
+        screen.blit(pokemon_image, (35, 90))
+
         # Nombre del Pokémon
-        name_text = pygame.font.Font(utils.load_font(), 32).render(f"{self.pokemon['name'].capitalize()}", True, (255, 255, 255))
+        name_text = text_cache.render(fonts.get_font(32), f"{pokemon['name'].capitalize()}", (255, 255, 255))
         screen.blit(name_text, (screen_width/2+110, 32))
 
         # Numero de pokedex
-        pokedex_id_text = pygame.font.Font(utils.load_font(), 24).render(f"No. {self.pokemon['id']}", True, (255, 255, 255))
+        pokedex_id_text = text_cache.render(fonts.get_font(24), f"No. {pokemon['id']}", (255, 255, 255))
         screen.blit(pokedex_id_text, (screen_width/2+15, 40))
 
         # Icono del pokemon
-        pokemon_image = pygame.transform.scale(pygame.image.load(img_path), (50, 50))
+        pokemon_image = sprite_variants.get_pokemon_sprite(pokemon['name'], 50)
         screen.blit(pokemon_image, (screen_width/2-50, 30))
 
         # Icono de la pokeball (capturado/avistado)
-        if self.pokemon['name'].lower() in (name.lower() for name in self.player.pokedex_captured):
+        if captured:
             pokeball_icon_path = "../assets/img/main_menu/icons/pokeball.png"
         else:
             pokeball_icon_path = "../assets/img/pokemon_menu/pokeball_white.png"
 
         # Cargar y dibujar la imagen de la Poké Ball
-        pokeball_icon = pygame.image.load(pokeball_icon_path)
-        pokeball_icon = pygame.transform.scale(pokeball_icon, (38, 38))
+        pokeball_icon = icons.get_icon(pokeball_icon_path, (38, 38))
         screen.blit(pokeball_icon, (screen_width -90, 32))
 
-        # Dibujamos flechas interactivas para pasar de un pokemon a otro
-        self.arrow_up_rect = ui.draw_interactive_arrow(screen,
-                                                       [(screen_width // 2 + 150, 27), (screen_width // 2 + 162, 17),
-                                                        (screen_width // 2 + 174, 27)], (255, 255, 255))
-        self.arrow_down_rect = ui.draw_interactive_arrow(screen,
-                                                         [(screen_width // 2 + 150, 78), (screen_width // 2 + 162, 88),
-                                                          (screen_width // 2 + 174, 78)], (255, 255, 255))
-
         # Sonido del Pokémon
-        ui.draw_box(screen, f"{self.pokemon['name'].capitalize()}'s Cry", screen_width/2-15, 105, screen_width/2 - 50, 50, font_size=25)
+        ui.draw_box(screen, f"{pokemon['name'].capitalize()}'s Cry", screen_width/2-15, 105, screen_width/2 - 50, 50, font_size=25)
         pokemon_cry_icon_path = f"../assets/img/pokemon_menu/pokemon_cry.png"
-        pokemon_cry_icon = pygame.transform.scale(pygame.image.load(pokemon_cry_icon_path), (40, 40))
+        pokemon_cry_icon = icons.get_icon(pokemon_cry_icon_path, (40, 40))
         screen.blit(pokemon_cry_icon, (screen_width-120, 110))
 
         # Tipos del Pokémon
-        icon_manager = TypeIcons(icon_size=(60, 25))
-        type_icons = [icon_manager.get_icon(pokemon_type.lower()) for pokemon_type in self.pokemon["types"]]
+        icon_manager = icons.get_type_icons(icon_size=(60, 25))
+        type_icons = [icon_manager.get_icon(pokemon_type.lower()) for pokemon_type in pokemon["types"]]
 
-        pokemon_height = int(self.pokemon['physical_attributes']['height']) / 10
-        pokemon_weight = int(self.pokemon['physical_attributes']['weight']) / 10
+        pokemon_height = int(pokemon['physical_attributes']['height']) / 10
+        pokemon_weight = int(pokemon['physical_attributes']['weight']) / 10
 
         pokemon_info = {
             "Type": type_icons,
             "Height": f"{pokemon_height} m",
             "Weight": f"{pokemon_weight} kg",
-            "Capture Rate": (
-        f"{self.pokemon['species']['capture_rate']}"
-        if self.pokemon["name"].lower() in (name.lower() for name in self.player.pokedex_captured)
-        else "??"
-    ),
+            "Capture Rate": f"{pokemon['species']['capture_rate']}" if captured else "??",
         }
 
         ui.draw_box(screen, pokemon_info, screen_width/2-15, 157, screen_width/2 - 50, 190, font_size=27)
 
         # Descripción del Pokémon
-        pokemon_description = self.pokemon["species"]["description"].replace('\n', ' ').replace('\f', ' ')
-        ui.draw_box(screen, pokemon_description, screen_width/2-15, 349, screen_width/2 - 50, 110, font_size=24)
+        # (ya partida en líneas: la primera vista parte las de todas las especies y las guarda junto a sus datos)
+        description_width = screen_width / 2 - 50
+        description_lines = pokedex_descriptions.get_description_lines(pokemon, 24,
+                                                                       int(description_width - 2 * 10))
+        ui.draw_box(screen, description_lines, screen_width/2-15, 349, description_width, 110, font_size=24)
+
+    def draw(self, screen):
+        screen_width, screen_height = screen.get_size()
+
+        # Ficha de la especie (fondo incluido), compuesta una sola vez
+        screen.blit(self.get_panel(self.pokemon), (0, 0))
+
+        # Dibujamos flechas interactivas para pasar de un pokemon a otro
+        self.arrow_up_rect = ui.draw_interactive_arrow(screen,
+                                                       [(screen_width // 2 + 150, 27), (screen_width // 2 + 162, 17),
+                                                        (screen_width // 2 + 174, 27)], (255, 255, 255))
+        self.arrow_down_rect = ui.draw_interactive_arrow(screen,
+                                                         [(screen_width // 2 + 150, 78), (screen_width // 2 + 162, 88),
+                                                          (screen_width // 2 + 174, 78)], (255, 255, 255))
 
         self.footer.draw(screen)
-        pygame.display.flip()
@@ -1,10 +1,19 @@
 import pygame
+import game.fonts as fonts
+import game.glyph_text as glyph_text
+import game.background_layers as background_layers
+import game.panel_cache as panel_cache
+import game.stat_chart as stat_chart
+import game.text_cache as text_cache
 from game import ui, utils
-from game.icons import GenderIcons
+import game.sprite_variants as sprite_variants
+import game.icons as icons
 from game.screen.base_screen import BaseScreen
 
 
 class PokemonMenuScreen(BaseScreen):
+    FONT_SIZES = (65, 24, 20)
+
     def __init__(self, player, combat=None, selected_index=0):
         super().__init__(player)
 
@@ -29,13 +38,15 @@ class PokemonMenuScreen(BaseScreen):
             slot = ui.PokemonSlot(pokemon, slot_rect, selected=(index == self.selected_index))
             self.slots.append(slot)
 
+        # Gráficos de estadísticas del equipo, para que la pestaña de estadísticas se abra al instante
+        stat_chart.prerender_pokemon(self.pokemon_team)
+
         # Imagen de la Pokébola
-        self.pokeball_image = pygame.image.load("../assets/img/main_menu/icons/pokeball.png")
-        self.pokeball_image = pygame.transform.scale(self.pokeball_image, (60, 60))
+        self.pokeball_image = icons.get_icon("../assets/img/main_menu/icons/pokeball.png", (60, 60))
 
         # Fuente para el texto
-        self.font = pygame.font.Font(utils.load_font(), 65)
-        self.pokemon_text_surface = self.font.render("POKÉMON TEAM", True, (0, 0, 0))
+        self.font = fonts.get_font(65)
+        self.pokemon_text_surface = text_cache.render(self.font, "POKÉMON TEAM", (0, 0, 0))
 
         #  Footer y Minimenu
         if self.combat:
@@ -329,10 +340,8 @@ class PokemonMenuScreen(BaseScreen):
         self.show_menu = False
         self.update_preselection()
 
-    def draw(self, screen):
-        """
-        Dibuja la pantalla del menú de Pokémon con los 6 slots.
-        """
+    def draw_background(self, screen):
+        """Dibuja la capa estática de la pantalla: fondo, Pokébola y título."""
         screen_width, screen_height = screen.get_size()
         stripe_width = 100  # El ancho de la franja
         ui.draw_pokemon_background(screen, [(0, 0), (screen_width // 2 + 130, 0), (0, screen_height + 450)],
@@ -351,6 +360,13 @@ class PokemonMenuScreen(BaseScreen):
         text_y = 10
         screen.blit(self.pokemon_text_surface, (text_x, text_y))
 
+    def draw(self, screen):
+        """
+        Dibuja la pantalla del menú de Pokémon con los 6 slots.
+        """
+        # Capa estática (fondo, Pokébola y título), dibujada una sola vez
+        background_layers.draw_static_layer(screen, "pokemon_menu", self.draw_background)
+
         # Dibujar los slots de Pokémon
         for slot in self.slots:
             slot.draw(screen)
@@ -360,8 +376,7 @@ class PokemonMenuScreen(BaseScreen):
             selected_pokemon = self.pokemon_team[self.selected_index]
             if selected_pokemon.image:
                 screen_width, screen_height = screen.get_size()
-                max_image_size = (360, 360)
-                pokemon_image = pygame.transform.scale(selected_pokemon.image, max_image_size)
+                pokemon_image = sprite_variants.get_pokemon_sprite(selected_pokemon.name, 360)
                 x_position = (screen_width - pokemon_image.get_width()) // 2 + 200
                 y_position = (screen_height - pokemon_image.get_height()) // 2 + 50
                 screen.blit(pokemon_image, (x_position, y_position))
@@ -374,14 +389,16 @@ class PokemonMenuScreen(BaseScreen):
         # Dibujar el footer
         self.footer.draw(screen)
 
-        pygame.display.flip()
-
 
 class PokemonDataScreen(BaseScreen):
+    FONT_SIZES = (30, 28, 24, 22)
+
     TAB_INFO = 0
     TAB_STATS = 1
     TAB_MOVES = 2
 
+    MOVES_POSITION = (30, 53)  # Posición de la primera caja de la pestaña de movimientos
+
     def __init__(self, player, pokemon_team, selected_pokemon_index, combat=None):
         super().__init__(player)
 
@@ -396,13 +413,13 @@ class PokemonDataScreen(BaseScreen):
         self.scroll_offset = 0  # Desplazamiento en las cajas de información si es necesario
 
         # Imagen de la Pokébola para el fondo
-        self.pokeball_image = utils.load_image("../assets/img/main_menu/icons/pokeball.png", (26, 26))
+        self.pokeball_image = icons.get_icon("../assets/img/main_menu/icons/pokeball.png", (26, 26))
 
         # Fuente para el texto
-        self.font = pygame.font.Font(utils.load_font(), 30)
+        self.font = fonts.get_font(30)
 
         # Género del Pokémon
-        self.gender_icon = GenderIcons()
+        self.gender_icon = icons.get_gender_icons()
 
         # Flechas
         self.arrow_up_rect = None
@@ -519,12 +536,82 @@ class PokemonDataScreen(BaseScreen):
         self.selected_pokemon = self.pokemon_team[self.selected_pokemon_index]
 
     def update(self):
-        pass
+        # Componer de antemano las pestañas de este Pokémon y de sus vecinos
+        self.prepare_tabs()
+
+    def get_tab_key(self, pokemon, tab):
+        """Clave de una pestaña: el estado del Pokémon del que depende su contenido."""
+        if tab == self.TAB_INFO:
+            return ("info", pokemon.name, tuple(pokemon.types), self.player.name, pokemon.random_id,
+                    pokemon.experience, pokemon.experience_to_next_level)
+        if tab == self.TAB_STATS:
+            return ("stats", pokemon.name, tuple(sorted(pokemon.current_stats.items())),
+                    pokemon.ability['name'], pokemon.ability['effect'])
+        return ("moves", tuple((move['name'], move['type'], move['pp'], move['current_pp']) for move in pokemon.moves))
+
+    def get_tab_rect(self, pokemon, tab):
+        """Zona de la pantalla que ocupa una pestaña (incluidas las sombras)."""
+        if tab == self.TAB_INFO:
+            return pygame.Rect(0, 53, 434, 284)
+        if tab == self.TAB_STATS:
+            return pygame.Rect(0, 53, 434, 430)
+        # El polígono gris de cada caja llega a la fila de su borde inferior, de ahí el píxel de más
+        move_rects = ui.get_move_rects(self.MOVES_POSITION, len(pokemon.moves))
+        return pygame.Rect(0, 53, 430, move_rects[-1].bottom + 1 - 53 if move_rects else 1)
+
+    def get_tab(self, pokemon, tab):
+        """
+        Devuelve una pestaña ya compuesta y la zona de la pantalla donde va.
 
-    def draw(self, screen):
+        Se guarda por el estado del que depende (y no cambia mientras la pantalla está abierta),
+        así que solo se compone la primera vez que se abre para ese Pokémon.
         """
-        Dibuja la pantalla de datos del Pokémon seleccionado.
+        screen_size = pygame.display.get_surface().get_size()
+        tab_rect = self.get_tab_rect(pokemon, tab)
+        key = ("pokemon_data_tab", screen_size, self.get_tab_key(pokemon, tab))
+        surface = panel_cache.cache.get(key, tab_rect.size,
+                                        lambda panel: self.draw_tab(panel, pokemon, tab, tab_rect), alpha=True)
+        return surface, tab_rect
+
+    def draw_tab(self, surface, pokemon, tab, tab_rect):
+        """
+        Dibuja una pestaña en coordenadas de la propia pestaña.
+
+        La superficie es transparente y solo guarda los píxeles de la pestaña: se dibuja encima del
+        sprite del Pokémon, así que no debe tapar con el fondo lo que la pestaña no cubre.
+
+        :param surface: Superficie transparente del tamaño de la pestaña.
+        :param pokemon: Pokémon cuyos datos se muestran.
+        :param tab: Pestaña a dibujar.
+        :param tab_rect: Zona de la pantalla que ocupa la pestaña.
+        """
+        top = 53 - tab_rect.top
+        if tab == self.TAB_INFO:
+            ui.draw_info_tab(surface, pygame.Rect(0, top, 430, 280), 24, pokemon, self.player)
+        elif tab == self.TAB_STATS:
+            ui.draw_stats_tb(surface, pygame.Rect(0, top, 430, 280), 22, pokemon)
+        else:
+            moves_x, moves_y = self.MOVES_POSITION
+            ui.draw_moves_tab(surface, pokemon, (moves_x - tab_rect.left, moves_y - tab_rect.top), 25)
+
+    def prepare_tabs(self):
+        """
+        Compone de antemano las pestañas del Pokémon actual y de los dos vecinos del equipo.
+
+        Se prepara como mucho una pestaña por fotograma, para no alargar ninguno.
         """
+        screen_size = pygame.display.get_surface().get_size()
+        team_size = len(self.pokemon_team)
+        for step in (0, 1, -1):
+            pokemon = self.pokemon_team[(self.selected_pokemon_index + step) % team_size]
+            for tab in (self.TAB_INFO, self.TAB_STATS, self.TAB_MOVES):
+                key = ("pokemon_data_tab", screen_size, self.get_tab_key(pokemon, tab))
+                if not panel_cache.cache.has(key, self.get_tab_rect(pokemon, tab).size):
+                    self.get_tab(pokemon, tab)
+                    return
+
+    def draw_background(self, screen):
+        """Dibuja la capa estática de la pantalla: fondo y barra del nombre con la Pokébola."""
         screen_width, screen_height = screen.get_size()
         stripe_width = 90  # El ancho de la franja
         ui.draw_pokemon_background(screen, [(0, 0), (screen_width // 2 - 50, 0), (0, screen_height + 300)],
@@ -539,12 +626,21 @@ class PokemonDataScreen(BaseScreen):
         # Dibujar la pokeball dentro de la barra.
         screen.blit(self.pokeball_image, (screen_width // 2 + 62, 22))
 
+    def draw(self, screen):
+        """
+        Dibuja la pantalla de datos del Pokémon seleccionado.
+        """
+        screen_width, screen_height = screen.get_size()
+
+        # Capa estática (fondo y barra del nombre), dibujada una sola vez
+        background_layers.draw_static_layer(screen, "pokemon_data", self.draw_background)
+
         # Dibujar el nombre y nivel del Pokémon
-        name_text = self.font.render(f"{self.selected_pokemon.name}", True, (255, 255, 255))
-        font_level = pygame.font.Font(utils.load_font(), 28)
-        level_text = font_level.render(f"Nv. {self.selected_pokemon.level}", True, (255, 255, 255))
+        name_text = text_cache.render(self.font, f"{self.selected_pokemon.name}", (255, 255, 255))
+        font_level = fonts.get_font(28)
         screen.blit(name_text, (screen_width // 2 + 120, 15))
-        screen.blit(level_text, (screen_width // 2 + 255, 17))
+        glyph_text.draw_text(screen, font_level, f"Nv. {self.selected_pokemon.level}", (255, 255, 255),
+                             topleft=(screen_width // 2 + 255, 17))
 
         # Dibujar el género del pokémon
         ui.draw_gender_icon(screen, self.gender_icon, self.selected_pokemon, screen_width - 65, 20)
@@ -553,8 +649,7 @@ class PokemonDataScreen(BaseScreen):
         # Dibujar el Pokémon seleccionado en el centro-derecha de la pantalla
         if self.selected_pokemon.image:
             screen_width, screen_height = screen.get_size()
-            max_image_size = (360, 360)
-            pokemon_image = pygame.transform.scale(self.selected_pokemon.image, max_image_size)
+            pokemon_image = sprite_variants.get_pokemon_sprite(self.selected_pokemon.name, 360)
             x_position = (screen_width - pokemon_image.get_width()) // 2 + 200
             y_position = (screen_height - pokemon_image.get_height()) // 2 + 50
             screen.blit(pokemon_image, (x_position, y_position))
@@ -576,17 +671,15 @@ class PokemonDataScreen(BaseScreen):
         ui.draw_interactive_icon(screen, "../assets/img/pokemon_menu/stats.png", (34, 34), (120, 10))
         ui.draw_interactive_icon(screen, "../assets/img/pokemon_menu/moves.png", (39, 39), (168, 9))
 
-        # Dibujar los menus
-        if self.current_tab == self.TAB_INFO:
-            ui.draw_info_tab(screen, pygame.Rect(0, 53, 430, 280), 24, self.selected_pokemon, self.player)
-        elif self.current_tab == self.TAB_STATS:
-            ui.draw_stats_tb(screen, pygame.Rect(0, 53, 430, 280), 22, self.selected_pokemon)
-        elif self.current_tab == self.TAB_MOVES:
-            self.move_rects = ui.draw_moves_tab(screen, self.selected_pokemon, (30, 53),
-                                                25, self.selected_move_index)
+        # Dibujar la pestaña abierta (ya compuesta); la selección del movimiento se dibuja encima
+        tab_surface, tab_rect = self.get_tab(self.selected_pokemon, self.current_tab)
+        screen.blit(tab_surface, tab_rect)
+        if self.current_tab == self.TAB_MOVES:
+            self.move_rects = ui.get_move_rects(self.MOVES_POSITION, len(self.selected_pokemon.moves))
 
             if self.selected_move_index is not None:
                 move = self.selected_pokemon.moves[self.selected_move_index]
+                ui.draw_move_box(screen, move, self.move_rects[self.selected_move_index], 25, selected=True)
 
                 text_values = {
                     "Class": move.get('damage_class', 'N/A'),
@@ -603,8 +696,6 @@ class PokemonDataScreen(BaseScreen):
         # Dibujar el footer
         self.footer.draw(screen)
 
-        pygame.display.flip()
-
 
 class PcScreen(BaseScreen):
     def __init__(self, player):
@@ -634,4 +725,3 @@ class PcScreen(BaseScreen):
     def draw(self, screen):
         screen.fill((255, 255, 255))
         self.footer.draw(screen)
-        pygame.display.flip()
@@ -1,24 +1,26 @@
 import pygame
+import game.fonts as fonts
 from game import utils, ui
 from game.dialogue_manager import DialogueManager, TextDisplayManager
 from game.screen.base_screen import BaseScreen
 
 
 class SaveGameScreen(BaseScreen):
+    FONT_SIZES = (35,)
+
     def __init__(self, player):
         super().__init__(player)
 
         # Cargar imagen de fondo
-        self.background = utils.load_image("../assets/img/main_menu/fondo.png")
-        self.background = pygame.transform.scale(self.background, (
-            pygame.display.get_surface().get_width(), pygame.display.get_surface().get_height()))
+        self.background = utils.load_image("../assets/img/main_menu/fondo.png",
+                                           pygame.display.get_surface().get_size(), convert="opaque")
 
         # Gestión de diálogos
-        self.dialogue_manager = DialogueManager("../game/data/dialogues.json")
+        self.dialogue_manager = DialogueManager()
         self.dialogue_manager.set_context('save_game')
         self.dialog_stage = 'save_prompt'
         self.current_line_index = 0
-        self.text_display_manager = TextDisplayManager(pygame.font.Font(utils.load_font(), 35))
+        self.text_display_manager = TextDisplayManager(fonts.get_font(35))
 
         # Estado inicial
         self.show_confirmation = False
@@ -84,5 +86,3 @@ class SaveGameScreen(BaseScreen):
                 box_width=140,
                 box_height=140
             )
-
-        pygame.display.flip()
@@ -1,4 +1,6 @@
 import pygame
+import game.ui as ui
+from game.asset_warmup import create_default_warmup
 from game.screen.base_screen import BaseScreen
 from game.screen.load_game_screen import LoadGameScreen
 from game.screen.oak_intro_screen import OakIntroScreen
@@ -6,10 +8,11 @@ from game.utils import load_image, load_font, render_text
 
 
 class TitleScreen(BaseScreen):
+    FONT_SIZES = (25, 55)
 
     def __init__(self):
         super().__init__(None)
-        self.background_image = load_image("../assets/img/title/fondo.png", (800, 600))
+        self.background_image = load_image("../assets/img/title/fondo.png", (800, 600), convert="opaque")
         self.logo_image = load_image("../assets/img/title/logo_pokemon.png", (600, 250))
         self.pikachu_image = load_image("../assets/pokemon_images/pikachu.png", (350, 350))
         self.font_path = load_font()
@@ -22,6 +25,10 @@ class TitleScreen(BaseScreen):
         # Música
         self.sound_manager.play_music("opening")
 
+        # Precarga del resto de recursos mientras se muestra la pantalla de título
+        self.warmup = create_default_warmup()
+        self.warmup.start()
+
         # Inicializamos un jugador a none
         self.player = None
 
@@ -43,6 +50,8 @@ class TitleScreen(BaseScreen):
     def handle_events(self, event):
         """Maneja los eventos del teclado."""
         if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+            if not self.warmup.is_done():
+                self.warmup.finish()  # El jugador no espera a la barra de carga: se termina la precarga ya
             self.sound_manager.stop_music()
 
             if self.check_if_player_id_exists():
@@ -52,7 +61,10 @@ class TitleScreen(BaseScreen):
         return self
 
     def update(self):
-        """Actualiza la pantalla, incluyendo el parpadeo del texto."""
+        """Actualiza la pantalla, incluyendo el parpadeo del texto y la precarga de recursos."""
+        if not self.warmup.is_done():
+            self.warmup.poll()
+
         current_time = pygame.time.get_ticks()
         if current_time - self.blink_time >= self.blink_interval:
             self.blink = not self.blink
@@ -63,6 +75,8 @@ class TitleScreen(BaseScreen):
         screen.blit(self.background_image, (0, 0))
         screen.blit(self.logo_image, self.logo_image.get_rect(center=(400, 100)))
         screen.blit(self.pikachu_image, self.pikachu_image.get_rect(center=(400, 350)))
-        if self.blink:
+        if not self.warmup.is_done():
+            ui.draw_loading_bar(screen, (200, 505, 400, 24), self.warmup.progress)
+        elif self.blink:
             screen.blit(self.press_enter_text, self.press_enter_text.get_rect(center=(400, 520)))
         screen.blit(self.developer_text, self.developer_text.get_rect(bottomleft=(10, 590)))
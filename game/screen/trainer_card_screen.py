@@ -1,5 +1,6 @@
 import pygame
 from game import utils, ui
+import game.image_cache as image_cache
 from game.screen.base_screen import BaseScreen
 from game.ui import Footer
 
@@ -17,7 +18,7 @@ class TrainerCardScreen(BaseScreen):
         screen_width, screen_height = pygame.display.get_surface().get_size()
         card_width = int(screen_width * 0.95)
         card_height = int(self.trainer_card.get_height() * (card_width / self.trainer_card.get_width()))
-        self.trainer_card = pygame.transform.scale(self.trainer_card, (card_width, card_height))
+        self.trainer_card = image_cache.accelerate(pygame.transform.scale(self.trainer_card, (card_width, card_height)))
 
         # Calcular la posición para centrar la ficha en la pantalla
         self.trainer_card_rect = self.trainer_card.get_rect(center=(screen_width // 2, screen_height // 2))
@@ -59,6 +60,10 @@ class TrainerCardScreen(BaseScreen):
     def update(self):
         pass
 
+    def get_dirty_rects(self):
+        """Pantalla estática: tras el primer fotograma no hay nada que volver a presentar."""
+        return []
+
     def draw(self, screen):
         # Rellenar el fondo con el color en lugar de usar una imagen
         screen.fill(self.background_color)
@@ -69,9 +74,6 @@ class TrainerCardScreen(BaseScreen):
         # Dibujar el footer
         self.footer.draw(screen)
 
-        # Actualizar la pantalla
-        pygame.display.flip()
-
 
 class BadgesScreen(BaseScreen):
     def __init__(self, player):
@@ -100,8 +102,11 @@ class BadgesScreen(BaseScreen):
     def update(self):
         pass
 
+    def get_dirty_rects(self):
+        """Pantalla estática: tras el primer fotograma no hay nada que volver a presentar."""
+        return []
+
     def draw(self, screen):
         screen.fill(self.background_color)
 
         self.footer.draw(screen)
-        pygame.display.flip()
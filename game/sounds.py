@@ -1,6 +1,18 @@
 import random
 import pygame
 
+# Sonidos ya decodificados, compartidos por todas las pantallas: ruta -> pygame.mixer.Sound
+sound_cache = {}
+
+
+def load_sound(path):
+    """Carga un sonido una sola vez y devuelve siempre el mismo objeto para la misma ruta."""
+    sound = sound_cache.get(path)
+    if sound is None:
+        sound = pygame.mixer.Sound(path)
+        sound_cache[path] = sound
+    return sound
+
 
 def is_music_playing():
     """Verifica si hay música en curso."""
@@ -23,9 +35,9 @@ class SoundManager:
             "vitory": "../assets/sound/music/vitory.mp3"
         }
         self.sound_effects = {
-            "level_up": pygame.mixer.Sound("../assets/sound/sound_effect/level_up.mp3"),
-            "click_button": pygame.mixer.Sound("../assets/sound/sound_effect/click_button.mp3"),
-            "button_8": pygame.mixer.Sound("../assets/sound/sound_effect/button-8.mp3"),
+            "level_up": load_sound("../assets/sound/sound_effect/level_up.mp3"),
+            "click_button": load_sound("../assets/sound/sound_effect/click_button.mp3"),
+            "button_8": load_sound("../assets/sound/sound_effect/button-8.mp3"),
         }
 
         # Inicialización de lista de música para el menú
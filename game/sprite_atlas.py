@@ -0,0 +1,224 @@
+import json
+import math
+import os
+
+import numpy
+import pygame
+from PIL import Image
+
+import game.asset_manifest as asset_manifest
+import game.image_cache as image_cache
+
+SPRITE_DIRECTORY = "../assets/pokemon_images"  # Artwork original de cada especie
+ATLAS_DIRECTORY = "../assets/atlas"  # Hojas generadas por build_atlases()
+ATLAS_INDEX_FILE = "index.json"
+
+ATLAS_SIZES = (42, 48)  # Tamaños de las listas: slots del equipo y Pokédex
+MAX_SHEET_SIZE = 2048  # Lado máximo de cada hoja
+SILHOUETTE_COLOR = (60, 60, 70)  # Color de las siluetas de las especies no avistadas
+SILHOUETTE_SIZES = (48,)  # Siluetas que se preparan en bloque: lista del Pokédex
+
+
+def build_atlases(sizes=ATLAS_SIZES, source_directory=SPRITE_DIRECTORY, output_directory=ATLAS_DIRECTORY,
+                  max_sheet_size=MAX_SHEET_SIZE):
+    """
+    Empaqueta todo el artwork de los Pokémon en unas pocas hojas por resolución.
+
+    Genera una o varias hojas PNG por tamaño y un índice JSON que relaciona el nombre
+    de cada especie con la hoja y el rectángulo que ocupa dentro de ella.
+
+    :param sizes: Tamaños (en píxeles) a los que se empaquetan los sprites.
+    :param source_directory: Directorio con las imágenes originales.
+    :param output_directory: Directorio donde se guardan las hojas y el índice.
+    :param max_sheet_size: Lado máximo de cada hoja.
+    :return: El índice generado.
+    """
+    os.makedirs(output_directory, exist_ok=True)
+    names = sorted(os.path.splitext(filename)[0] for filename in os.listdir(source_directory)
+                   if filename.lower().endswith('.png'))
+
+    index = {}
+    for size in sizes:
+        columns = max_sheet_size // size
+        sprites_per_sheet = columns * columns
+        sheet_count = math.ceil(len(names) / sprites_per_sheet)
+        size_index = {"sheets": [], "sprites": {}}
+
+        for sheet_number in range(sheet_count):
+            sheet_names = names[sheet_number * sprites_per_sheet:(sheet_number + 1) * sprites_per_sheet]
+            rows = math.ceil(len(sheet_names) / columns)
+            sheet = Image.new("RGBA", (min(len(sheet_names), columns) * size, rows * size), (0, 0, 0, 0))
+
+            for i, name in enumerate(sheet_names):
+                x, y = (i % columns) * size, (i // columns) * size
+                with Image.open(os.path.join(source_directory, f"{name}.png")) as image:
+                    sheet.paste(image.convert("RGBA").resize((size, size), Image.Resampling.LANCZOS), (x, y))
+                size_index["sprites"][name] = [sheet_number, x, y, size, size]
+
+            sheet_filename = f"pokemon_{size}_{sheet_number}.png"
+            sheet.save(os.path.join(output_directory, sheet_filename), optimize=True)
+            size_index["sheets"].append(sheet_filename)
+
+        index[str(size)] = size_index
+        print(f"Atlas de {size}px generado: {len(names)} sprites en {sheet_count} hoja(s).")
+
+    with open(os.path.join(output_directory, ATLAS_INDEX_FILE), 'w') as file:
+        json.dump(index, file)
+
+    asset_manifest.rebuild_manifest()
+    return index
+
+
+def make_silhouette(surface, color=SILHOUETTE_COLOR):
+    """
+    Genera la silueta de una superficie: mismo canal alfa y todo el color sustituido por `color`.
+
+    La operación se hace con NumPy sobre los píxeles, así que aplicada a una hoja del atlas
+    genera de una vez las siluetas de todas las especies que contiene.
+
+    :param surface: Superficie con transparencia (un sprite o una hoja entera).
+    :param color: Color RGB de la silueta.
+    :return: Una superficie nueva con la silueta.
+    """
+    silhouette = surface.copy()
+    pixels = pygame.surfarray.pixels3d(silhouette)
+    pixels[...] = numpy.array(color, dtype=numpy.uint8)
+    del pixels  # Libera el bloqueo de la superficie
+    return silhouette
+
+
+class SpriteAtlas:
+    def __init__(self, directory=ATLAS_DIRECTORY, sprite_directory=SPRITE_DIRECTORY):
+        """
+        Cargador de sprites empaquetados en hojas.
+
+        Devuelve vistas (subsurface) de hojas residentes en memoria, de forma que todos los
+        sprites de una resolución se dibujan desde la misma superficie.
+
+        :param directory: Directorio donde están las hojas y el índice.
+        :param sprite_directory: Directorio con las imágenes originales, usado si falta el atlas.
+        """
+        self.directory = directory
+        self.sprite_directory = sprite_directory
+        self.index = None  # Se lee la primera vez que se pide un sprite
+        self.sheets = {}  # nombre de la hoja -> superficie
+        self.sprites = {}  # (nombre, tamaño) -> subsurface
+        self.silhouette_sheets = {}  # nombre de la hoja -> hoja con las siluetas
+        self.silhouettes = {}  # (nombre, tamaño) -> subsurface de la hoja de siluetas
+
+    def load_index(self):
+        """
+        Lee el índice del atlas. Si no se ha generado, el atlas queda vacío.
+
+        Se descartan los tamaños a los que les falta alguna hoja: esas especies salen de la imagen original.
+        """
+        index_path = os.path.join(self.directory, ATLAS_INDEX_FILE)
+        if not os.path.exists(index_path):
+            return {}
+        with open(index_path, 'r') as file:
+            index = json.load(file)
+        return {size: size_index for size, size_index in index.items()
+                if all(asset_manifest.exists(os.path.join(self.directory, sheet_filename))
+                       for sheet_filename in size_index["sheets"])}
+
+    def has_size(self, size):
+        """Indica si existe una hoja para el tamaño dado."""
+        if self.index is None:
+            self.index = self.load_index()
+        return str(size) in self.index
+
+    def has_sprite(self, name, size):
+        """Indica si una especie está empaquetada en el atlas de un tamaño."""
+        return self.has_size(size) and name.lower() in self.index[str(size)]["sprites"]
+
+    def get_sheet(self, sheet_filename):
+        """Devuelve una hoja, cargándola una sola vez."""
+        sheet = self.sheets.get(sheet_filename)
+        if sheet is None:
+            sheet = image_cache.ImageCache.load(os.path.join(self.directory, sheet_filename), "alpha")
+            self.sheets[sheet_filename] = sheet
+        return sheet
+
+    def get_sprite(self, name, size):
+        """
+        Devuelve el sprite de una especie al tamaño dado.
+
+        :param name: Nombre de la especie.
+        :param size: Lado del sprite en píxeles.
+        :return: Una vista de la hoja o, si la especie no está en el atlas, la imagen escalada desde
+                 la caché de imágenes. None si no existe ninguna imagen.
+        """
+        key = (name.lower(), int(size))
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            return sprite
+
+        if not self.has_sprite(*key):
+            # Sin atlas para este tamaño: la caché de imágenes escala la imagen original una sola vez
+            try:
+                return image_cache.load_image(os.path.join(self.sprite_directory, f"{key[0]}.png"),
+                                              (key[1], key[1]))
+            except FileNotFoundError:
+                return None
+
+        size_index = self.index[str(key[1])]
+        sheet_number, x, y, width, height = size_index["sprites"][key[0]]
+        sheet = self.get_sheet(size_index["sheets"][sheet_number])
+        sprite = sheet.subsurface(pygame.Rect(x, y, width, height))
+        self.sprites[key] = sprite
+        return sprite
+
+    def prepare_silhouettes(self, size):
+        """Genera de una vez las siluetas de todas las especies de un tamaño (una operación por hoja)."""
+        if not self.has_size(size):
+            return
+        for sheet_filename in self.index[str(size)]["sheets"]:
+            if sheet_filename not in self.silhouette_sheets:
+                self.silhouette_sheets[sheet_filename] = make_silhouette(self.get_sheet(sheet_filename))
+
+    def get_silhouette(self, name, size):
+        """
+        Devuelve la silueta de una especie al tamaño dado.
+
+        :param name: Nombre de la especie.
+        :param size: Lado del sprite en píxeles.
+        :return: Una vista de la hoja de siluetas o, si la especie no está en el atlas, la silueta
+                 de la imagen escalada (generada una sola vez). None si no existe ninguna imagen.
+        """
+        key = (name.lower(), int(size))
+        silhouette = self.silhouettes.get(key)
+        if silhouette is not None:
+            return silhouette
+
+        if not self.has_sprite(*key):
+            sprite = self.get_sprite(*key)
+            if sprite is None:
+                return None
+            return image_cache.cache.get_or_create(("silhouette",) + key,
+                                                   lambda: image_cache.accelerate(make_silhouette(sprite)))
+
+        size_index = self.index[str(key[1])]
+        sheet_number, x, y, width, height = size_index["sprites"][key[0]]
+        self.prepare_silhouettes(key[1])
+        silhouette = self.silhouette_sheets[size_index["sheets"][sheet_number]].subsurface(
+            pygame.Rect(x, y, width, height))
+        self.silhouettes[key] = silhouette
+        return silhouette
+
+
+# Atlas compartido por todas las pantallas
+atlas = SpriteAtlas()
+
+
+def get_pokemon_sprite(name, size):
+    """Devuelve el sprite de una especie al tamaño dado desde el atlas compartido."""
+    return atlas.get_sprite(name, size)
+
+
+def get_pokemon_silhouette(name, size):
+    """Devuelve la silueta de una especie al tamaño dado desde el atlas compartido."""
+    return atlas.get_silhouette(name, size)
+
+
+if __name__ == '__main__':
+    build_atlases()
@@ -0,0 +1,198 @@
+import os
+
+import pygame
+from PIL import Image
+
+import game.asset_manifest as asset_manifest
+import game.image_cache as image_cache
+import game.sprite_atlas as sprite_atlas
+
+VARIANT_DIRECTORY = "../assets/sprites"  # Variantes generadas por build_variants(), una carpeta por tamaño
+
+# Tamaños a los que la interfaz dibuja el artwork y que no están en el atlas:
+# caja de guardado, cabecera del Pokédex, combate (enemigo y jugador), Pokédex y menú del equipo.
+VARIANT_SIZES = (40, 50, 190, 285, 350, 360)
+
+# Tamaños sin atlas para los que también se generan las siluetas (imagen grande de la Pokédex).
+# Se guardan en la subcarpeta "silhouettes" de las variantes de ese tamaño.
+SILHOUETTE_VARIANT_SIZES = (350,)
+SILHOUETTE_DIRECTORY = "silhouettes"
+
+
+def build_variants(sizes=VARIANT_SIZES, source_directory=sprite_atlas.SPRITE_DIRECTORY,
+                   output_directory=VARIANT_DIRECTORY, silhouette_sizes=SILHOUETTE_VARIANT_SIZES):
+    """
+    Genera el artwork de cada especie reescalado (con filtro de calidad) a los tamaños que usa la interfaz.
+
+    :param sizes: Tamaños (en píxeles) a generar.
+    :param source_directory: Directorio con las imágenes originales.
+    :param output_directory: Directorio donde se guarda cada tamaño en su propia carpeta.
+    :param silhouette_sizes: Tamaños (de entre sizes) para los que también se guarda la silueta.
+    """
+    for size in sizes:
+        os.makedirs(os.path.join(output_directory, str(size)), exist_ok=True)
+        if size in silhouette_sizes:
+            os.makedirs(os.path.join(output_directory, str(size), SILHOUETTE_DIRECTORY), exist_ok=True)
+
+    filenames = sorted(filename for filename in os.listdir(source_directory) if filename.lower().endswith('.png'))
+    for filename in filenames:
+        with Image.open(os.path.join(source_directory, filename)) as image:
+            image = image.convert("RGBA")
+            for size in sizes:
+                resized = image.resize((size, size), Image.Resampling.LANCZOS)
+                resized.save(os.path.join(output_directory, str(size), filename), optimize=True)
+                if size in silhouette_sizes:
+                    # Misma silueta que sprite_atlas.make_silhouette: el alfa de la variante con un solo color
+                    silhouette = Image.new("RGBA", resized.size, sprite_atlas.SILHOUETTE_COLOR + (255,))
+                    silhouette.putalpha(resized.getchannel("A"))
+                    silhouette.save(os.path.join(output_directory, str(size), SILHOUETTE_DIRECTORY, filename),
+                                    optimize=True)
+
+    print(f"Generadas {len(filenames)} variantes en los tamaños {', '.join(str(size) for size in sizes)}.")
+    asset_manifest.rebuild_manifest()
+
+
+class SpriteVariants:
+    def __init__(self, directory=VARIANT_DIRECTORY, atlas=sprite_atlas.atlas):
+        """
+        Busca el artwork de una especie entre los tamaños preparados en la compilación.
+
+        Elige el tamaño preparado más cercano por encima (para reducir en vez de ampliar) y solo
+        reescala la pequeña diferencia restante; si ninguno es tan grande, parte de la imagen original.
+        El resultado queda en la caché de imágenes.
+
+        :param directory: Directorio de las variantes generadas.
+        :param atlas: Atlas de sprites, cuyos tamaños también cuentan como preparados.
+        """
+        self.directory = directory
+        self.atlas = atlas
+        self.variant_sizes = None  # Se buscan la primera vez que se pide un sprite
+        self.sources = {}  # (nombre, tamaño) -> origen del sprite, resuelto una sola vez
+
+    def load_variant_sizes(self):
+        """Devuelve los tamaños para los que existe una carpeta de variantes."""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(int(name) for name in os.listdir(self.directory) if name.isdigit())
+
+    def prepared_sizes(self):
+        """Devuelve todos los tamaños preparados (variantes y atlas) ordenados de menor a mayor."""
+        if self.variant_sizes is None:
+            self.variant_sizes = self.load_variant_sizes()
+        atlas_sizes = [size for size in sprite_atlas.ATLAS_SIZES if self.atlas.has_size(size)]
+        return sorted(set(self.variant_sizes) | set(atlas_sizes))
+
+    def nearest_size(self, size):
+        """Devuelve el tamaño preparado más cercano por encima, o None si ninguno es tan grande."""
+        larger_sizes = [prepared for prepared in self.prepared_sizes() if prepared >= size]
+        return larger_sizes[0] if larger_sizes else None
+
+    def find_source(self, name, size):
+        """
+        Decide de qué imagen preparada sale el sprite de una especie para un tamaño.
+
+        :return: Tupla (tipo, ruta, tamaño preparado) con tipo "variant", "atlas" u "original",
+                 o None si la especie no tiene imagen.
+        """
+        source = self.find_prepared(name, self.nearest_size(size))
+        if source is not None:
+            return source
+
+        # Sin variante suficientemente grande: se parte de la imagen original
+        original_path = os.path.join(sprite_atlas.SPRITE_DIRECTORY, f"{name}.png")
+        if asset_manifest.exists(original_path):
+            return "original", original_path, None
+
+        # Sin imagen original, como último recurso se amplía el mayor tamaño preparado
+        sizes = self.prepared_sizes()
+        return self.find_prepared(name, sizes[-1]) if sizes else None
+
+    def find_prepared(self, name, prepared_size):
+        """Devuelve el origen (tipo, ruta, tamaño) de una especie en un tamaño preparado, o None si no está."""
+        if prepared_size is None:
+            return None
+        if prepared_size in self.variant_sizes:
+            variant_path = os.path.join(self.directory, str(prepared_size), f"{name}.png")
+            if asset_manifest.exists(variant_path):
+                return "variant", variant_path, prepared_size
+        if self.atlas.has_sprite(name, prepared_size):
+            return "atlas", None, prepared_size
+        return None
+
+    def get_source(self, name, size):
+        """Devuelve el origen del sprite (ver find_source), resolviéndolo una sola vez por especie y tamaño."""
+        key = (name, size)
+        if key not in self.sources:
+            self.sources[key] = self.find_source(name, size)
+        return self.sources[key]
+
+    def get_sprite(self, name, size):
+        """
+        Devuelve el artwork de una especie al tamaño pedido.
+
+        :param name: Nombre de la especie.
+        :param size: Lado del sprite en píxeles.
+        :return: La superficie escalada o None si la especie no tiene imagen.
+        """
+        key = (name.lower(), int(size))
+        source = self.get_source(*key)
+        if source is None:
+            return None
+
+        kind, path, prepared_size = source
+        if prepared_size == key[1]:
+            return self.atlas.get_sprite(key[0], prepared_size) if kind == "atlas" else image_cache.load_image(path)
+
+        def scale_remaining():
+            if kind == "atlas":
+                prepared = self.atlas.get_sprite(key[0], prepared_size)
+            else:
+                prepared = image_cache.load_image(path)
+            return image_cache.accelerate(pygame.transform.smoothscale(prepared, (key[1], key[1])))
+
+        return image_cache.cache.get_or_create(("sprite",) + key, scale_remaining)
+
+    def get_silhouette(self, name, size):
+        """
+        Devuelve la silueta de una especie al tamaño pedido.
+
+        Sale de las hojas de siluetas del atlas, generadas en bloque para todas las especies, o de las
+        siluetas generadas junto a las variantes (SILHOUETTE_VARIANT_SIZES). Solo si no se han generado
+        se calcula, una sola vez, a partir del sprite de ese tamaño.
+
+        :param name: Nombre de la especie.
+        :param size: Lado de la silueta en píxeles.
+        :return: La superficie con la silueta o None si la especie no tiene imagen.
+        """
+        key = (name.lower(), int(size))
+        atlas_sizes = [atlas_size for atlas_size in sprite_atlas.ATLAS_SIZES if self.atlas.has_size(atlas_size)]
+        if key[1] in atlas_sizes:
+            return self.atlas.get_silhouette(*key)
+
+        silhouette_path = os.path.join(self.directory, str(key[1]), SILHOUETTE_DIRECTORY, f"{key[0]}.png")
+        if asset_manifest.exists(silhouette_path):
+            return image_cache.load_image(silhouette_path)
+
+        if self.get_source(*key) is None:
+            return None
+        return image_cache.cache.get_or_create(
+            ("silhouette",) + key,
+            lambda: image_cache.accelerate(sprite_atlas.make_silhouette(self.get_sprite(*key))))
+
+
+# Variantes compartidas por todas las pantallas
+variants = SpriteVariants()
+
+
+def get_pokemon_sprite(name, size):
+    """Devuelve el artwork de una especie al tamaño pedido a partir de los tamaños preparados."""
+    return variants.get_sprite(name, size)
+
+
+def get_pokemon_silhouette(name, size):
+    """Devuelve la silueta de una especie al tamaño pedido."""
+    return variants.get_silhouette(name, size)
+
+
+if __name__ == '__main__':
+    build_variants()
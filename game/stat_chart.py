@@ -0,0 +1,141 @@
+import math
+from collections import OrderedDict
+
+import numpy
+import pygame
+
+import game.image_cache as image_cache
+
+# Estadísticas del gráfico, en el orden de los vértices (empezando por arriba y en el sentido de las agujas del reloj)
+STAT_KEYS = ("hp", "attack", "defense", "speed", "special-defense", "special-attack")
+STAT_LABELS = ("HP", "Attack", "Defense", "Speed", "Sp. Defense", "Sp. Attack")
+
+# Hexágono unidad: (cos, sin) de cada vértice, con el primero arriba. Se calcula una sola vez.
+UNIT_HEXAGON = tuple((math.cos(math.radians(60 * i - 90)), math.sin(math.radians(60 * i - 90)))
+                     for i in range(len(STAT_KEYS)))
+
+MAX_STAT = 400  # Valor de una estadística que llega hasta el vértice
+SUPERSAMPLING = 4  # El gráfico se dibuja a este múltiplo de tamaño y se reduce para suavizar los bordes
+MAX_CHARTS = 64  # Gráficos renderizados que se guardan como máximo
+
+
+def get_stat_values(pokemon):
+    """Devuelve las estadísticas actuales de un Pokémon en el orden de los vértices del gráfico."""
+    return tuple(pokemon.current_stats[key] for key in STAT_KEYS)
+
+
+def get_vertices(center, radius, ratios=None):
+    """
+    Calcula los vértices de un hexágono a partir del hexágono unidad.
+
+    :param center: Centro (x, y) del hexágono.
+    :param radius: Distancia del centro a los vértices.
+    :param ratios: Proporción del radio para cada vértice (None para el hexágono completo).
+    :return: Lista de vértices (x, y).
+    """
+    center_x, center_y = center
+    if ratios is None:
+        ratios = (1,) * len(UNIT_HEXAGON)
+    return [(center_x + radius * ratio * cos, center_y + radius * ratio * sin)
+            for (cos, sin), ratio in zip(UNIT_HEXAGON, ratios)]
+
+
+class StatChartRenderer:
+    def __init__(self, max_charts=MAX_CHARTS):
+        """
+        Renderizador del gráfico hexagonal de estadísticas.
+
+        Cada gráfico (hexágono base, polígono de las estadísticas y radios) se dibuja una sola vez por
+        vector de estadísticas, suavizado: se dibuja a SUPERSAMPLING veces el tamaño y se reduce con
+        smoothscale. Se guardan por (estadísticas, radio, colores, máximo), así que volver a abrir las
+        estadísticas de un Pokémon solo cuesta un blit.
+
+        :param max_charts: Número máximo de gráficos guardados.
+        """
+        self.max_charts = max_charts
+        self.charts = OrderedDict()  # clave -> superficie
+
+    @staticmethod
+    def make_key(stat_values, radius, base_color, stat_color, max_stat):
+        """Clave de un gráfico (los colores se normalizan a tuplas)."""
+        return tuple(stat_values), int(radius), tuple(base_color), tuple(stat_color), max_stat
+
+    def render(self, stat_values, radius, base_color=(200, 200, 200), stat_color=(0, 0, 255), max_stat=MAX_STAT):
+        """
+        Devuelve el gráfico de unas estadísticas, renderizándolo solo la primera vez.
+
+        :param stat_values: Valores de las estadísticas en el orden de STAT_KEYS.
+        :param radius: Radio del hexágono base.
+        :param base_color: Color del hexágono base y de los radios.
+        :param stat_color: Color del polígono de las estadísticas.
+        :param max_stat: Valor de una estadística que llega hasta el vértice.
+        :return: Superficie transparente y cuadrada con el hexágono centrado (compartida, no debe modificarse).
+        """
+        key = self.make_key(stat_values, radius, base_color, stat_color, max_stat)
+        chart = self.charts.get(key)
+        if chart is not None:
+            self.charts.move_to_end(key)
+            return chart
+
+        chart = self.draw_chart(*key)
+        self.charts[key] = chart
+        while len(self.charts) > self.max_charts:
+            self.charts.popitem(last=False)
+        return chart
+
+    @staticmethod
+    def draw_chart(stat_values, radius, base_color, stat_color, max_stat):
+        """Dibuja un gráfico suavizado (sin caché)."""
+        ratios = [value / max_stat for value in stat_values]
+        margin = 3  # Hueco para el grosor del borde del hexágono base
+        size = 2 * (math.ceil(radius * max(1, *ratios)) + margin)
+        scale = SUPERSAMPLING
+        large = pygame.Surface((size * scale, size * scale), pygame.SRCALPHA)
+        center = (size * scale / 2, size * scale / 2)
+
+        # Hexágono base (el máximo de las estadísticas), polígono de las estadísticas y radios encima
+        base_vertices = get_vertices(center, radius * scale)
+        pygame.draw.polygon(large, base_color, base_vertices, 3 * scale)
+        pygame.draw.polygon(large, stat_color, get_vertices(center, radius * scale, ratios))
+        for vertex in base_vertices:
+            pygame.draw.line(large, base_color, center, vertex, 2 * scale)
+
+        chart = pygame.transform.smoothscale(large, (size, size))
+
+        # Al reducir, los bordes se mezclan con el negro de los píxeles transparentes: se recupera su color
+        alpha = pygame.surfarray.array_alpha(chart)
+        edges = (alpha > 0) & (alpha < 255)
+        pixels = pygame.surfarray.pixels3d(chart)
+        pixels[edges] = numpy.minimum(pixels[edges].astype(numpy.uint32) * 255 // alpha[edges][:, None], 255)
+        del pixels
+
+        if pygame.display.get_surface() is not None:
+            chart = image_cache.accelerate(chart.convert_alpha())
+        return chart
+
+    def prerender(self, stat_vectors, radius, **colors):
+        """
+        Renderiza de una vez los gráficos de varios vectores de estadísticas (un equipo, una caja del PC).
+
+        :param stat_vectors: Vectores de estadísticas en el orden de STAT_KEYS.
+        :param radius: Radio del hexágono base.
+        :param colors: Colores y máximo, como en render().
+        """
+        for stat_values in stat_vectors:
+            self.render(stat_values, radius, **colors)
+
+
+# Renderizador único para todo el juego
+renderer = StatChartRenderer()
+
+CHART_RADIUS = 93  # Radio del gráfico en la pestaña de estadísticas (un tercio del alto del recuadro)
+
+
+def get_chart(stat_values, radius=CHART_RADIUS, **colors):
+    """Devuelve el gráfico de unas estadísticas desde el renderizador compartido."""
+    return renderer.render(stat_values, radius, **colors)
+
+
+def prerender_pokemon(pokemons, radius=CHART_RADIUS):
+    """Renderiza de antemano los gráficos de estadísticas de varios Pokémon (un equipo, una caja del PC)."""
+    renderer.prerender([get_stat_values(pokemon) for pokemon in pokemons], radius)
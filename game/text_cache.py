@@ -0,0 +1,94 @@
+import os
+from collections import OrderedDict
+
+import pygame
+
+import game.image_cache as image_cache
+
+MAX_TEXT_ENTRIES = 1024  # Textos renderizados que se guardan como máximo
+
+# Con POKEMON_DEBUG_TEXT=1 se muestran los aciertos de la caché de textos al cerrar el juego
+DEBUG_TEXT_STATS = os.getenv("POKEMON_DEBUG_TEXT") == "1"
+
+
+class TextCache:
+    def __init__(self, max_entries=MAX_TEXT_ENTRIES):
+        """
+        Caché de textos ya renderizados, compartida por toda la interfaz.
+
+        font.render es de lo más costoso de cada fotograma y casi todas las etiquetas se repiten
+        fotograma tras fotograma, así que cada combinación (fuente, texto, color, antialias, fondo)
+        se renderiza una sola vez. Cuando se supera el máximo se descarta la menos usada recientemente.
+
+        :param max_entries: Número máximo de textos guardados.
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # clave -> superficie del texto
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(font, text, color, antialias=True, background=None):
+        """Clave de un texto renderizado (los colores se normalizan a tuplas)."""
+        return (font, str(text), tuple(color), bool(antialias), None if background is None else tuple(background))
+
+    def render(self, font, text, color, antialias=True, background=None):
+        """
+        Devuelve el texto renderizado, renderizándolo solo la primera vez.
+
+        :param font: Fuente con la que se renderiza (normalmente una fuente compartida de game.fonts).
+        :param text: Texto a renderizar.
+        :param color: Color del texto.
+        :param antialias: Si se suaviza el texto.
+        :param background: Color de fondo o None para fondo transparente.
+        :return: La superficie del texto (compartida, no debe modificarse).
+        """
+        key = self.make_key(font, text, color, antialias, background)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(key[1], antialias, color, background)
+        if pygame.display.get_surface() is not None:
+            # En el formato de la pantalla el blit es directo en cada fotograma
+            if surface.get_flags() & pygame.SRCALPHA:
+                surface = image_cache.accelerate(surface.convert_alpha())
+            else:
+                surface = surface.convert()
+        self.entries[key] = surface
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Vacía la caché y sus contadores."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        """Devuelve el número de textos guardados, los aciertos, los fallos y la tasa de aciertos."""
+        requests = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+        }
+
+
+# Caché única para todo el juego
+cache = TextCache()
+
+
+def render(font, text, color, antialias=True, background=None):
+    """Devuelve un texto renderizado desde la caché compartida."""
+    return cache.render(font, text, color, antialias, background)
+
+
+def get_stats():
+    """Devuelve las estadísticas de la caché de textos compartida."""
+    return cache.get_stats()
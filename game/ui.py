@@ -1,23 +1,48 @@
-import os
+from collections import OrderedDict
 import pygame
 import pygame.gfxdraw
-import math
+import numpy
 
 import game.utils as utils
-from game.icons import TypeIcons, GenderIcons
+import game.fonts as fonts
+import game.glyph_text as glyph_text
+import game.line_breaking as line_breaking
+import game.text_cache as text_cache
+import game.image_cache as image_cache
+import game.sprite_variants as sprite_variants
+import game.icons as icons
+import game.ui_chrome as ui_chrome
+import game.stat_chart as stat_chart
+
+GRADIENT_END_COLOR = (135, 206, 250)  # Color en el que terminan los degradados de los botones
+BUTTON_SHADOW_OFFSET = 3  # Desplazamiento de la sombra de los botones
+
+
+def make_gradient(size, start_color, end_color):
+    """
+    Genera una superficie con un degradado vertical de `start_color` a `end_color`.
+
+    Los colores de todas las filas se calculan de una vez con NumPy y se copian a la superficie con
+    surfarray, en lugar de dibujar una línea por fila.
+
+    :param size: Tamaño (ancho, alto) de la superficie.
+    :param start_color: Color de la primera fila.
+    :param end_color: Color hacia el que se degrada en la última fila.
+    :return: Una superficie opaca nueva.
+    """
+    width, height = size
+    surface = pygame.Surface(size)
+    ratios = numpy.arange(height)[:, None] / height
+    rows = (numpy.array(start_color[:3]) * (1 - ratios) + numpy.array(end_color[:3]) * ratios).astype(numpy.uint8)
+    pygame.surfarray.blit_array(surface, numpy.broadcast_to(rows[None, :, :], (width, height, 3)))
+    return surface
 
 
 def draw_gradient(screen, start_color, end_color, rect):
     """Dibuja un degradado vertical de `start_color` a `end_color` en el rectángulo."""
-    r1, g1, b1 = start_color
-    r2, g2, b2 = end_color
-    for i in range(rect.height):
-        # Interpolar entre el color inicial y final
-        ratio = i / rect.height
-        r = int(r1 * (1 - ratio) + r2 * ratio)
-        g = int(g1 * (1 - ratio) + g2 * ratio)
-        b = int(b1 * (1 - ratio) + b2 * ratio)
-        pygame.draw.line(screen, (r, g, b), (rect.x, rect.y + i), (rect.x + rect.width, rect.y + i))
+    rect = pygame.Rect(rect)
+    # Cada fila abarca desde rect.x hasta rect.right incluido, como una línea de ese ancho
+    screen.blit(make_gradient((rect.width + 1, rect.height), start_color, end_color), rect.topleft)
 
 
 class Button:
@@ -35,35 +60,59 @@ class Button:
         self.image = image
         self.is_hovered = False
 
-        if self.image:
-            self.image = pygame.transform.scale(self.image, (50, 50))
+        if self.image and self.image.get_size() != (50, 50):
+            self.image = image_cache.accelerate(pygame.transform.scale(self.image, (50, 50)))
 
-    def draw(self, screen):
-        """Dibuja el botón en pantalla con efectos avanzados."""
-        # Cambiar el color de fondo si el ratón está sobre el botón
-        current_color = self.hover_color if self.is_hovered else self.bg_color
+    def render_state(self, surface, color):
+        """
+        Dibuja el fondo del botón en uno de sus estados: degradado, borde con brillo y sombra.
+
+        :param surface: Superficie transparente del tamaño del botón más la sombra.
+        :param color: Color con el que empieza el degradado (normal o con el ratón encima).
+        """
+        width, height = self.rect.size
 
         # Fondo con degradado avanzado para darle profundidad (de azul claro a más oscuro)
-        draw_gradient(screen, current_color, (135, 206, 250), self.rect)
+        body = make_gradient((width + 1, height), color, GRADIENT_END_COLOR)
 
         # Bordes con brillo alrededor del botón
-        pygame.gfxdraw.rectangle(screen, self.rect, self.border_color)
+        pygame.gfxdraw.rectangle(body, (0, 0, width, height), self.border_color)
 
-        # Dibujar sombra ligera para dar efecto 3D
-        shadow_rect = self.rect.copy()
-        shadow_rect.move_ip(3, 3)  # Desplazar la sombra ligeramente
-        pygame.gfxdraw.box(screen, shadow_rect, (*self.shadow_color, 100))  # Sombra semi-transparente
+        # Sombra ligera para dar efecto 3D: semitransparente fuera del botón y mezclada sobre él
+        shadow_rect = pygame.Rect(BUTTON_SHADOW_OFFSET, BUTTON_SHADOW_OFFSET, width, height)
+        pygame.gfxdraw.box(body, shadow_rect, (*self.shadow_color, 100))
+        surface.fill((*self.shadow_color, 100), shadow_rect)
+        surface.blit(body, (0, 0))
+
+    def get_state_surface(self, hovered):
+        """Devuelve el fondo del botón ya dibujado para el estado indicado (compartido entre botones iguales)."""
+        color = self.hover_color if hovered else self.bg_color
+        style = ("button", tuple(color), tuple(self.border_color), tuple(self.shadow_color))
+        size = (self.rect.width + BUTTON_SHADOW_OFFSET, self.rect.height + BUTTON_SHADOW_OFFSET)
+        return ui_chrome.cache.get(style, size, lambda surface: self.render_state(surface, color))
+
+    def draw(self, screen):
+        """Dibuja el botón en pantalla con efectos avanzados."""
+        # Fondo (degradado, borde y sombra) del estado actual, dibujado una sola vez
+        screen.blit(self.get_state_surface(self.is_hovered), self.rect.topleft)
 
         # Dibujar la imagen si está disponible
         if self.image:
             image_rect = self.image.get_rect(center=(self.rect.centerx, self.rect.centery - 20))  # Subir la imagen
+            image_cache.check_blit(self.image, "Button")
             screen.blit(self.image, image_rect)
 
         # Dibujar el texto centrado debajo de la imagen
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = text_cache.render(self.font, self.text, self.text_color)
         text_rect = text_surf.get_rect(center=(self.rect.centerx, self.rect.centery + 25))
         screen.blit(text_surf, text_rect)
 
+    def get_bounds(self):
+        """Zona de la pantalla que ocupa el botón al dibujarlo (incluidos la sombra y el texto)."""
+        text_surf = text_cache.render(self.font, self.text, self.text_color)
+        text_rect = text_surf.get_rect(center=(self.rect.centerx, self.rect.centery + 25))
+        return self.rect.union(self.rect.move(BUTTON_SHADOW_OFFSET, BUTTON_SHADOW_OFFSET)).union(text_rect)
+
     def is_clicked(self, mouse_pos):
         """Detecta si el botón ha sido clicado."""
         return self.rect.collidepoint(mouse_pos)
@@ -85,15 +134,21 @@ def draw_combat_background(screen, position=(0, 449), width=800, height=151, col
     :param border: Grosor del borde (en este caso, para la línea negra superior).
     """
     x, y = position
+    # Las líneas del borde sobresalen por arriba (y por la derecha) del recuadro
+    overhang = border // 2
+
+    def render(surface):
+        # 1. Dibujar el fondo principal con el color de relleno
+        pygame.draw.rect(surface, color, (0, overhang, width, height))
 
-    # 1. Dibujar el fondo principal con el color de relleno
-    pygame.draw.rect(screen, color, (x, y, width, height))
+        # 2. Dibujar una línea gris en la parte superior del fondo (borde superior)
+        pygame.draw.line(surface, (80, 80, 80), (0, overhang), (width, overhang), border)
 
-    # 2. Dibujar una línea gris en la parte superior del fondo (borde superior)
-    pygame.draw.line(screen, (80, 80, 80), (x, y), (x + width, y), border)
+        # 3. Dibujar una línea negra fina sobre la línea gris (parte superior) de 2 píxeles
+        pygame.draw.line(surface, (0, 0, 0), (0, overhang), (width, overhang), 2)
 
-    # 3. Dibujar una línea negra fina sobre la línea gris (parte superior) de 2 píxeles
-    pygame.draw.line(screen, (0, 0, 0), (x, y), (x + width, y), 2)
+    ui_chrome.draw_chrome(screen, (x, y - overhang), ("combat_background", tuple(color), border),
+                          (width + 1, height + overhang), render)
 
 
 def draw_dialog_box(screen, position=(4, 456), box_width=792, box_height=140,
@@ -124,84 +179,47 @@ def draw_dialog_box(screen, position=(4, 456), box_width=792, box_height=140,
     :param inner_fill_radius: Radio del borde de la caja interna (muy sutil).
     """
     x, y = position
+    style = ("dialog_box", tuple(outer_border_color), tuple(inner_border_color), border_thickness,
+             inner_border_thickness, side_inner_border_thickness, top_bottom_inner_border_thickness,
+             tuple(fill_color), outer_border_radius, inner_border_radius, inner_fill_radius)
+    # Todo lo que no es uniforme (bordes y esquinas redondeadas) cabe en las esquinas de la caja mínima
+    inset = (border_thickness + inner_border_thickness + side_inner_border_thickness
+             + top_bottom_inner_border_thickness + max(outer_border_radius, inner_border_radius, inner_fill_radius))
+
+    def render(dialog_surface):
+        box_width, box_height = dialog_surface.get_size()
+
+        # Dibujar el borde negro exterior muy sutil
+        pygame.draw.rect(dialog_surface, (0, 0, 0), (0, 0, box_width, box_height),
+                         border_radius=outer_border_radius, width=border_thickness)
+
+        # Dibujar el borde dorado justo dentro del negro
+        pygame.draw.rect(dialog_surface, outer_border_color,
+                         (border_thickness, border_thickness, box_width - 2 * border_thickness,
+                          box_height - 2 * border_thickness),
+                         border_radius=outer_border_radius, width=inner_border_thickness)
+
+        # Dibujar el borde grisáceo interior (más grueso a los lados, más delgado arriba y abajo)
+        inner_rect = pygame.Rect(
+            border_thickness + inner_border_thickness,  # Empieza después del borde negro y dorado
+            border_thickness + top_bottom_inner_border_thickness,  # Ajuste arriba
+            box_width - 2 * (border_thickness + inner_border_thickness),  # Ajustar el ancho
+            box_height - 2 * top_bottom_inner_border_thickness - 4
+        )
+        pygame.draw.rect(dialog_surface, inner_border_color, inner_rect,
+                         border_radius=inner_border_radius, width=side_inner_border_thickness)
+
+        # Dibujar el relleno blanco dentro del cuadro de diálogo (casi sin radius)
+        fill_rect = pygame.Rect(
+            border_thickness + inner_border_thickness + side_inner_border_thickness,  # Ajuste en los lados
+            border_thickness + top_bottom_inner_border_thickness + inner_border_thickness,  # Ajuste arriba
+            box_width - 2 * (border_thickness + inner_border_thickness + side_inner_border_thickness),  # Ajustar el ancho
+            box_height - 2 * (top_bottom_inner_border_thickness + inner_border_thickness + 3)
+        )
+        pygame.draw.rect(dialog_surface, fill_color, fill_rect, border_radius=inner_fill_radius)
 
-    # Crear la superficie para el cuadro de diálogo
-    dialog_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-
-    # Dibujar el borde negro exterior muy sutil
-    pygame.draw.rect(dialog_surface, (0, 0, 0), (0, 0, box_width, box_height),
-                     border_radius=outer_border_radius, width=border_thickness)
-
-    # Dibujar el borde dorado justo dentro del negro
-    pygame.draw.rect(dialog_surface, outer_border_color,
-                     (border_thickness, border_thickness, box_width - 2 * border_thickness,
-                      box_height - 2 * border_thickness),
-                     border_radius=outer_border_radius, width=inner_border_thickness)
-
-    # Dibujar el borde grisáceo interior (más grueso a los lados, más delgado arriba y abajo)
-    inner_rect = pygame.Rect(
-        border_thickness + inner_border_thickness,  # Empieza después del borde negro y dorado
-        border_thickness + top_bottom_inner_border_thickness,  # Ajuste arriba
-        box_width - 2 * (border_thickness + inner_border_thickness),  # Ajustar el ancho
-        box_height - 2 * top_bottom_inner_border_thickness - 4
-    )
-    pygame.draw.rect(dialog_surface, inner_border_color, inner_rect,
-                     border_radius=inner_border_radius, width=side_inner_border_thickness)
-
-    # Dibujar el relleno blanco dentro del cuadro de diálogo (casi sin radius)
-    fill_rect = pygame.Rect(
-        border_thickness + inner_border_thickness + side_inner_border_thickness,  # Ajuste en los lados
-        border_thickness + top_bottom_inner_border_thickness + inner_border_thickness,  # Ajuste arriba
-        box_width - 2 * (border_thickness + inner_border_thickness + side_inner_border_thickness),  # Ajustar el ancho
-        box_height - 2 * (top_bottom_inner_border_thickness + inner_border_thickness + 3)
-    )
-    pygame.draw.rect(dialog_surface, fill_color, fill_rect, border_radius=inner_fill_radius)
-
-    # Blit del cuadro de diálogo en la superficie principal
-    screen.blit(dialog_surface, (x, y))
-
-
-def draw_text_in_dialog_box(screen, text, font, position, box_width=780, box_height=150,
-                            text_color=(0, 0, 0), padding=20, line_spacing=10, vertical_offset=-15):
-    """
-    Dibuja el texto dentro del cuadro de diálogo.
-
-    :param screen: La superficie en la que dibujar el texto.
-    :param text: El texto que se va a dibujar.
-    :param font: La fuente para el texto.
-    :param position: Una tupla (x, y) que representa la posición del cuadro de diálogo.
-    :param box_width: El ancho del cuadro de diálogo.
-    :param box_height: La altura del cuadro de diálogo.
-    :param text_color: Color del texto.
-    :param padding: Espacio alrededor del texto dentro del cuadro de diálogo.
-    :param line_spacing: Espacio adicional entre las líneas de texto.
-    :param vertical_offset: Desplazamiento vertical adicional para el inicio del texto.
-    """
-    x, y = position
-
-    # Dividir el texto en líneas si es necesario
-    words = text.split(' ')
-    lines = []
-    current_line = ""
-
-    for word in words:
-        test_line = current_line + word + " "
-        if font.size(test_line)[0] > box_width - 2 * padding:
-            lines.append(current_line)
-            current_line = word + " "
-        else:
-            current_line = test_line
-    lines.append(current_line)
-
-    # Calcular el espacio disponible para el texto
-    total_text_height = len(lines) * (font.get_height() + line_spacing) - line_spacing
-    y_start = y + padding + (box_height - total_text_height) / 2 + vertical_offset
-
-    # Dibujar el texto dentro del cuadro de diálogo
-    for i, line in enumerate(lines):
-        text_surface = font.render(line, True, text_color)
-        text_rect = text_surface.get_rect(topleft=(x + padding, y_start + i * (font.get_height() + line_spacing)))
-        screen.blit(text_surface, text_rect)
+    # Blit del cuadro de diálogo (compuesto una sola vez por estilo y tamaño) en la superficie principal
+    ui_chrome.draw_chrome(screen, (x, y), style, (box_width, box_height), render, inset)
 
 
 class HealthBar:
@@ -223,7 +241,7 @@ class HealthBar:
         self.target_hp = current_hp  # Para la animación suave
         self.rect = pygame.Rect(rect)
         self.text_color = text_color
-        self.font = pygame.font.Font('../assets/fonts/pokemon.ttf', font_size)
+        self.font = fonts.get_font(font_size)
         self.bar_color = bar_color
         self.background_color = background_color
         self.selected = selected
@@ -281,10 +299,10 @@ class HealthBar:
         hp_text_color = (255, 255, 255) if self.selected else self.text_color
 
         # Dibuja texto de HP debajo de la barra
+        # (el número cambia en cada paso de la animación, así que se compone desde el atlas de glifos)
         hp_text = f"{self.current_hp}/{self.max_hp}"
-        text_surface = self.font.render(hp_text, True, hp_text_color)
-        text_rect = text_surface.get_rect(midtop=(self.rect.x + 25, self.rect.bottom + 3))  # Justo debajo de la barra
-        screen.blit(text_surface, text_rect)
+        glyph_text.draw_text(screen, self.font, hp_text, hp_text_color,
+                             midtop=(self.rect.x + 25, self.rect.bottom + 3))  # Justo debajo de la barra
 
 
 class PokemonSlot:
@@ -301,11 +319,11 @@ class PokemonSlot:
         self.selected = selected  # Estado de selección
 
         # Fuente para el texto
-        self.font = pygame.font.Font('../assets/fonts/pokemon.ttf', 24)
-        self.level_font = pygame.font.Font('../assets/fonts/pokemon.ttf', 20)
+        self.font = fonts.get_font(24)
+        self.level_font = fonts.get_font(20)
 
         # Género del Pokémon
-        self.gender_icon = GenderIcons(icon_size=(20, 20))
+        self.gender_icon = icons.get_gender_icons(icon_size=(20, 20))
 
         # Inicializar la barra de salud si el Pokémon existe
         if pokemon:
@@ -344,9 +362,9 @@ class PokemonSlot:
 
         if self.pokemon:
             # Dibujar la imagen del Pokémon
-            if self.pokemon.image:
-                pokemon_image = pygame.transform.scale(self.pokemon.image,
-                                                       (self.rect.height * 0.6, self.rect.height * 0.6))
+            pokemon_image = sprite_variants.get_pokemon_sprite(self.pokemon.name, self.rect.height * 0.6)
+            if pokemon_image:
+                image_cache.check_blit(pokemon_image, "PokemonSlot")
                 screen.blit(pokemon_image, (self.rect.x + 10, self.rect.y + self.rect.height * 0.2))
 
             # Actualizar el color del texto en la barra de salud
@@ -355,7 +373,7 @@ class PokemonSlot:
             self.health_bar.draw(screen)
 
             # Dibujar el nombre del Pokémon
-            name_text = self.font.render(self.pokemon.name, True, text_color)
+            name_text = text_cache.render(self.font, self.pokemon.name, text_color)
             screen.blit(name_text, (self.rect.x + self.rect.width * 0.20, self.rect.y + self.rect.height * 0.1))
 
             # Dibujar el icono del género del Pokémon a la derecha de la barra de vida
@@ -364,11 +382,11 @@ class PokemonSlot:
                              self.rect.y + (self.rect.height * 0.125))
 
             # Dibujar el nivel del Pokémon
-            level_text = self.level_font.render(f"Nv. {self.pokemon.level}", True, text_color)
-            screen.blit(level_text, (self.rect.x + self.rect.width * 0.75, self.rect.y + self.rect.height * 0.6))
+            glyph_text.draw_text(screen, self.level_font, f"Nv. {self.pokemon.level}", text_color,
+                                 topleft=(self.rect.x + self.rect.width * 0.75, self.rect.y + self.rect.height * 0.6))
         else:
             # Si no hay Pokémon, dibujar un placeholder o simplemente dejarlo vacío
-            placeholder_text = self.font.render("Empty Slot", True, (150, 150, 150))
+            placeholder_text = text_cache.render(self.font, "Empty Slot", (150, 150, 150))
             screen.blit(placeholder_text, self.rect.move(10, 10))
 
 
@@ -378,7 +396,7 @@ class Footer:
         """
         Inicializa el footer con el icono, el texto y botones adicionales.
         """
-        self.font = pygame.font.Font(font_path, font_size)
+        self.font = fonts.get_font(font_size, font_path)
         self.footer_height = 25
         self.screen_width = screen_width
         self.footer_color = footer_color
@@ -386,14 +404,14 @@ class Footer:
         # Botón principal (por defecto "Back")
         self.main_button = {
             "text": text,
-            "icon": pygame.transform.scale(pygame.image.load(icon_path), (20, 20))
+            "icon": icons.get_icon(icon_path, (20, 20))
         }
 
         # Botones adicionales, si los hay
         self.buttons = []
         if buttons:
             for button in buttons:
-                icon = pygame.transform.scale(pygame.image.load(button['icon_path']), (20, 20))
+                icon = icons.get_icon(button['icon_path'], (20, 20))
                 self.buttons.append({"text": button['text'], "icon": icon})
 
         # Footer rectangle
@@ -417,7 +435,7 @@ class Footer:
 
         # Posición del botón principal (Back)
         self.icon_positions.append((icon_x, icon_y))
-        text_surface = self.font.render(self.main_button['text'], True, (255, 255, 255))
+        text_surface = text_cache.render(self.font, self.main_button['text'], (255, 255, 255))
         text_rect = text_surface.get_rect(midleft=(icon_x + 30, self.footer_rect.y + self.footer_height // 2))
         self.text_rects.append((text_surface, text_rect))
 
@@ -427,7 +445,7 @@ class Footer:
 
             icon_y = self.footer_rect.y + (self.footer_height - button['icon'].get_height()) // 2
             self.icon_positions.append((icon_x, icon_y))
-            text_surface = self.font.render(button['text'], True, (255, 255, 255))
+            text_surface = text_cache.render(self.font, button['text'], (255, 255, 255))
             text_rect = text_surface.get_rect(midleft=(icon_x + 30, self.footer_rect.y + self.footer_height // 2))
             self.text_rects.append((text_surface, text_rect))
 
@@ -440,17 +458,14 @@ class Footer:
 
         # Dibujar los botones: primero los iconos y luego los textos
         for i, (icon_pos, text_data) in enumerate(zip(self.icon_positions, self.text_rects)):
-            if i == 0:
-                screen.blit(self.main_button['icon'], icon_pos)
-            else:
-                screen.blit(self.buttons[i - 1]['icon'], icon_pos)
+            icon = self.main_button['icon'] if i == 0 else self.buttons[i - 1]['icon']
+            image_cache.check_blit(icon, "Footer")
+            screen.blit(icon, icon_pos)
 
             # Dibuja el texto del botón
             text_surface, text_rect = text_data
             screen.blit(text_surface, text_rect)
 
-        pygame.display.flip()
-
     def handle_events(self, event):
         """
         Maneja eventos.
@@ -476,7 +491,7 @@ class MiniMenu:
         self.background_color = (255, 255, 255)  # Blanco
         self.font_color = (0, 0, 0)  # Negro
         self.font_size = font_size
-        self.font = pygame.font.Font(font_path, font_size)
+        self.font = fonts.get_font(font_size, font_path)
         self.options = options if options else ["Data", "Move", "Back"]
         self.border_radius = 10
         self.show = False
@@ -507,7 +522,7 @@ class MiniMenu:
 
         # Dibujar el texto en el mini menú con flecha para la opción seleccionada
         for i, option in enumerate(self.options):
-            text_surface = self.font.render(option, True, self.font_color)
+            text_surface = text_cache.render(self.font, option, self.font_color)
             text_rect = text_surface.get_rect(
                 topleft=(self.position[0] + 30, self.position[1] + 10 + i * (self.font_size + 5)))
 
@@ -516,7 +531,7 @@ class MiniMenu:
 
             # Dibuja la flecha `>` al lado de la opción seleccionada
             if i == self.selected_index:  # Ajusta el índice según la opción preseleccionada
-                arrow_surface = self.font.render('>', True, self.font_color)
+                arrow_surface = text_cache.render(self.font, '>', self.font_color)
                 arrow_rect = arrow_surface.get_rect(
                     topleft=(self.position[0] + 10, self.position[1] + 10 + i * (self.font_size + 5)))
                 screen.blit(arrow_surface, arrow_rect)
@@ -533,7 +548,7 @@ class MiniMenu:
         """ Verifica si se ha hecho clic en una de las opciones del mini menú. """
         for i, option in enumerate(self.options):
             # Obtener la posición y tamaño de la opción
-            text_surface = self.font.render(option, True, self.font_color)
+            text_surface = text_cache.render(self.font, option, self.font_color)
             text_rect = text_surface.get_rect(topleft=(self.position[0] + 10,
                                                        self.position[1] + 10 + i * (self.font_size + 5)))
             if text_rect.collidepoint(mouse_pos):
@@ -574,14 +589,11 @@ def draw_pokemon_background(screen, triangle_points, stripe_points, img_position
     if extra_stripe_points:
         pygame.draw.polygon(screen, stripe_color, extra_stripe_points)
 
-    # Dibujar la imagen de fondo.
-    image = pygame.image.load(img_path)
-
-    # Escalar la imagen de la Pokéball a 600px
-    img_scaled = pygame.transform.scale(image, img_size)
-
-    # Girar la imagen de la Pokéball un poco (por ejemplo, 15 grados)
-    img_rotated = pygame.transform.rotate(img_scaled, angle_rotation)
+    # Cargar la imagen de fondo ya escalada y girada (por ejemplo, 15 grados) desde la caché
+    img_rotated = image_cache.cache.get_or_create(
+        ("rotated", img_path, tuple(img_size), angle_rotation),
+        lambda: image_cache.accelerate(pygame.transform.rotate(image_cache.load_image(img_path, img_size),
+                                                               angle_rotation)))
 
     # Obtener el rectángulo de la imagen rotada para centrarla correctamente
     img_rect = img_rotated.get_rect()
@@ -591,6 +603,23 @@ def draw_pokemon_background(screen, triangle_points, stripe_points, img_position
     screen.blit(img_rotated, img_rect.topleft)
 
 
+def draw_loading_bar(screen, rect, progress, bar_color=(255, 203, 5), background_color=(40, 40, 40),
+                     border_color=(255, 255, 255)):
+    """
+    Dibuja una barra de carga.
+
+    :param screen: Superficie donde se dibuja.
+    :param rect: Rectángulo que ocupa la barra.
+    :param progress: Progreso entre 0.0 y 1.0.
+    """
+    rect = pygame.Rect(rect)
+    pygame.draw.rect(screen, background_color, rect, border_radius=rect.height // 2)
+    filled_width = int(rect.width * max(0.0, min(progress, 1.0)))
+    if filled_width > 0:
+        pygame.draw.rect(screen, bar_color, (rect.x, rect.y, filled_width, rect.height), border_radius=rect.height // 2)
+    pygame.draw.rect(screen, border_color, rect, 2, border_radius=rect.height // 2)
+
+
 def draw_interactive_arrow(screen, coords, color, action=None):
     """
     Dibuja un triángulo interactivo en la pantalla y ejecuta una acción si se hace clic en él.
@@ -625,9 +654,9 @@ def draw_interactive_icon(screen, image_path, image_size, coords, action=None):
         :param action: Función que se ejecuta cuando se hace clic en el icono.
         """
 
-    icon = pygame.image.load(image_path)
-    icon = pygame.transform.scale(icon, image_size)
+    icon = icons.get_icon(image_path, image_size)
 
+    image_cache.check_blit(icon, "draw_interactive_icon")
     screen.blit(icon, coords, action)
 
 
@@ -642,10 +671,15 @@ def draw_rect_with_shadow(screen, rect, shadow_offset=4, shadow_color=(100, 100,
     :param border_color: Color del borde del rectángulo.
     """
     x, y, width, height = rect
-    shadow_surface = pygame.Surface((width + shadow_offset, height + shadow_offset), pygame.SRCALPHA)
-    pygame.draw.rect(shadow_surface, shadow_color, (shadow_offset, shadow_offset, width, height))
-    screen.blit(shadow_surface, (x, y))
-    pygame.draw.rect(screen, border_color, rect)
+
+    def render(surface):
+        # Sombra desplazada y, encima, el recuadro opaco
+        rect_width, rect_height = surface.get_width() - shadow_offset, surface.get_height() - shadow_offset
+        pygame.draw.rect(surface, shadow_color, (shadow_offset, shadow_offset, rect_width, rect_height))
+        pygame.draw.rect(surface, border_color, (0, 0, rect_width, rect_height))
+
+    ui_chrome.draw_chrome(screen, (x, y), ("rect_with_shadow", shadow_offset, tuple(shadow_color), tuple(border_color)),
+                          (width + shadow_offset, height + shadow_offset), render, max(1, shadow_offset))
 
 
 def draw_info_tab(screen, rect, font_size, pokemon, player):
@@ -673,7 +707,7 @@ def draw_info_tab(screen, rect, font_size, pokemon, player):
     for i in range(1, 6):
         pygame.draw.line(screen, dark_gray, (x, y + i * section_height), (x + width, y + i * section_height), 2)
 
-    font = pygame.font.Font("../assets/fonts/pokemon.ttf", font_size)
+    font = fonts.get_font(font_size)
 
     # Contenido de las celdas
     labels = [
@@ -687,7 +721,7 @@ def draw_info_tab(screen, rect, font_size, pokemon, player):
 
     # Renderizar el texto en la mitad izquierda del recuadro
     for i, label in enumerate(labels):
-        text_surface = font.render(label, True, text_color)
+        text_surface = text_cache.render(font, label, text_color)
         text_rect = text_surface.get_rect()
         text_rect.centerx = x + width // 4  # Centro horizontalmente en la mitad izquierda
         text_rect.centery = y + (i + 0.5) * section_height  # Centro verticalmente en la sección correspondiente
@@ -703,7 +737,7 @@ def draw_info_tab(screen, rect, font_size, pokemon, player):
         pokemon.experience_to_next_level
     ]
 
-    icon_manager = TypeIcons(icon_size=(75, 30))
+    icon_manager = icons.get_type_icons(icon_size=(75, 30))
     for i, info in enumerate(data):
         if i == 1:  # Para el tipo del Pokémon
             # Mostrar imágenes en lugar de texto para el tipo
@@ -719,7 +753,7 @@ def draw_info_tab(screen, rect, font_size, pokemon, player):
                     screen.blit(icon, (icon_x, icon_y))
                     icon_x += icon.get_width() + 5  # Espacio entre iconos
         else:
-            text_surface = font.render(str(info), True, text_color)
+            text_surface = text_cache.render(font, str(info), text_color)
             text_rect = text_surface.get_rect()
             text_rect.left = x + width // 2 + 10  # Posición desde el borde izquierdo de la mitad derecha
             text_rect.centery = y + (i + 0.5) * section_height  # Centro verticalmente en la sección correspondiente
@@ -751,66 +785,27 @@ def draw_stats_tb(screen, rect, font_size, pokemon):
     center_y = y + height // 2
     radius = min(width, height) // 3  # Radio del hexágono
 
-    # Estadísticas del Pokémon
-    stats = {
-        "HP": pokemon.current_stats["hp"],
-        "Attack": pokemon.current_stats["attack"],
-        "Defense": pokemon.current_stats["defense"],
-        "Speed": pokemon.current_stats["speed"],
-        "Sp. Defense": pokemon.current_stats["special-defense"],
-        "Sp. Attack": pokemon.current_stats["special-attack"]
-    }
+    # Estadísticas del Pokémon, en el orden de los vértices
+    stat_values = stat_chart.get_stat_values(pokemon)
 
-    max_stat = 400  # Valor máximo de cada estadística
-
-    # Nombres de las estadísticas
-    stat_labels = list(stats.keys())
-
-    # Calcular las posiciones de los vértices del hexágono base
-    def get_vertex_positions(center_x, center_y, radius, offset=0):
-        positions = []
-        for i in range(6):
-            angle_deg = 60 * i - 90 + offset  # Rotamos 90 grados para que el vértice superior sea HP
-            angle_rad = math.radians(angle_deg)
-            vertex_x = center_x + radius * math.cos(angle_rad)
-            vertex_y = center_y + radius * math.sin(angle_rad)
-            positions.append((vertex_x, vertex_y))
-        return positions
-
-    # Dibujar el hexágono base (grisáceo) - Representa el máximo de las estadísticas
-    base_vertices = get_vertex_positions(center_x, center_y, radius)
-    pygame.draw.polygon(screen, base_color, base_vertices, 3)  # Grosor 3 para el borde
-
-    # Dibujar el hexágono de estadísticas (azul)
-    stat_vertices = []
-    for i, (stat, value) in enumerate(stats.items()):
-        ratio = value / max_stat  # Proporción respecto al valor máximo
-        stat_vertices.append((
-            center_x + radius * ratio * math.cos(math.radians(60 * i - 90)),
-            center_y + radius * ratio * math.sin(math.radians(60 * i - 90))
-        ))
-    pygame.draw.polygon(screen, stat_color, stat_vertices, 0)  # Sin borde, relleno
-
-    # Dibujar líneas que separan los segmentos del hexágono
-    for vertex in base_vertices:
-        pygame.draw.line(screen, base_color, (center_x, center_y), vertex, 2)
+    # Gráfico suavizado (hexágono base, estadísticas y radios), renderizado una sola vez por vector de estadísticas
+    chart = stat_chart.get_chart(stat_values, radius, base_color=base_color, stat_color=stat_color)
+    screen.blit(chart, chart.get_rect(center=(center_x, center_y)))
 
     # Renderizar el texto de las estadísticas en los vértices (alejarlo ligeramente)
-    font = pygame.font.Font("../assets/fonts/pokemon.ttf", font_size)
+    font = fonts.get_font(font_size)
     label_offset = 30  # Distancia a la que se moverán las etiquetas de los vértices
     value_offset = 20  # Ajusta esto para controlar la separación entre el nombre y el valor
 
-    for i, (label, vertex) in enumerate(zip(stat_labels, base_vertices)):
-        # Mover el texto de la estadística un poco hacia afuera
-        angle_deg = 60 * i - 90  # Ángulo de cada vértice
-        angle_rad = math.radians(angle_deg)
-
-        # Posicionar el nombre de la estadística
-        label_x = vertex[0] + label_offset * math.cos(angle_rad)
-        label_y = vertex[1] + label_offset * math.sin(angle_rad)
+    base_vertices = stat_chart.get_vertices((center_x, center_y), radius)
+    for i, (label, value, vertex, (cos, sin)) in enumerate(zip(stat_chart.STAT_LABELS, stat_values,
+                                                              base_vertices, stat_chart.UNIT_HEXAGON)):
+        # Posicionar el nombre de la estadística, un poco hacia afuera del vértice
+        label_x = vertex[0] + label_offset * cos
+        label_y = vertex[1] + label_offset * sin
 
         # Dibujar el nombre de la estadística
-        text_surface = font.render(label, True, text_color)
+        text_surface = text_cache.render(font, label, text_color)
         text_rect = text_surface.get_rect(center=(label_x, label_y))
         # Calcular la posición del valor de la estadística
         value_x = label_x
@@ -823,7 +818,7 @@ def draw_stats_tb(screen, rect, font_size, pokemon):
         screen.blit(text_surface, text_rect)
 
         # Dibujar el valor de la estadística debajo del nombre
-        stat_value_surface = font.render(str(stats[label]), True, text_color)
+        stat_value_surface = text_cache.render(font, str(value), text_color)
         stat_value_rect = stat_value_surface.get_rect(center=(value_x, value_y))
         screen.blit(stat_value_surface, stat_value_rect)
 
@@ -863,6 +858,88 @@ def draw_stats_tb(screen, rect, font_size, pokemon):
     )
 
 
+def get_move_rects(position, move_count, box_size=(400, 50), padding=4):
+    """
+    Calcula los rectángulos de las cajas de movimientos de la pestaña de movimientos.
+
+    :param position: La posición en la pantalla donde empieza la primera caja.
+    :param move_count: Número de movimientos.
+    :param box_size: Tamaño (ancho, alto) de cada caja.
+    :param padding: Espacio entre cajas.
+    :return: Una lista de rectángulos, uno por movimiento.
+    """
+    x, y = position
+    box_width, box_height = box_size
+    return [pygame.Rect(x, y + i * (box_height + padding), box_width, box_height) for i in range(move_count)]
+
+
+def draw_move_box(screen, move, box_rect, font_size, selected=False,
+                  box_color=(255, 255, 255), text_color=(0, 0, 0), gray_color=(84, 84, 84), selected_color=(0, 0, 0)):
+    """
+    Dibuja la caja de un movimiento: nombre, tipo y PP.
+
+    :param screen: La superficie en la que dibujar.
+    :param move: Datos del movimiento.
+    :param box_rect: Rectángulo de la caja.
+    :param font_size: Tamaño de la fuente para el texto del movimiento.
+    :param selected: Si el movimiento está seleccionado (caja oscura y texto blanco).
+    :param box_color: Color de fondo de la caja.
+    :param text_color: Color del texto.
+    :param gray_color: Color de la sección gris en la parte derecha de la caja.
+    :param selected_color: Color de fondo para el movimiento seleccionado.
+    """
+    box_height = box_rect.height
+    gray_section_width = 80
+    border_radius = 40
+
+    # Usa el color de selección si el movimiento está seleccionado, de lo contrario, usa el color por defecto.
+    current_box_color = selected_color if selected else box_color
+    current_text_color = (255, 255, 255) if selected else text_color  # Blanco si está seleccionado
+
+    # Dibuja el rectángulo del movimiento con el color correspondiente
+    gray_section_rect = pygame.Rect(box_rect.right - gray_section_width, box_rect.top, gray_section_width,
+                                    box_height)
+
+    # Dibuja los rectángulos
+    pygame.draw.rect(screen, current_box_color, box_rect, border_radius=border_radius)
+    pygame.draw.rect(screen, gray_color, gray_section_rect, border_radius=border_radius)
+
+    # Dibuja el pequeño polígono gris en la sección gris
+    small_polygon_width = gray_section_width * 0.6
+    offset = 20
+    top_left = (
+        gray_section_rect.left + (gray_section_width - small_polygon_width) / 2 - offset, gray_section_rect.top)
+    top_right = (top_left[0] + small_polygon_width - 10, top_left[1])
+    bottom_right = (top_left[0] + small_polygon_width - 10, gray_section_rect.bottom)
+    bottom_left = (top_left[0] - gray_section_width * 0.3 + 4, gray_section_rect.bottom)
+    small_polygon_points = [top_left, top_right, bottom_right, bottom_left]
+    pygame.draw.polygon(screen, gray_color, small_polygon_points)
+
+    # Renderiza el nombre del movimiento
+    font = fonts.get_font(font_size)
+    move_text = move['name']
+    pp_text = "{}/{}".format(move['pp'], move['current_pp'])
+    text_surface = text_cache.render(font, move_text, current_text_color)
+    pp_surface = text_cache.render(font, pp_text, (255, 255, 255))
+
+    text_rect = text_surface.get_rect(topleft=(box_rect.left + 10, box_rect.top
+                                               + (box_height - text_surface.get_height()) // 2))
+
+    pp_rect = pp_surface.get_rect(topright=(box_rect.right - 25, box_rect.top
+                                            + (box_height - pp_surface.get_height()) // 2))
+
+    # Agregar icono del tipo de movimiento
+    icon_manager = icons.get_type_icons(icon_size=(75, 30))
+    type_icon = icon_manager.get_icon(move['type'])  # Asegúrate de que 'type' esté en 'move'
+    if type_icon:
+        icon_rect = pygame.Rect(box_rect.width // 2 + 35, box_rect.top + (box_height - type_icon.get_height()) // 2,
+                                type_icon.get_width(), type_icon.get_height())
+        screen.blit(type_icon, icon_rect)
+
+    screen.blit(text_surface, text_rect)
+    screen.blit(pp_surface, pp_rect)
+
+
 def draw_moves_tab(screen, pokemon, position, font_size, selected_move_index=None,
                    box_color=(255, 255, 255), text_color=(0, 0, 0), gray_color=(84, 84, 84), selected_color=(0, 0, 0)):
     """
@@ -879,66 +956,10 @@ def draw_moves_tab(screen, pokemon, position, font_size, selected_move_index=Non
     :param selected_color: Color de fondo para el movimiento seleccionado.
     :return: Una lista de rectángulos de los movimientos para la detección de clics.
     """
-    box_width, box_height = 400, 50
-    padding = 4
-    gray_section_width = 80
-    border_radius = 40
-    x, y = position
-
-    moves = pokemon.moves
-    move_rects = []
-
-    # Cargar los iconos de tipos de movimientos
-    icon_manager = TypeIcons(icon_size=(75, 30))  # Asegúrate de que el tamaño sea el adecuado
-
-    for i, move in enumerate(moves):
-        # Usa el color de selección si el movimiento está seleccionado, de lo contrario, usa el color por defecto.
-        current_box_color = selected_color if i == selected_move_index else box_color
-        current_text_color = (255, 255, 255) if i == selected_move_index else text_color  # Blanco si está seleccionado
-
-        # Dibuja el rectángulo del movimiento con el color correspondiente
-        box_rect = pygame.Rect(x, y + i * (box_height + padding), box_width, box_height)
-        gray_section_rect = pygame.Rect(box_rect.right - gray_section_width, box_rect.top, gray_section_width,
-                                        box_height)
-
-        # Dibuja los rectángulos
-        pygame.draw.rect(screen, current_box_color, box_rect, border_radius=border_radius)
-        pygame.draw.rect(screen, gray_color, gray_section_rect, border_radius=border_radius)
-
-        # Dibuja el pequeño polígono gris en la sección gris
-        small_polygon_width = gray_section_width * 0.6
-        offset = 20
-        top_left = (
-            gray_section_rect.left + (gray_section_width - small_polygon_width) / 2 - offset, gray_section_rect.top)
-        top_right = (top_left[0] + small_polygon_width - 10, top_left[1])
-        bottom_right = (top_left[0] + small_polygon_width - 10, gray_section_rect.bottom)
-        bottom_left = (top_left[0] - gray_section_width * 0.3 + 4, gray_section_rect.bottom)
-        small_polygon_points = [top_left, top_right, bottom_right, bottom_left]
-        pygame.draw.polygon(screen, gray_color, small_polygon_points)
-
-        # Renderiza el nombre del movimiento
-        font = pygame.font.Font("../assets/fonts/pokemon.ttf", font_size)
-        move_text = move['name']
-        pp_text = "{}/{}".format(move['pp'], move['current_pp'])
-        text_surface = font.render(move_text, True, current_text_color)
-        pp_surface = font.render(pp_text, True, (255, 255, 255))
-
-        text_rect = text_surface.get_rect(topleft=(box_rect.left + 10, box_rect.top
-                                                   + (box_height - text_surface.get_height()) // 2))
-
-        pp_rect = pp_surface.get_rect(topright=(box_rect.right - 25, box_rect.top
-                                                + (box_height - pp_surface.get_height()) // 2))
-
-        # Agregar icono del tipo de movimiento
-        type_icon = icon_manager.get_icon(move['type'])  # Asegúrate de que 'type' esté en 'move'
-        if type_icon:
-            icon_rect = pygame.Rect(box_rect.width // 2 + 35, box_rect.top + (box_height - type_icon.get_height()) // 2,
-                                    type_icon.get_width(), type_icon.get_height())
-            screen.blit(type_icon, icon_rect)
-
-        screen.blit(text_surface, text_rect)
-        screen.blit(pp_surface, pp_rect)
-        move_rects.append(box_rect)
+    move_rects = get_move_rects(position, len(pokemon.moves))
+    for i, (move, box_rect) in enumerate(zip(pokemon.moves, move_rects)):
+        draw_move_box(screen, move, box_rect, font_size, i == selected_move_index,
+                      box_color, text_color, gray_color, selected_color)
 
     return move_rects
 
@@ -978,7 +999,7 @@ def draw_rectangles(screen, start_x, start_y, rect_width, rect_height, padding,
         current_y += rect_height + padding
 
     # Dibujar el texto en los rectángulos
-    font = pygame.font.Font("../assets/fonts/pokemon.ttf", font_size)
+    font = fonts.get_font(font_size)
     if text_values:
         draw_text_in_rect(screen, (start_x, start_y), (rect_height + padding), text_values, font, rect_width)
 
@@ -999,13 +1020,13 @@ def draw_text_in_rect(screen, position, line_height, text_values, font, rect_wid
 
     for j, (label, value) in enumerate(text_values.items()):
         # Preparar el texto para el label (mitad izquierda)
-        label_surface = font.render(f"{label}", True, (0, 0, 0))
+        label_surface = text_cache.render(font, f"{label}", (0, 0, 0))
         label_rect = label_surface.get_rect(
             center=(position[0] + rect_width // 4, position[1] + j * line_height + line_height // 2)
         )
 
         # Preparar el texto para el value (mitad derecha)
-        value_surface = font.render(f"{value}", True, (0, 0, 0))
+        value_surface = text_cache.render(font, f"{value}", (0, 0, 0))
         value_rect = value_surface.get_rect(
             center=(position[0] + 3 * rect_width // 4, position[1] + j * line_height + line_height // 2)
         )
@@ -1022,7 +1043,7 @@ def draw_box(screen, content, start_x, start_y, rect_width, rect_height, font_si
     Dibuja una caja en pantalla con contenido adaptable (descripciones, texto, diccionarios...).
 
     :param screen: La superficie en la que dibujar.
-    :param content: El contenido a mostrar (string o diccionario).
+    :param content: El contenido a mostrar (string, lista de líneas ya partidas o diccionario).
     :param start_x: La posición X inicial para el rectángulo.
     :param start_y: La posición Y inicial para el rectángulo.
     :param rect_width: El ancho del rectángulo.
@@ -1035,15 +1056,15 @@ def draw_box(screen, content, start_x, start_y, rect_width, rect_height, font_si
     pygame.draw.rect(screen, (255, 255, 255), rect)
 
     # Crear la fuente para el texto
-    font = pygame.font.Font("../assets/fonts/pokemon.ttf", font_size)
+    font = fonts.get_font(font_size)
 
     # Calcular el alto de una línea de texto
     line_height = font.size("Tg")[1]
 
-    # Ajustar el contenido si es un texto
-    if isinstance(content, str):
+    # Ajustar el contenido si es un texto (o dibujarlo tal cual si ya viene partido en líneas)
+    if isinstance(content, (str, list, tuple)):
         # Ajustar texto y limitarlo al espacio vertical disponible
-        wrapped_text = wrap_text(content, font, rect_width - 2 * padding)
+        wrapped_text = wrap_text(content, font, rect_width - 2 * padding) if isinstance(content, str) else content
         visible_lines_count = (rect_height - 2 * padding) // line_height
 
         # Obtener solo las líneas que caben en la caja
@@ -1051,7 +1072,7 @@ def draw_box(screen, content, start_x, start_y, rect_width, rect_height, font_si
 
         # Dibujar las líneas visibles, alineadas a la izquierda
         for i, line in enumerate(visible_lines):
-            line_surface = font.render(line, True, (0, 0, 0))
+            line_surface = text_cache.render(font, line, (0, 0, 0))
             text_x = start_x + padding  # margen izquierdo
             text_y = start_y + padding + i * line_height
             screen.blit(line_surface, (text_x, text_y))
@@ -1064,7 +1085,7 @@ def draw_box(screen, content, start_x, start_y, rect_width, rect_height, font_si
 
         for key, value in content.items():
             # Renderiza la clave a la izquierda
-            key_surface = font.render(f"{key}", True, (0, 0, 0))
+            key_surface = text_cache.render(font, f"{key}", (0, 0, 0))
             key_rect = key_surface.get_rect()
             key_rect.centerx = start_x + rect_width // 4
             key_rect.centery = current_y + row_height // 2
@@ -1079,7 +1100,7 @@ def draw_box(screen, content, start_x, start_y, rect_width, rect_height, font_si
                         icon_x += icon.get_width() + 5
 
             else:  # Si el valor es texto, renderizarlo
-                value_surface = font.render(str(value), True, (0, 0, 0))
+                value_surface = text_cache.render(font, str(value), (0, 0, 0))
                 value_rect = value_surface.get_rect()
                 value_x = start_x + rect_width // 2 + 17
                 value_rect.left = value_x
@@ -1099,27 +1120,13 @@ def wrap_text(text, font, max_width):
     :param max_width: El ancho máximo en el que el texto debe caber.
     :return: Una lista de líneas de texto ajustadas.
     """
-    words = text.split(' ')
-    lines = []
-    current_line = ""
-
-    for word in words:
-        test_line = current_line + word + " "
-        if font.size(test_line)[0] <= max_width:
-            current_line = test_line
-        else:
-            lines.append(current_line.strip())
-            current_line = word + " "
-
-    if current_line:
-        lines.append(current_line.strip())
-
-    return lines
+    return list(line_breaking.wrap(text, font, max_width))
 
 
 def start_battle_transition(player, enemy_pokemon):
     """Realiza la animación de transición de combate y luego inicia la batalla."""
-    pokeball_image = utils.load_image("../assets/img/main_menu/icons/pokeball.png")
+    # Sin RLE: se escala y gira en cada fotograma
+    pokeball_image = image_cache.load_image("../assets/img/main_menu/icons/pokeball.png", rle=False)
 
     # Configuración inicial de la animación
     initial_size = 40
@@ -1212,14 +1219,14 @@ def draw_combat_pokemon_status_box(screen, pokemon, position, is_player_pokemon,
     }
 
     # Fuentes de texto
-    fonts = {
-        "large": pygame.font.Font("../assets/fonts/pokemon.ttf", 32),
-        "medium": pygame.font.Font("../assets/fonts/pokemon.ttf", 24),
-        "small": pygame.font.Font("../assets/fonts/pokemon.ttf", 15),
+    text_fonts = {
+        "large": fonts.get_font(32),
+        "medium": fonts.get_font(24),
+        "small": fonts.get_font(15),
     }
 
     # Iconos de género
-    gender_icon = GenderIcons(icon_size=(20, 20))
+    gender_icon = icons.get_gender_icons(icon_size=(20, 20))
 
     # Ajustar la altura de la caja si es el Pokémon del jugador
     if is_player_pokemon:
@@ -1230,13 +1237,13 @@ def draw_combat_pokemon_status_box(screen, pokemon, position, is_player_pokemon,
     pygame.draw.rect(screen, colors["black"], (*position, box_width, box_height), 2)  # Borde negro
 
     # Dibujar nombre, género y nivel del Pokémon
-    draw_text(screen, fonts["large"], pokemon.name, colors["black"], (position[0] + 10, position[1] + 2))
+    draw_text(screen, text_fonts["large"], pokemon.name, colors["black"], (position[0] + 10, position[1] + 2))
     draw_gender_icon(screen, gender_icon, pokemon, position[0] + box_width - 95, position[1] + 8)
-    draw_text(screen, fonts["medium"], f"Lv. {pokemon.level}", colors["black"],
+    draw_text(screen, text_fonts["medium"], f"Lv. {pokemon.level}", colors["black"],
               (position[0] + box_width - 68, position[1] + 5))
 
     # Dibujar la barra de HP
-    draw_hp_bar(screen, pokemon, position, box_width, colors, fonts["small"])
+    draw_hp_bar(screen, pokemon, position, box_width, colors, text_fonts["small"])
 
     # Mostrar la imagen de la Pokéball si el jugador tiene un ejemplar capturado.
     if player and pokeball_image and any(pok == pokemon.name for pok in player.pokedex_captured):
@@ -1244,7 +1251,7 @@ def draw_combat_pokemon_status_box(screen, pokemon, position, is_player_pokemon,
 
     # Dibujar PS actuales y máximos si es el Pokémon del jugador
     if is_player_pokemon:
-        draw_hp_text(screen, pokemon, position, colors["white"], fonts["medium"])
+        draw_hp_text(screen, pokemon, position, colors["white"], text_fonts["medium"])
 
     # Dibujar barra de experiencia si es el Pokémon del jugador
     if is_player_pokemon:
@@ -1253,7 +1260,7 @@ def draw_combat_pokemon_status_box(screen, pokemon, position, is_player_pokemon,
 
 def draw_text(screen, font, text, color, position):
     """Dibuja el texto en la pantalla."""
-    rendered_text = font.render(text, True, color)
+    rendered_text = text_cache.render(font, text, color)
     screen.blit(rendered_text, position)
 
 
@@ -1297,10 +1304,8 @@ def draw_hp_text(screen, pokemon, position, white, font):
     ps_box_position = (position[0] + 100, position[1] + 68)
     pygame.draw.rect(screen, white, (*ps_box_position, ps_box_width, ps_box_height), border_radius=5)
 
-    hp_text = font.render(f"{pokemon.current_hp}/{pokemon.max_stats['hp']}", True, (0, 0, 0))
-    text_rect = hp_text.get_rect(
-        center=(ps_box_position[0] + ps_box_width // 2, ps_box_position[1] + ps_box_height // 2))
-    screen.blit(hp_text, text_rect)
+    glyph_text.draw_text(screen, font, f"{pokemon.current_hp}/{pokemon.max_stats['hp']}", (0, 0, 0),
+                         center=(ps_box_position[0] + ps_box_width // 2, ps_box_position[1] + ps_box_height // 2))
 
 
 def draw_exp_bar(screen, pokemon, position, box_width, box_height, colors):
@@ -1350,7 +1355,7 @@ def draw_action_menu(screen, mouse_pos):
     options = ["FIGHT", "BAG", "POKÉMON", "RUN"]
 
     # Fuente para el texto
-    font = pygame.font.Font(utils.load_font(), 42)
+    font = fonts.get_font(42)
 
     option_rects = []
 
@@ -1384,7 +1389,7 @@ def draw_action_menu(screen, mouse_pos):
         pygame.draw.rect(screen, hover_color, box_rect, border_radius=corner_radius)
 
         # Renderizar el texto y colocarlo en el centro de la caja
-        text_surface = font.render(option, True, (255, 255, 255))
+        text_surface = text_cache.render(font, option, (255, 255, 255))
         text_rect = text_surface.get_rect(center=box_rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -1459,41 +1464,46 @@ def draw_save_load_game_box(screen, title=None, player=None, text=None,
     """
 
     # Fuente
-    font = pygame.font.Font(utils.load_font(), font_size)
+    font = fonts.get_font(font_size)
+
+    # Marco de la caja, compuesto una sola vez por estilo y tamaño
+    style = ("save_load_game_box", tuple(outer_border_color), tuple(inner_border_color), tuple(fill_color),
+             outer_border_thickness, inner_border_thickness, outer_border_radius, inner_border_radius)
+    inset = outer_border_thickness + inner_border_thickness + max(outer_border_radius, inner_border_radius, 5)
 
-    # Crear la superficie para el cuadro flexible
-    box_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+    def render(box_surface):
+        box_width, box_height = box_surface.get_size()
 
-    # Dibujar el borde dorado exterior
-    pygame.draw.rect(box_surface, outer_border_color, (0, 0, box_width, box_height),
-                     border_radius=outer_border_radius, width=outer_border_thickness)
+        # Dibujar el borde dorado exterior
+        pygame.draw.rect(box_surface, outer_border_color, (0, 0, box_width, box_height),
+                         border_radius=outer_border_radius, width=outer_border_thickness)
 
-    # Dibujar el borde interior
-    pygame.draw.rect(box_surface, inner_border_color,
-                     (outer_border_thickness, outer_border_thickness,
-                      box_width - 2 * outer_border_thickness, box_height - 2 * outer_border_thickness),
-                     border_radius=inner_border_radius, width=inner_border_thickness)
+        # Dibujar el borde interior
+        pygame.draw.rect(box_surface, inner_border_color,
+                         (outer_border_thickness, outer_border_thickness,
+                          box_width - 2 * outer_border_thickness, box_height - 2 * outer_border_thickness),
+                         border_radius=inner_border_radius, width=inner_border_thickness)
 
-    # Dibujar el relleno dentro de la caja
-    pygame.draw.rect(box_surface, fill_color,
-                     (outer_border_thickness + inner_border_thickness, outer_border_thickness + inner_border_thickness,
-                      box_width - 2 * (outer_border_thickness + inner_border_thickness),
-                      box_height - 2 * (outer_border_thickness + inner_border_thickness)),
-                     border_radius=5)
+        # Dibujar el relleno dentro de la caja
+        pygame.draw.rect(box_surface, fill_color,
+                         (outer_border_thickness + inner_border_thickness, outer_border_thickness + inner_border_thickness,
+                          box_width - 2 * (outer_border_thickness + inner_border_thickness),
+                          box_height - 2 * (outer_border_thickness + inner_border_thickness)),
+                         border_radius=5)
 
     # Blit de la caja en la pantalla principal
-    screen.blit(box_surface, box_position)
+    ui_chrome.draw_chrome(screen, box_position, style, (box_width, box_height), render, inset)
 
     # Si hay un título, lo dibujamos centrado en la parte superior, con el color y tamaño adecuado
     if title:
-        title_surface = font.render(title, True, title_color)
+        title_surface = text_cache.render(font, title, title_color)
         title_x = box_position[0] + (box_width - title_surface.get_width()) // 2
         title_y = box_position[1] + 20
         screen.blit(title_surface, (title_x, title_y))
 
     # Si hay texto (sin jugador), dibujamos el texto centrado en la caja
     if text:
-        text_surface = font.render(text, True, text_color)
+        text_surface = text_cache.render(font, text, text_color)
         text_x = box_position[0] + (box_width - text_surface.get_width()) // 2
         text_y = box_position[1] + (box_height - text_surface.get_height()) // 2
         screen.blit(text_surface, (text_x, text_y))
@@ -1506,114 +1516,204 @@ def draw_save_load_game_box(screen, title=None, player=None, text=None,
         right_x = box_position[0] + box_width - 30
 
         # 1. Información del jugador
-        player_text = font.render("PLAYER:", True, text_color)
+        player_text = text_cache.render(font, "PLAYER:", text_color)
         screen.blit(player_text, (left_x, start_y))
 
-        player_name_text = font.render(player.name, True, text_color)
+        player_name_text = text_cache.render(font, player.name, text_color)
         screen.blit(player_name_text, (right_x - player_name_text.get_width(), start_y))
 
         # 2. Pokedex Info
-        pokedex_text = font.render("POKÉDEX:", True, text_color)
+        pokedex_text = text_cache.render(font, "POKÉDEX:", text_color)
         screen.blit(pokedex_text, (left_x, start_y + line_spacing))
 
         pokedex_seen = player.get_pokedex_counts()[0]
-        pokedex_count_text = font.render(f"{pokedex_seen}", True, text_color)
+        pokedex_count_text = text_cache.render(font, f"{pokedex_seen}", text_color)
         screen.blit(pokedex_count_text, (right_x - pokedex_count_text.get_width(), start_y + line_spacing))
 
         # 3. Pokémon Team
-        pokemon_team_text = font.render("POKÉMON TEAM:", True, text_color)
+        pokemon_team_text = text_cache.render(font, "POKÉMON TEAM:", text_color)
         screen.blit(pokemon_team_text, (left_x, start_y + 2 * line_spacing))
 
         # Dibujar los Pokémon del equipo
         pokemon_image_y = start_y + 3 * line_spacing
         pokemon_image_x = left_x
-        pokemon_image_size = (40, 40)
+        pokemon_image_size = 40
 
         for pokemon in player.pokemons:
             if pokemon.image:
-                resized_image = pygame.transform.scale(pokemon.image, pokemon_image_size)
+                resized_image = sprite_variants.get_pokemon_sprite(pokemon.name, pokemon_image_size)
                 screen.blit(resized_image, (pokemon_image_x, pokemon_image_y))
                 pokemon_image_x += 60
 
         # 4. Tiempo de juego
-        time_text = font.render("TIME:", True, text_color)
-        playtime_text = font.render(player.get_playtime_formatted(), True, text_color)
+        time_text = text_cache.render(font, "TIME:", text_color)
         screen.blit(time_text, (left_x, pokemon_image_y + 40))
-        screen.blit(playtime_text, (right_x - playtime_text.get_width(), pokemon_image_y + 40))
-
+        glyph_text.draw_text(screen, font, player.get_playtime_formatted(), text_color,
+                             topright=(right_x, pokemon_image_y + 40))
 
-def draw_pokedex_pokemon_slots(screen, player, pokemon_list, region_name,
-                               region_offsets, current_scroll_position, selected_index, font):
-    """Dibuja los slots de los Pokémon en la Pokédex"""
 
-    box_width, box_height = 330, 50  # Tamaño de las cajas
-    padding = 10  # Espacio entre las cajas
-    border_radius = 25  # Radio de las esquinas redondeadas
-    x_position = 460  # Posición en X donde se dibuja el primer slot
-    y_position = 80  # Posición en Y donde se empieza a dibujar
-
-    num_pokemon_visible = 8
-
-    for i, pokemon in enumerate(pokemon_list[current_scroll_position:current_scroll_position + num_pokemon_visible]):
-        # Determinar la posición Y para cada slot
-        y_pos = y_position + i * (box_height + padding)
+class PokedexList:
+    def __init__(self, font, position=(460, 80), row_size=(330, 50), padding=10, num_visible=8, overscan=1,
+                 scroll_speed=600, max_rows=96):
+        """
+        Lista virtualizada de Pokémon de la Pokédex.
+
+        Cada fila se renderiza una sola vez en su propia superficie, guardada por (especie, número
+        regional, avistado, capturado, seleccionado): en cada fotograma solo se dibujan las filas
+        visibles con un blit cada una, y una fila solo se vuelve a renderizar cuando cambia su estado.
+        El desplazamiento es por píxeles: la lista se desliza hasta la fila pedida en lugar de saltar,
+        y se preparan `overscan` filas de más por arriba y por abajo para que estén listas al entrar.
+
+        :param font: Fuente de los números y los nombres.
+        :param position: Posición (x, y) de la primera fila.
+        :param row_size: Tamaño (ancho, alto) de cada fila.
+        :param padding: Espacio entre filas.
+        :param num_visible: Número de filas visibles.
+        :param overscan: Filas que se preparan por encima y por debajo de las visibles.
+        :param scroll_speed: Velocidad del desplazamiento, en píxeles por segundo.
+        :param max_rows: Número máximo de filas renderizadas que se guardan.
+        """
+        self.font = font
+        self.x, self.y = position
+        self.row_width, self.row_height = row_size
+        self.row_pitch = self.row_height + padding
+        self.num_visible = num_visible
+        self.overscan = overscan
+        self.scroll_speed = scroll_speed
+        self.max_rows = max_rows
+        self.viewport = pygame.Rect(self.x, self.y, self.row_width, num_visible * self.row_pitch - padding)
+
+        self.rows = OrderedDict()  # clave de la fila -> superficie
+        self.scroll_y = 0.0  # Desplazamiento actual, en píxeles
+        self.target_y = 0  # Desplazamiento al que se está llegando
+        self.last_update_time = None
+
+    def render_row(self, name, region_id, seen, captured, selected):
+        """Renderiza una fila de la lista en una superficie con transparencia."""
+        box_width, box_height = self.row_width, self.row_height
+        row = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+
+        def paste(surface, position):
+            # Los textos e iconos compartidos están acelerados: se copian sin RLE para mezclarlos bien
+            row.blit(image_cache.unaccelerated(surface), position)
 
         # Si el slot es el seleccionado, dibujar la caja
-        if current_scroll_position + i == selected_index:
-            box_color = (0, 0, 0)
+        if selected:
             text_color = (255, 255, 255)
             pokeball_type = "pokeball_white"
-
-            box_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-            pygame.draw.rect(box_surface, box_color, box_surface.get_rect(), border_radius=border_radius)
-            screen.blit(box_surface, (x_position, y_pos))  # Dibujar la caja seleccionada
+            pygame.draw.rect(row, (0, 0, 0), row.get_rect(), border_radius=box_height // 2)
         else:
-            # Si no está seleccionada, no dibujamos la caja
             text_color = (0, 0, 0)
             pokeball_type = "pokeball_black"
 
-        # Calcular el id regional
-        offset = region_offsets.get(region_name, 0)
-        region_id = pokemon['id'] - offset
-
         # Dibujar el id regional de Pokédex
-        pokedex_number = font.render(f"Nº. {region_id}", True, text_color)
-        screen.blit(pokedex_number, (x_position + 80, y_pos + (box_height - pokedex_number.get_height()) // 2))
-
-        # Comprobar si el pokemon ha sido avistado
-        pokemon_seen = pokemon['name'].capitalize() in player.pokedex_seen
+        pokedex_number = text_cache.render(self.font, f"Nº. {region_id}", text_color)
+        paste(pokedex_number, (80, (box_height - pokedex_number.get_height()) // 2))
 
-        # Si el Pokémon ha sido avistado, cargar su imagen y mostrar sus datos
-        if pokemon_seen:
-            # Cargar y dibujar la imagen del Pokémon
-            img_path = f"../assets/pokemon_images/{pokemon['name'].lower()}.png"
-            if os.path.exists(img_path):
-                image = pygame.image.load(img_path)
-                image = pygame.transform.scale(image, (48, 48))
-                screen.blit(image, (x_position + 10, y_pos + (box_height - 48) // 2))
+        if seen:
+            # Imagen, nombre y Poké Ball (de color si está capturado)
+            image = sprite_variants.get_pokemon_sprite(name, 48)
+            if image:
+                paste(image, (10, (box_height - 48) // 2))
 
-            # Dibujar el nombre del Pokémon
-            name_text = font.render(pokemon['name'].capitalize(), True, text_color)
-            screen.blit(name_text, (x_position + 160, y_pos + (box_height - name_text.get_height()) // 2))
+            name_text = text_cache.render(self.font, name.capitalize(), text_color)
+            paste(name_text, (160, (box_height - name_text.get_height()) // 2))
 
-            # Verificar si el jugador tiene el Pokémon capturado
-            if pokemon['name'].capitalize() in player.pokedex_captured:
+            if captured:
                 pokeball_image_path = "../assets/img/main_menu/icons/pokeball.png"
             else:
                 pokeball_image_path = f"../assets/img/pokemon_menu/{pokeball_type}.png"
-            # Dibuja la Poké Ball a la derecha del slot
-            pokeball_image = pygame.image.load(pokeball_image_path)
-            pokeball_image = pygame.transform.scale(pokeball_image, (28, 28))
-            screen.blit(pokeball_image, (x_position + box_width - 40, y_pos + (box_height - 32) // 2))
+            paste(icons.get_icon(pokeball_image_path, (28, 28)), (box_width - 40, (box_height - 32) // 2))
+        else:
+            # Si el Pokémon no ha sido avistado, mostrar su silueta y "???" en lugar del nombre
+            silhouette = sprite_variants.get_pokemon_silhouette(name, 48)
+            if silhouette:
+                paste(silhouette, (10, (box_height - 48) // 2))
+
+            name_text = text_cache.render(self.font, "???", text_color)
+            paste(name_text, (160, (box_height - name_text.get_height()) // 2))
+
+            pokeball_null = text_cache.render(self.font, "--", text_color)
+            paste(pokeball_null, (box_width - 36, (box_height - 32) // 2))
+
+        if pygame.display.get_surface() is not None:
+            row = image_cache.accelerate(row.convert_alpha())
+        return row
+
+    def get_row(self, player, pokemon, region_id, selected):
+        """Devuelve la superficie de una fila, renderizándola solo si su estado ha cambiado."""
+        capitalized_name = pokemon['name'].capitalize()
+        seen = capitalized_name in player.pokedex_seen
+        captured = seen and capitalized_name in player.pokedex_captured
+        key = (pokemon['name'], region_id, seen, captured, selected)
+
+        row = self.rows.get(key)
+        if row is not None:
+            self.rows.move_to_end(key)
+            return row
+
+        row = self.render_row(*key)
+        self.rows[key] = row
+        while len(self.rows) > self.max_rows:
+            self.rows.popitem(last=False)
+        return row
+
+    def scroll_to(self, scroll_position, animate=True):
+        """
+        Fija la primera fila visible.
+
+        :param scroll_position: Índice de la fila que debe quedar arriba.
+        :param animate: Si la lista se desliza hasta ella o salta directamente (al cambiar de región).
+        """
+        self.target_y = scroll_position * self.row_pitch
+        if not animate:
+            self.scroll_y = float(self.target_y)
+
+    def update(self):
+        """Avanza el desplazamiento hacia la fila pedida según el tiempo transcurrido."""
+        current_time = pygame.time.get_ticks()
+        elapsed = 0 if self.last_update_time is None else current_time - self.last_update_time
+        self.last_update_time = current_time
+
+        step = self.scroll_speed * elapsed / 1000
+        distance = self.target_y - self.scroll_y
+        if abs(distance) <= step:
+            self.scroll_y = float(self.target_y)
         else:
-            # Si el Pokémon no ha sido avistado, mostrar "???" en lugar del nombre
-            name_text = font.render("???", True, text_color)
-            screen.blit(name_text, (x_position + 160, y_pos + (box_height - name_text.get_height()) // 2))
+            self.scroll_y += step if distance > 0 else -step
 
-            pokeball_null = font.render("--", True, text_color)
-            screen.blit(pokeball_null, (x_position + box_width - 36, y_pos + (box_height - 32) // 2))
+    def get_scroll_position(self):
+        """Devuelve la posición de desplazamiento actual en filas (con decimales mientras se desliza)."""
+        return self.scroll_y / self.row_pitch
 
-    # Mostrar en grande el Pokémon seleccionado
+    def draw(self, screen, player, pokemon_list, region_offset, selected_index):
+        """
+        Dibuja las filas visibles de la lista.
+
+        :param screen: Superficie en la que dibujar.
+        :param player: Jugador, para saber qué Pokémon ha avistado y capturado.
+        :param pokemon_list: Pokémon de la región actual.
+        :param region_offset: Diferencia entre el número nacional y el regional.
+        :param selected_index: Índice del Pokémon seleccionado.
+        """
+        first_row = int(self.scroll_y // self.row_pitch)
+        start = max(0, first_row - self.overscan)
+        end = min(len(pokemon_list), first_row + self.num_visible + 1 + self.overscan)
+
+        previous_clip = screen.get_clip()
+        screen.set_clip(self.viewport.clip(previous_clip))
+        for index in range(start, end):
+            pokemon = pokemon_list[index]
+            row = self.get_row(player, pokemon, pokemon['id'] - region_offset, index == selected_index)
+            y_pos = self.y + index * self.row_pitch - self.scroll_y
+            # Las filas de overscan quedan preparadas pero fuera de la vista
+            if self.viewport.top - self.row_height < y_pos < self.viewport.bottom:
+                screen.blit(row, (self.x, round(y_pos)))
+        screen.set_clip(previous_clip)
+
+
+def draw_pokedex_selected_pokemon(screen, player, pokemon_list, selected_index):
+    """Muestra en grande el Pokémon seleccionado en la Pokédex (o su silueta si no ha sido avistado)."""
     if pokemon_list and 0 <= selected_index < len(pokemon_list):
         selected_pokemon = pokemon_list[selected_index]
 
@@ -1623,18 +1723,15 @@ def draw_pokedex_pokemon_slots(screen, player, pokemon_list, region_name,
         # Comprobar si el Pokémon seleccionado ha sido avistado
         if selected_pokemon['name'].capitalize() in player.pokedex_seen:
             # Cargar y dibujar la imagen en tamaño grande
-            big_img_path = f"../assets/pokemon_images/{selected_pokemon['name'].lower()}.png"
-            if os.path.exists(big_img_path):
-                big_image = pygame.image.load(big_img_path)
-                big_image = pygame.transform.scale(big_image, (350, 350))
+            big_image = sprite_variants.get_pokemon_sprite(selected_pokemon['name'], 350)
+            if big_image:
+                image_cache.check_blit(big_image, "Pokédex (imagen grande)")
                 screen.blit(big_image, (big_image_x, big_image_y))
         else:
-            # Si no ha sido avistado, mostrar una imagen de interrogación
-            mystery_image_path = "../assets/img/main_menu/icons/question_mark.png"
-            if os.path.exists(mystery_image_path):
-                mystery_image = pygame.image.load(mystery_image_path)
-                mystery_image = pygame.transform.scale(mystery_image, (350, 350))
-                screen.blit(mystery_image, (big_image_x, big_image_y))
+            # Si no ha sido avistado, mostrar su silueta
+            silhouette = sprite_variants.get_pokemon_silhouette(selected_pokemon['name'], 350)
+            if silhouette:
+                screen.blit(silhouette, (big_image_x, big_image_y))
 
 
 def draw_scroll_bar(screen, pokemon_list, current_scroll_position, num_pokemon_visible):
@@ -1698,14 +1795,14 @@ def draw_pokedex_badges(screen, player, x, y, font, region_range,
     pygame.draw.rect(screen, box_color, rect, border_radius=8)
 
     # Cargar y dibujar la imagen si existe
-    if img_path and os.path.exists(img_path):
-        badge_image = pygame.image.load(img_path)
-        badge_image = pygame.transform.scale(badge_image, (rect.height - 10, rect.height - 10))
+    badge_image = icons.get_icon(img_path, (rect.height - 10, rect.height - 10)) if img_path else None
+    if badge_image:
+        image_cache.check_blit(badge_image, "insignias del Pokédex")
         screen.blit(badge_image, (rect.x + 10, rect.y + 5))
 
     # Dibujar el número de Pokémon capturados/avistados
-    count_text = font.render(f"{pokemon_count}", True, text_color)
-    screen.blit(count_text, (rect.x + rect.width - 32, rect.y + rect.height // 2 - count_text.get_height() // 2))
+    glyph_text.draw_text(screen, font, pokemon_count, text_color,
+                         midleft=(rect.x + rect.width - 32, rect.y + rect.height // 2))
 
 
 def draw_gender_icon(screen, gender_icons, pokemon, icon_x, icon_y):
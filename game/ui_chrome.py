@@ -0,0 +1,119 @@
+from collections import OrderedDict
+
+import pygame
+
+import game.image_cache as image_cache
+
+MAX_CHROME_ENTRIES = 64  # Cajas ya compuestas (estilo y tamaño) que se guardan como máximo
+
+
+def nine_slice(source, inset, size):
+    """
+    Compone una caja de cualquier tamaño a partir de otra dibujada al tamaño mínimo (2 * inset + 1).
+
+    Las esquinas (de inset x inset píxeles) se copian tal cual, los bordes se estiran a partir de la
+    columna o fila central y el interior se rellena con el color del píxel central.
+
+    :param source: Caja dibujada a tamaño (2 * inset + 1, 2 * inset + 1), con transparencia.
+    :param inset: Tamaño de las esquinas: todo lo que no es uniforme (bordes y radios) debe caber en él.
+    :param size: Tamaño (ancho, alto) de la caja resultante.
+    :return: Una superficie nueva con transparencia.
+    """
+    width, height = size
+    far = inset + 1  # Inicio de la esquina derecha/inferior dentro de la caja mínima
+    inner_width, inner_height = width - 2 * inset, height - 2 * inset
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+
+    # Con BLEND_RGBA_MAX sobre el fondo transparente se copian los píxeles tal cual, sin mezclar
+    blits = [
+        (source, (0, 0), (0, 0, inset, inset)),
+        (source, (width - inset, 0), (far, 0, inset, inset)),
+        (source, (0, height - inset), (0, far, inset, inset)),
+        (source, (width - inset, height - inset), (far, far, inset, inset)),
+        (pygame.transform.scale(source.subsurface((inset, 0, 1, inset)), (inner_width, inset)), (inset, 0), None),
+        (pygame.transform.scale(source.subsurface((inset, far, 1, inset)), (inner_width, inset)),
+         (inset, height - inset), None),
+        (pygame.transform.scale(source.subsurface((0, inset, inset, 1)), (inset, inner_height)), (0, inset), None),
+        (pygame.transform.scale(source.subsurface((far, inset, inset, 1)), (inset, inner_height)),
+         (width - inset, inset), None),
+    ]
+    for image, position, area in blits:
+        surface.blit(image, position, area, special_flags=pygame.BLEND_RGBA_MAX)
+    surface.fill(source.get_at((inset, inset)), (inset, inset, inner_width, inner_height))
+    return surface
+
+
+class ChromeCache:
+    def __init__(self, max_entries=MAX_CHROME_ENTRIES):
+        """
+        Caché de los marcos de la interfaz (cajas de diálogo, de guardar/cargar, recuadros con sombra).
+
+        Cada estilo (colores, grosores y radios) se dibuja una sola vez al tamaño mínimo y cada tamaño
+        que se pide se compone a partir de él con nine_slice, sin volver a rellenar rectángulos
+        redondeados. Las cajas compuestas se guardan por (estilo, tamaño), así que en cada fotograma
+        dibujar una caja es un único blit.
+
+        :param max_entries: Número máximo de cajas compuestas que se guardan.
+        """
+        self.max_entries = max_entries
+        self.sources = {}  # estilo -> caja dibujada al tamaño mínimo
+        self.entries = OrderedDict()  # (estilo, tamaño) -> superficie
+
+    def get(self, style, size, render, inset=None):
+        """
+        Devuelve una caja del estilo y el tamaño indicados, componiéndola solo la primera vez.
+
+        :param style: Clave del estilo (tupla con el tipo de caja y sus colores, grosores y radios).
+        :param size: Tamaño (ancho, alto) de la caja.
+        :param render: Función que dibuja la caja sobre la superficie transparente que recibe, a su tamaño.
+        :param inset: Tamaño de las esquinas para componer la caja con nine_slice, o None para dibujarla
+                      siempre a su tamaño (también se hace si la caja es más pequeña que el tamaño mínimo).
+        :return: La superficie de la caja (compartida, no debe modificarse).
+        """
+        size = (int(size[0]), int(size[1]))
+        key = (style, size)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            return surface
+
+        if inset is not None and min(size) >= 2 * inset + 1:
+            source = self.sources.get(style)
+            if source is None:
+                source = pygame.Surface((2 * inset + 1, 2 * inset + 1), pygame.SRCALPHA)
+                render(source)
+                self.sources[style] = source
+            surface = nine_slice(source, inset, size)
+        else:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            render(surface)
+
+        if pygame.display.get_surface() is not None:
+            surface = image_cache.accelerate(surface.convert_alpha())
+        self.entries[key] = surface
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Descarta todas las cajas, por ejemplo al cambiar de tema."""
+        self.sources.clear()
+        self.entries.clear()
+
+
+# Marcos compartidos por toda la interfaz
+cache = ChromeCache()
+
+
+def draw_chrome(screen, position, style, size, render, inset=None):
+    """
+    Dibuja una caja de la interfaz desde la caché compartida.
+
+    :param screen: Superficie en la que se dibuja.
+    :param position: Posición (x, y) de la esquina superior izquierda de la caja.
+    :param style: Clave del estilo de la caja.
+    :param size: Tamaño (ancho, alto) de la caja.
+    :param render: Función que dibuja la caja sobre la superficie que recibe (solo se llama al crearla).
+    :param inset: Tamaño de las esquinas para componer la caja con nine_slice.
+    """
+    screen.blit(cache.get(style, size, render, inset), position)
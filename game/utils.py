@@ -1,16 +1,19 @@
-import json
-
 import pygame
 import os
 import ui
+import game.fonts as fonts
+import game.text_cache as text_cache
+import game.image_cache as image_cache
+import game.pokemon as pok
+import game.sprite_variants as sprite_variants
 
 
-def load_image(image_path, scale=None):
-    """Cargar y escalar una imagen desde la ruta especificada."""
-    image = pygame.image.load(os.path.abspath(image_path)).convert_alpha()
-    if scale:
-        image = pygame.transform.scale(image, scale)
-    return image
+def load_image(image_path, scale=None, convert="alpha"):
+    """
+    Cargar y escalar una imagen desde la ruta especificada (a través de la caché de imágenes).
+    Los fondos sin transparencia deben cargarse con convert="opaque".
+    """
+    return image_cache.load_image(image_path, scale or None, convert)
 
 
 def load_all_pokemon_images(directory="../assets/pokemon_images", scale=None):
@@ -26,16 +29,13 @@ def load_all_pokemon_images(directory="../assets/pokemon_images", scale=None):
 
 def load_font(font_path="../assets/fonts/pokemon.ttf"):
     """Cargar una fuente desde el archivo especificado, sin especificar el tamaño."""
-    font_path = os.path.abspath(font_path)
-    if not os.path.exists(font_path):
-        raise FileNotFoundError(f"No se encontró la fuente en la ruta: {font_path}")
-    return font_path
+    return fonts.registry.resolve_path(font_path)  # Se comprueba una sola vez por ruta
 
 
 def render_text(font_path, size, text, color):
     """Renderizar texto con el tamaño y color especificado."""
-    font = pygame.font.Font(font_path, size)
-    return font.render(text, True, color)
+    font = fonts.get_font(size, font_path)
+    return text_cache.render(font, text, color)
 
 
 """
@@ -46,11 +46,10 @@ Funciones para pintar y rendear las imágenes de los pokemon en combate.
 def draw_pokemon(screen, pokemon, position, scale_factor):
     """Dibuja un Pokémon en la pantalla en la posición dada con el tamaño escalado."""
     if pokemon.image:
-        scaled_image = pygame.transform.scale(pokemon.image, (
-            int(pokemon.image.get_width() * scale_factor),
-            int(pokemon.image.get_height() * scale_factor)
-        ))
-        screen.blit(scaled_image, position)
+        scaled_image = sprite_variants.get_pokemon_sprite(pokemon.name, int(pokemon.image.get_width() * scale_factor))
+        if scaled_image:
+            image_cache.check_blit(scaled_image, "draw_pokemon")
+            screen.blit(scaled_image, position)
 
 
 def resize_image_to_width(image, new_width):
@@ -81,11 +80,11 @@ def draw_confirmation_box(screen, selected_option, position=(0, 0), box_width=14
     ui.draw_dialog_box(screen, position=(confirmation_box_x, confirmation_box_y),
                        box_width=box_width, box_height=box_height)
 
-    confirmation_font = pygame.font.Font(load_font(), 35)
+    confirmation_font = fonts.get_font(35)
 
     # Texto "Yes" y "No"
-    yes_text = confirmation_font.render("Yes", True, (0, 0, 0))
-    no_text = confirmation_font.render("No", True, (0, 0, 0))
+    yes_text = text_cache.render(confirmation_font, "Yes", (0, 0, 0))
+    no_text = text_cache.render(confirmation_font, "No", (0, 0, 0))
 
     # Posiciones del texto "Yes" y "No"
     yes_text_pos = (confirmation_box_x + 50, confirmation_box_y + 25)
@@ -95,7 +94,7 @@ def draw_confirmation_box(screen, selected_option, position=(0, 0), box_width=14
     screen.blit(no_text, no_text_pos)
 
     # Dibuja la flecha ">" al lado de la opción seleccionada
-    arrow_text = confirmation_font.render(">", True, (0, 0, 0))
+    arrow_text = text_cache.render(confirmation_font, ">", (0, 0, 0))
     if selected_option == 'yes':
         screen.blit(arrow_text, (yes_text_pos[0] - 20, yes_text_pos[1]))
     else:
@@ -117,9 +116,8 @@ def handle_load_save_events(cls, event):
 
 
 def load_pokemon_data(file_path='data/poke_data.json'):
-    """Cargar la lista de datos de Pokémon desde un archivo JSON."""
-    with open(file_path, 'r') as file:
-        return json.load(file)
+    """Cargar la lista de datos de Pokémon desde un archivo JSON (se lee una sola vez, la lista es compartida)."""
+    return pok.load_pokemon_data(file_path)
 
 
 def play_pokemon_sound(sound_object):
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Las pruebas no abren ventana ni reproducen sonido
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Algunos módulos del juego se importan entre sí sin el prefijo "game." (como al ejecutar main.py desde game/)
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "game"))
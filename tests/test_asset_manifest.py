@@ -0,0 +1,51 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import game.asset_manifest as asset_manifest
+
+
+class AssetManifestTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        for relative_path in ("img/fondo.png", "sprites/40/abra.png"):
+            path = os.path.join(self.directory, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as file:
+                file.write(b"png")
+        asset_manifest.build_manifest(self.directory)
+        self.manifest = asset_manifest.AssetManifest(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_missing_source_asset_is_fatal(self):
+        os.remove(os.path.join(self.directory, "img/fondo.png"))
+
+        missing, problems = self.manifest.verify(check_sizes=False)
+
+        self.assertEqual(missing, ["img/fondo.png"])
+        self.assertEqual(problems, [])
+
+    def test_missing_generated_asset_only_warns_and_falls_back(self):
+        os.remove(os.path.join(self.directory, "sprites/40/abra.png"))
+
+        missing, problems = self.manifest.verify(check_sizes=False)
+
+        self.assertEqual(missing, [])
+        self.assertEqual(len(problems), 1)
+        self.assertFalse(self.manifest.exists(os.path.join(self.directory, "sprites/40/abra.png")))
+
+    def test_startup_check_ignores_sizes(self):
+        with open(os.path.join(self.directory, "img/fondo.png"), 'ab') as file:
+            file.write(b"!")
+
+        self.assertEqual(self.manifest.verify(check_sizes=False), ([], []))
+        missing, problems = self.manifest.verify()
+        self.assertEqual(missing, [])
+        self.assertEqual(len(problems), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
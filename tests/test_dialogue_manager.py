@@ -0,0 +1,152 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import game.dialogue_manager as dialogue_manager
+
+FONT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "fonts",
+                         "pokemon.ttf")
+
+
+def old_replace_placeholders(text, placeholders):
+    """Sustitución original por texto, con la que deben coincidir las plantillas."""
+    for key, value in placeholders.items():
+        text = text.replace(f"{{{key}}}", value)
+    return text
+
+
+class DialogueTemplateTest(unittest.TestCase):
+    def test_render_replaces_fields(self):
+        template = dialogue_manager.DialogueTemplate("¡{player_pokemon} usó {movement}!")
+        self.assertEqual(template.fields, {"player_pokemon", "movement"})
+        self.assertEqual(template.render({"player_pokemon": "Pikachu", "movement": "Impactrueno"}),
+                         "¡Pikachu usó Impactrueno!")
+
+    def test_missing_field_is_kept(self):
+        template = dialogue_manager.DialogueTemplate("¡{player_pokemon} usó {movement}!")
+        self.assertEqual(template.render({"player_pokemon": "Pikachu"}), "¡Pikachu usó {movement}!")
+        self.assertEqual(template.render({}), "¡{player_pokemon} usó {movement}!")
+
+    def test_other_braces_are_preserved(self):
+        placeholders = {"name": "Ash", "level": "5"}
+        for text in ("Llaves dobles: {{name}} y {{", "Formato {level:>3} y conversión {name!r}",
+                     "Llave suelta { o } y {} vacías", "Sin placeholders", "{name}{level}", "{{{name}}}"):
+            with self.subTest(text=text):
+                template = dialogue_manager.DialogueTemplate(text)
+                self.assertEqual(template.render(placeholders), old_replace_placeholders(text, placeholders))
+
+    def test_literal_braces_are_detected(self):
+        self.assertFalse(dialogue_manager.DialogueTemplate("Hola, {name}.").has_literal_braces)
+        self.assertTrue(dialogue_manager.DialogueTemplate("Nivel {level:>3}").has_literal_braces)
+        self.assertTrue(dialogue_manager.DialogueTemplate("{{escapado}}").has_literal_braces)
+        self.assertEqual(dialogue_manager.DialogueTemplate("Nivel {level:>3}").fields, set())
+
+
+class DialogueCatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def make_catalog(self, dialogues):
+        path = os.path.join(self.directory, "dialogues.json")
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(dialogues, file)
+        return dialogue_manager.DialogueCatalog(path)
+
+    def test_valid_placeholders(self):
+        catalog = self.make_catalog({"combat": {"player_attack": ["¡{player_pokemon} usó {movement}!"]}})
+        self.assertEqual(catalog.problems, [])
+        self.assertEqual(catalog.contexts, {"combat"})
+        template, = catalog.templates[("combat", "player_attack")]
+        self.assertEqual(template.fields, {"player_pokemon", "movement"})
+
+    def test_unknown_placeholder_is_reported(self):
+        catalog = self.make_catalog({"combat": {"actions": ["¿Qué hará {player_pokemon}?", "Turno {turn}."]},
+                                     "unknown": {"greeting": ["Hola, {player_name}."]}})
+        self.assertEqual(sorted(catalog.problems), [
+            "Placeholder '{player_name}' sin valor en el diálogo 'unknown.greeting'.",
+            "Placeholder '{turn}' sin valor en el diálogo 'combat.actions'.",
+        ])
+
+    def test_literal_braces_are_reported(self):
+        catalog = self.make_catalog({"combat": {"actions": ["¿Qué hará {player_pokemon:>10}?"]}})
+        self.assertEqual(len(catalog.problems), 1)
+        self.assertIn("combat.actions", catalog.problems[0])
+
+    def test_manager_renders_and_reports_missing_keys(self):
+        path = os.path.join(self.directory, "dialogues.json")
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({"combat": {"encounter": ["¡Un {enemy_pokemon} salvaje!", "¡Adelante, {player_pokemon}!"]}},
+                      file)
+        manager = dialogue_manager.DialogueManager(path)
+        manager.set_context("combat")
+        self.assertEqual(manager.get_dialogue_with_placeholders("encounter", {"enemy_pokemon": "Rattata"}),
+                         ["¡Un Rattata salvaje!", "¡Adelante, {player_pokemon}!"])
+        with self.assertRaises(ValueError):
+            manager.get_dialogue_with_placeholders("missing", {})
+        with self.assertRaises(ValueError):
+            manager.get_dialogue("missing")
+        with self.assertRaises(ValueError):
+            manager.set_context("missing")
+
+    def test_game_dialogues_are_valid(self):
+        self.assertEqual(dialogue_manager.DialogueCatalog().problems, [])
+
+
+class TextDisplayManagerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        cls.font = pygame.font.Font(FONT_PATH, 30)
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def reveal(self, text, visible_chars=None):
+        manager = dialogue_manager.TextDisplayManager(self.font)
+        manager.set_text(text)
+        if visible_chars is None:
+            manager.complete_text()
+        else:
+            manager.displayed_text = text[:visible_chars]
+        screen = pygame.Surface((800, 600))
+        screen.fill((255, 255, 255))
+        manager.draw(screen, box_position=(0, 0), box_width=400, text_color=(0, 0, 0))
+        return manager, screen
+
+    @staticmethod
+    def revealed_text(manager, text):
+        """Reconstruye el texto ya dibujado a partir del inicio de cada línea y sus caracteres dibujados."""
+        return " ".join(text[line_start:line_start + rendered_chars]
+                        for _, _, _, rendered_chars, line_start in manager.lines).split()
+
+    def test_complete_text_reveals_every_glyph(self):
+        texts = ("A" * 80 + " hola que tal", "Pikachu usó  Impactrueno.   Es muy eficaz, el enemigo se debilitó.")
+        for text in texts:
+            with self.subTest(text=text):
+                manager, screen = self.reveal(text)
+                self.assertGreater(len(manager.lines), 1)
+                for _, _, glyphs, rendered_chars, _ in manager.lines:
+                    self.assertEqual(rendered_chars, len(glyphs))
+                self.assertEqual(self.revealed_text(manager, text), text.split())
+                # Se ha dibujado texto (negro) en la pantalla
+                self.assertLess(pygame.surfarray.array3d(screen).min(), 128)
+
+    def test_partial_reveal_follows_the_text(self):
+        text = "Pikachu usó  Impactrueno.   Es muy eficaz, el enemigo se debilitó."
+        visible_chars = text.index("enemigo") + 3
+        manager, _ = self.reveal(text, visible_chars)
+        self.assertEqual(self.revealed_text(manager, text), text[:visible_chars].split())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+import pygame
+
+import game.image_cache as image_cache
+
+
+class ImageCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        cls.directory = tempfile.mkdtemp()
+        cls.paths = []
+        for i in range(4):
+            image = pygame.Surface((16, 16), pygame.SRCALPHA)
+            image.fill((10 * i, 20, 30, 128))
+            path = os.path.join(cls.directory, f"image_{i}.png")
+            pygame.image.save(image, path)
+            cls.paths.append(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+        pygame.display.quit()
+
+    def test_budget_evicts_least_recently_used(self):
+        entry_bytes = image_cache.surface_bytes(pygame.Surface((16, 16), pygame.SRCALPHA).convert_alpha())
+        cache = image_cache.ImageCache(budget_bytes=3 * entry_bytes)
+        for path in self.paths[:3]:
+            cache.get(path)
+        cache.get(self.paths[0])  # La primera pasa a ser la más reciente
+        cache.get(self.paths[3])
+
+        self.assertEqual(cache.bytes_used, 3 * entry_bytes)
+        self.assertLessEqual(cache.bytes_used, cache.budget_bytes)
+        self.assertEqual(cache.evictions, 1)
+        cached_paths = [key[0] for key in cache.entries]
+        self.assertNotIn(self.paths[1], cached_paths)
+        self.assertEqual(cached_paths, [self.paths[2], self.paths[0], self.paths[3]])
+
+        cache.set_budget(entry_bytes)
+        self.assertEqual(len(cache.entries), 1)
+        self.assertEqual(cache.evictions, 3)
+        self.assertEqual(cache.bytes_used, entry_bytes)
+
+    def test_newest_entry_is_kept_over_budget(self):
+        cache = image_cache.ImageCache(budget_bytes=1)
+        surface = cache.get(self.paths[0])
+        self.assertEqual(len(cache.entries), 1)
+        self.assertIs(cache.get(self.paths[0]), surface)
+
+    def test_counters(self):
+        cache = image_cache.ImageCache()
+        first = cache.get(self.paths[0])
+        self.assertIs(cache.get(self.paths[0]), first)
+        self.assertIs(cache.get(os.path.relpath(self.paths[0])), first)  # Misma ruta, otra forma de escribirla
+        cache.get_or_create(("derived", 1), lambda: pygame.Surface((4, 4)))
+        cache.get_or_create(("derived", 1), lambda: self.fail("No debe volver a crearse"))
+
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (3, 2, 0))
+        self.assertAlmostEqual(stats["hit_rate"], 3 / 5)
+        self.assertEqual(stats["entries"], 2)
+
+        cache.clear()
+        self.assertEqual((cache.get_stats()["entries"], cache.bytes_used), (0, 0))
+        self.assertEqual(cache.get_stats()["hits"], 3)  # Los contadores se mantienen
+
+    def test_keys_do_not_collide(self):
+        cache = image_cache.ImageCache()
+        path = self.paths[0]
+        original = cache.get(path)
+        scaled = cache.get(path, (32, 8))
+        opaque = cache.get(path, convert="opaque")
+        plain = cache.get(path, rle=False)
+
+        self.assertEqual(len({id(original), id(scaled), id(opaque), id(plain)}), 4)
+        self.assertEqual(scaled.get_size(), (32, 8))
+        self.assertEqual(original.get_size(), (16, 16))
+        self.assertTrue(original.get_flags() & pygame.SRCALPHA)
+        self.assertFalse(opaque.get_flags() & pygame.SRCALPHA)
+        self.assertTrue(original.get_flags() & pygame.RLEACCELOK)
+        self.assertFalse(plain.get_flags() & pygame.RLEACCELOK)
+
+        # El tamaño se normaliza a enteros y RLE solo cuenta para las imágenes con transparencia
+        self.assertIs(cache.get(path, (32.0, 8.0)), scaled)
+        self.assertIs(cache.get(path, convert="opaque", rle=False), opaque)
+        self.assertEqual(len(cache.entries), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import random
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import game.line_breaking as line_breaking
+
+FONT_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "fonts")
+WORDS = ("¡Un Pokémon salvaje apareció! Pikachu usó Impactrueno. Es muy eficaz, el enemigo se debilitó. "
+         "Bienvenido al mundo de los entrenadores Pokémon, ¿estás listo? AVATAR_DEMASIADO_LARGO_PARA_UNA_LÍNEA").split()
+
+
+def old_wrap_text(text, font, max_width):
+    """Algoritmo original de ui.wrap_text (mide la línea entera con font.size por cada palabra)."""
+    words = text.split(' ')
+    lines = []
+    current_line = ""
+
+    for word in words:
+        test_line = current_line + word + " "
+        if font.size(test_line)[0] <= max_width:
+            current_line = test_line
+        else:
+            lines.append(current_line.strip())
+            current_line = word + " "
+
+    if current_line:
+        lines.append(current_line.strip())
+
+    return lines
+
+
+class LineBreakerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+        cls.fonts = [pygame.font.Font(os.path.join(FONT_DIRECTORY, filename), size)
+                     for filename in ("pokemon.ttf", "PressStart2P-Regular.ttf", "open_sans.ttf")
+                     for size in (16, 20, 30)]
+
+    def test_wrap_matches_old_wrap_text(self):
+        generator = random.Random(14)
+        texts = ["", "Hola", "  dos  espacios ", WORDS[-1] + " al principio"]
+        texts += [" ".join(generator.choice(WORDS) for _ in range(generator.randint(1, 40))) for _ in range(150)]
+        for font in self.fonts:
+            breaker = line_breaking.LineBreaker()
+            for text in texts:
+                max_width = generator.randint(40, 780)
+                with self.subTest(font=font, text=text, max_width=max_width):
+                    self.assertEqual(breaker.wrap(text, font, max_width), tuple(old_wrap_text(text, font, max_width)))
+
+    def test_layouts_are_bounded(self):
+        breaker = line_breaking.LineBreaker(max_layouts=8)
+        font = self.fonts[0]
+        for i in range(50):
+            breaker.wrap(f"Texto número {i} para partir", font, 100)
+        self.assertEqual(len(breaker.layouts), 8)
+        # Se conservan los usados más recientemente
+        self.assertIn(("Texto número 49 para partir", font, 100), breaker.layouts)
+        self.assertNotIn(("Texto número 0 para partir", font, 100), breaker.layouts)
+
+    def test_repeated_layout_is_a_cache_hit(self):
+        breaker = line_breaking.LineBreaker()
+        font = self.fonts[0]
+        text = "Pikachu usó Impactrueno. Es muy eficaz."
+        first = breaker.wrap(text, font, 120)
+
+        calls = []
+        original_break_lines = breaker.break_lines
+        breaker.break_lines = lambda *args: calls.append(args) or original_break_lines(*args)
+        self.assertIs(breaker.wrap(text, font, 120), first)
+        self.assertEqual(calls, [])
+
+        breaker.wrap(text, font, 200)  # Otro ancho es otra maquetación
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
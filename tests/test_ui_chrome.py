@@ -0,0 +1,177 @@
+import os
+import unittest
+
+import numpy
+import pygame
+
+import game.ui as ui
+import game.ui_chrome as ui_chrome
+
+GAME_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "game")
+
+
+# Dibujo original de cada caja (antes de ChromeCache), con el que se compara la caja compuesta
+
+
+def old_draw_combat_background(screen, position=(0, 449), width=800, height=151, color=(232, 210, 218), border=3):
+    x, y = position
+    pygame.draw.rect(screen, color, (x, y, width, height))
+    pygame.draw.line(screen, (80, 80, 80), (x, y), (x + width, y), border)
+    pygame.draw.line(screen, (0, 0, 0), (x, y), (x + width, y), 2)
+
+
+def old_draw_dialog_box(screen, position=(4, 456), box_width=792, box_height=140,
+                        outer_border_color=(218, 165, 32), inner_border_color=(75, 77, 76), border_thickness=2,
+                        inner_border_thickness=4, side_inner_border_thickness=15, top_bottom_inner_border_thickness=5,
+                        fill_color=(255, 255, 255), outer_border_radius=5, inner_border_radius=3, inner_fill_radius=2):
+    x, y = position
+    dialog_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+    pygame.draw.rect(dialog_surface, (0, 0, 0), (0, 0, box_width, box_height),
+                     border_radius=outer_border_radius, width=border_thickness)
+    pygame.draw.rect(dialog_surface, outer_border_color,
+                     (border_thickness, border_thickness, box_width - 2 * border_thickness,
+                      box_height - 2 * border_thickness),
+                     border_radius=outer_border_radius, width=inner_border_thickness)
+    inner_rect = pygame.Rect(
+        border_thickness + inner_border_thickness,
+        border_thickness + top_bottom_inner_border_thickness,
+        box_width - 2 * (border_thickness + inner_border_thickness),
+        box_height - 2 * top_bottom_inner_border_thickness - 4
+    )
+    pygame.draw.rect(dialog_surface, inner_border_color, inner_rect,
+                     border_radius=inner_border_radius, width=side_inner_border_thickness)
+    fill_rect = pygame.Rect(
+        border_thickness + inner_border_thickness + side_inner_border_thickness,
+        border_thickness + top_bottom_inner_border_thickness + inner_border_thickness,
+        box_width - 2 * (border_thickness + inner_border_thickness + side_inner_border_thickness),
+        box_height - 2 * (top_bottom_inner_border_thickness + inner_border_thickness + 3)
+    )
+    pygame.draw.rect(dialog_surface, fill_color, fill_rect, border_radius=inner_fill_radius)
+    screen.blit(dialog_surface, (x, y))
+
+
+def old_draw_save_load_game_box(screen, box_position=(30, 30), box_width=400, box_height=300,
+                                outer_border_color=(218, 165, 32), inner_border_color=(75, 77, 76),
+                                fill_color=(255, 255, 255), outer_border_thickness=4, inner_border_thickness=4,
+                                outer_border_radius=8, inner_border_radius=5):
+    box_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+    pygame.draw.rect(box_surface, outer_border_color, (0, 0, box_width, box_height),
+                     border_radius=outer_border_radius, width=outer_border_thickness)
+    pygame.draw.rect(box_surface, inner_border_color,
+                     (outer_border_thickness, outer_border_thickness,
+                      box_width - 2 * outer_border_thickness, box_height - 2 * outer_border_thickness),
+                     border_radius=inner_border_radius, width=inner_border_thickness)
+    pygame.draw.rect(box_surface, fill_color,
+                     (outer_border_thickness + inner_border_thickness, outer_border_thickness + inner_border_thickness,
+                      box_width - 2 * (outer_border_thickness + inner_border_thickness),
+                      box_height - 2 * (outer_border_thickness + inner_border_thickness)),
+                     border_radius=5)
+    screen.blit(box_surface, box_position)
+
+
+def old_draw_rect_with_shadow(screen, rect, shadow_offset=4, shadow_color=(100, 100, 100, 30),
+                              border_color=(255, 255, 255)):
+    x, y, width, height = rect
+    shadow_surface = pygame.Surface((width + shadow_offset, height + shadow_offset), pygame.SRCALPHA)
+    pygame.draw.rect(shadow_surface, shadow_color, (shadow_offset, shadow_offset, width, height))
+    screen.blit(shadow_surface, (x, y))
+    pygame.draw.rect(screen, border_color, rect)
+
+
+class ChromeRegressionTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.previous_directory = os.getcwd()
+        os.chdir(GAME_DIRECTORY)  # Las rutas de los recursos son relativas a game/
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+        os.chdir(cls.previous_directory)
+
+    def setUp(self):
+        ui_chrome.cache.clear()
+
+    @staticmethod
+    def make_background():
+        """Pantalla con un fondo que no es uniforme, para que cuenten también los píxeles transparentes."""
+        screen = pygame.Surface((800, 600)).convert()
+        pixels = pygame.surfarray.pixels3d(screen)
+        pixels[..., 0] = numpy.arange(800)[:, None] % 256
+        pixels[..., 1] = numpy.arange(600)[None, :] % 256
+        pixels[..., 2] = 90
+        del pixels
+        return screen
+
+    def assert_same_drawing(self, draw_new, draw_old, tolerance=0):
+        expected = self.make_background()
+        draw_old(expected)
+        # Dos veces: la primera compone la caja y la segunda la toma de la caché
+        for _ in range(2):
+            actual = self.make_background()
+            draw_new(actual)
+            difference = numpy.abs(pygame.surfarray.array3d(actual).astype(int)
+                                   - pygame.surfarray.array3d(expected).astype(int))
+            self.assertLessEqual(difference.max(), tolerance)
+
+    def test_dialog_box(self):
+        for position, size in (((4, 456), (792, 140)), ((50, 40), (300, 90)), ((10, 10), (61, 61)),
+                               ((100, 100), (40, 30))):
+            with self.subTest(size=size):
+                self.assert_same_drawing(
+                    lambda screen: ui.draw_dialog_box(screen, position, *size),
+                    lambda screen: old_draw_dialog_box(screen, position, *size))
+        self.assert_same_drawing(
+            lambda screen: ui.draw_dialog_box(screen, (20, 20), 500, 200, outer_border_color=(200, 0, 0),
+                                              fill_color=(240, 240, 255), outer_border_radius=10),
+            lambda screen: old_draw_dialog_box(screen, (20, 20), 500, 200, outer_border_color=(200, 0, 0),
+                                               fill_color=(240, 240, 255), outer_border_radius=10))
+
+    def test_save_load_game_box(self):
+        for position, size in (((30, 30), (400, 300)), ((200, 150), (400, 200)), ((0, 0), (20, 20))):
+            with self.subTest(size=size):
+                self.assert_same_drawing(
+                    lambda screen: ui.draw_save_load_game_box(screen, box_position=position,
+                                                              box_width=size[0], box_height=size[1]),
+                    lambda screen: old_draw_save_load_game_box(screen, position, *size))
+
+    def test_rect_with_shadow(self):
+        # La sombra translúcida puede diferir en 1 por canal por el redondeo del blit acelerado
+        for rect in ((100, 100, 200, 80), (10, 300, 33, 17), (500, 20, 5, 5)):
+            with self.subTest(rect=rect):
+                self.assert_same_drawing(lambda screen: ui.draw_rect_with_shadow(screen, rect),
+                                         lambda screen: old_draw_rect_with_shadow(screen, rect), tolerance=1)
+
+    def test_combat_background(self):
+        for position, width, height in (((0, 449), 800, 151), ((100, 200), 300, 100)):
+            with self.subTest(width=width, height=height):
+                self.assert_same_drawing(
+                    lambda screen: ui.draw_combat_background(screen, position, width, height),
+                    lambda screen: old_draw_combat_background(screen, position, width, height))
+
+
+class NineSliceTest(unittest.TestCase):
+    def test_matches_direct_drawing(self):
+        def render(surface):
+            width, height = surface.get_size()
+            pygame.draw.rect(surface, (218, 165, 32), (0, 0, width, height), border_radius=6, width=3)
+            pygame.draw.rect(surface, (250, 250, 250), (3, 3, width - 6, height - 6), border_radius=4)
+
+        inset = 9
+        source = pygame.Surface((2 * inset + 1, 2 * inset + 1), pygame.SRCALPHA)
+        render(source)
+        for size in ((19, 19), (20, 57), (300, 40)):
+            with self.subTest(size=size):
+                expected = pygame.Surface(size, pygame.SRCALPHA)
+                render(expected)
+                composed = ui_chrome.nine_slice(source, inset, size)
+                self.assertTrue(numpy.array_equal(pygame.surfarray.array3d(composed),
+                                                  pygame.surfarray.array3d(expected)))
+                self.assertTrue(numpy.array_equal(pygame.surfarray.array_alpha(composed),
+                                                  pygame.surfarray.array_alpha(expected)))
+
+
+if __name__ == '__main__':
+    unittest.main()